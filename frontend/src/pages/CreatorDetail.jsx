@@ -23,33 +23,36 @@ import {
 } from '@mui/material';
 import EditIcon from '@mui/icons-material/Edit';
 
-import { getCreator, getMilestonesByCreator, updateJourneyStatus } from '../services/api';
+import { getCreatorBundle, updateJourneyStatus } from '../services/api';
 import {
   getHealthScoreColor,
   getJourneyStatusColor,
   formatDate,
+  formatRelativeTime,
 } from '../utils/helpers';
 import { JOURNEY_STATUS } from '../utils/constants';
 
 export default function CreatorDetail() {
   const { id } = useParams();
-  const [creator, setCreator] = useState(null);
-  const [milestones, setMilestones] = useState([]);
+  const [bundle, setBundle] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [newStatus, setNewStatus] = useState('');
 
   useEffect(() => {
-    loadCreator();
-    loadMilestones();
+    loadBundle();
   }, [id]);
 
-  const loadCreator = async () => {
+  // Profile, milestones, activity and deliverables in one request
+  const showBundle = (data) => {
+    setBundle(data);
+    setNewStatus(data.creator.journey_status);
+  };
+
+  const loadBundle = async () => {
     try {
       setLoading(true);
-      const data = await getCreator(id);
-      setCreator(data);
-      setNewStatus(data.journey_status);
+      showBundle(await getCreatorBundle(id));
       setError(null);
     } catch (err) {
       setError('Failed to load creator');
@@ -59,19 +62,10 @@ export default function CreatorDetail() {
     }
   };
 
-  const loadMilestones = async () => {
-    try {
-      const data = await getMilestonesByCreator(id);
-      setMilestones(data);
-    } catch (err) {
-      console.error('Failed to load milestones:', err);
-    }
-  };
-
   const handleStatusChange = async () => {
     try {
-      await updateJourneyStatus(id, newStatus);
-      await loadCreator();
+      // The response is the refreshed bundle; no follow-up fetch
+      showBundle(await updateJourneyStatus(id, newStatus, '', { bundle: true }));
       alert('Status updated successfully!');
     } catch (err) {
       alert('Failed to update status');
@@ -87,10 +81,12 @@ export default function CreatorDetail() {
     );
   }
 
-  if (error || !creator) {
+  if (error || !bundle) {
     return <Alert severity="error">{error || 'Creator not found'}</Alert>;
   }
 
+  const { creator, milestones, recent_audit_logs: auditLogs, latest_deliverables: deliverables } = bundle;
+
   return (
     <Box>
       {/* Header */}
@@ -233,6 +229,52 @@ export default function CreatorDetail() {
             )}
           </Paper>
         </Grid>
+
+        {/* Latest Deliverables (Epic 3) */}
+        <Grid item xs={12} md={6}>
+          <Paper sx={{ p: 3 }}>
+            <Typography variant="h6" gutterBottom>
+              Latest Deliverables
+            </Typography>
+            {deliverables.length > 0 ? (
+              deliverables.map((deliverable) => (
+                <Box key={deliverable.id} display="flex" justifyContent="space-between" py={1}>
+                  <div>
+                    <Typography fontWeight="bold">{deliverable.deliverable_type}</Typography>
+                    <Typography variant="caption">{formatDate(deliverable.created_at)}</Typography>
+                  </div>
+                  <Chip label={deliverable.status_display} size="small" />
+                </Box>
+              ))
+            ) : (
+              <Typography color="text.secondary">No deliverables yet</Typography>
+            )}
+          </Paper>
+        </Grid>
+
+        {/* Recent Activity (Epic 0.4) */}
+        <Grid item xs={12} md={6}>
+          <Paper sx={{ p: 3 }}>
+            <Typography variant="h6" gutterBottom>
+              Recent Activity
+            </Typography>
+            {auditLogs.length > 0 ? (
+              auditLogs.map((log) => (
+                <Box key={log.id} py={1}>
+                  <Typography variant="body2">
+                    <strong>{log.action_type}</strong> by {log.user_email}
+                  </Typography>
+                  <Typography variant="caption" color="text.secondary">
+                    {formatRelativeTime(log.timestamp)}
+                    {log.notes && ` • ${log.notes}`}
+                  </Typography>
+                </Box>
+              ))
+            ) : (
+              <Typography color="text.secondary">No activity yet</Typography>
+            )}
+          </Paper>
+        </Grid>
       </Grid>
     </Box>
   );
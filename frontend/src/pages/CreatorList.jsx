@@ -2,9 +2,14 @@
  * Creator List Page
  * Story 1.1: View creator brand list
  * Story 2.4: Filter/sort List by Health Score
+ *
+ * Search, filters and ordering are applied by the API (CreatorViewSet).
+ * Pages are fetched with cursor pagination as the list is scrolled, and only
+ * the rows in view are rendered, so the page stays fast with any number of
+ * creators.
  */
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef, useCallback } from 'react';
 import { Link as RouterLink } from 'react-router-dom';
 import {
   Box,
@@ -17,8 +22,8 @@ import {
   TableHead,
   TableRow,
   Chip,
-  CircularProgress,
   Alert,
+  LinearProgress,
   TextField,
   Select,
   MenuItem,
@@ -28,78 +33,116 @@ import {
 } from '@mui/material';
 import AddIcon from '@mui/icons-material/Add';
 
-import { getCreators } from '../services/api';
+import { getCreators, isCanceled } from '../services/api';
 import {
   getHealthScoreColor,
   getJourneyStatusColor,
   formatRelativeTime,
-  filterCreatorsBySearch,
 } from '../utils/helpers';
+import { useDebouncedValue } from '../utils/hooks';
 import { JOURNEY_STATUS, HEALTH_SCORE } from '../utils/constants';
 
+const PAGE_SIZE = 50;
+const SEARCH_DELAY_MS = 300;
+
+// Virtualization: every row has the same height
+const ROW_HEIGHT = 57;
+const VIEWPORT_HEIGHT = 640;
+const OVERSCAN_ROWS = 10;
+// Fetch the next page when this close to the end of the loaded rows
+const LOAD_MORE_ROWS = 15;
+
+const SORT_OPTIONS = [
+  { value: '-last_status_change', label: 'Recently updated' },
+  { value: 'brand_name', label: 'Brand name' },
+  { value: 'creator_name', label: 'Creator name' },
+  { value: 'health_score', label: 'Health score' },
+  { value: '-created_at', label: 'Newest' },
+];
+
+const COLUMNS = [
+  { label: 'Brand Name', width: '22%' },
+  { label: 'Creator', width: '18%' },
+  { label: 'Niche', width: '15%' },
+  { label: 'Journey Status', width: '17%' },
+  { label: 'Health Score', width: '12%' },
+  { label: 'Last Updated', width: '16%' },
+];
+
+// The `cursor` query parameter of a `next` page URL
+const cursorFrom = (url) => (url ? new URL(url, window.location.origin).searchParams.get('cursor') : null);
+
 export default function CreatorList() {
   const [creators, setCreators] = useState([]);
-  const [filteredCreators, setFilteredCreators] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState('');
   const [healthFilter, setHealthFilter] = useState('');
+  const [ordering, setOrdering] = useState(SORT_OPTIONS[0].value);
+  const [scrollTop, setScrollTop] = useState(0);
 
-  useEffect(() => {
-    loadCreators();
-  }, []);
+  const search = useDebouncedValue(searchTerm.trim(), SEARCH_DELAY_MS);
+  const containerRef = useRef(null);
+  const requestRef = useRef(null);
 
-  useEffect(() => {
-    applyFilters();
-  }, [creators, searchTerm, statusFilter, healthFilter]);
-
-  const loadCreators = async () => {
-    try {
-      setLoading(true);
-      const data = await getCreators();
-      setCreators(data.results || data);
-      setError(null);
-    } catch (err) {
-      setError('Failed to load creators');
-      console.error(err);
-    } finally {
-      setLoading(false);
-    }
-  };
+  const loadPage = useCallback(
+    async (cursor) => {
+      // Only the latest request may update the list
+      requestRef.current?.abort();
+      const controller = new AbortController();
+      requestRef.current = controller;
 
-  const applyFilters = () => {
-    let filtered = [...creators];
+      const params = { pagination: 'cursor', page_size: PAGE_SIZE, ordering };
+      if (search) params.search = search;
+      if (statusFilter) params.journey_status = statusFilter;
+      if (healthFilter) params.health_score = healthFilter;
+      if (cursor) params.cursor = cursor;
 
-    // Search filter
-    if (searchTerm) {
-      filtered = filterCreatorsBySearch(filtered, searchTerm);
-    }
+      try {
+        setLoading(true);
+        const data = await getCreators(params, { signal: controller.signal });
+        setCreators((previous) => (cursor ? [...previous, ...data.results] : data.results));
+        setNextCursor(cursorFrom(data.next));
+        setError(null);
+      } catch (err) {
+        if (isCanceled(err)) return;
+        setError('Failed to load creators');
+        console.error(err);
+      }
+      if (requestRef.current === controller) {
+        requestRef.current = null;
+        setLoading(false);
+      }
+    },
+    [search, statusFilter, healthFilter, ordering]
+  );
 
-    // Status filter
-    if (statusFilter) {
-      filtered = filtered.filter((c) => c.journey_status === statusFilter);
-    }
+  // Start over from the first page whenever the query changes
+  useEffect(() => {
+    setCreators([]);
+    setNextCursor(null);
+    setScrollTop(0);
+    if (containerRef.current) containerRef.current.scrollTop = 0;
+    loadPage(null);
+  }, [loadPage]);
 
-    // Health filter (Story 2.4)
-    if (healthFilter) {
-      filtered = filtered.filter((c) => c.health_score === healthFilter);
-    }
+  // Cancel any request still in flight when leaving the page
+  useEffect(() => () => requestRef.current?.abort(), []);
 
-    setFilteredCreators(filtered);
+  const handleScroll = (event) => {
+    const { scrollTop: top, scrollHeight, clientHeight } = event.currentTarget;
+    setScrollTop(top);
+    if (nextCursor && !loading && scrollHeight - top - clientHeight < LOAD_MORE_ROWS * ROW_HEIGHT) {
+      loadPage(nextCursor);
+    }
   };
 
-  if (loading) {
-    return (
-      <Box display="flex" justifyContent="center" alignItems="center" minHeight="400px">
-        <CircularProgress />
-      </Box>
-    );
-  }
-
-  if (error) {
-    return <Alert severity="error">{error}</Alert>;
-  }
+  // Rows in view (plus overscan); spacer rows stand in for the rest
+  const firstRow = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN_ROWS);
+  const lastRow = Math.min(creators.length, Math.ceil((scrollTop + VIEWPORT_HEIGHT) / ROW_HEIGHT) + OVERSCAN_ROWS);
+  const visibleCreators = creators.slice(firstRow, lastRow);
 
   return (
     <Box>
@@ -109,7 +152,8 @@ export default function CreatorList() {
             Creators & Brands
           </Typography>
           <Typography variant="body2" color="text.secondary">
-            {filteredCreators.length} of {creators.length} creators
+            {creators.length}
+            {nextCursor ? '+' : ''} creators
           </Typography>
         </div>
         <Button variant="contained" startIcon={<AddIcon />}>
@@ -161,66 +205,102 @@ export default function CreatorList() {
               ))}
             </Select>
           </FormControl>
+
+          <FormControl size="small" sx={{ minWidth: 200 }}>
+            <InputLabel>Sort By</InputLabel>
+            <Select value={ordering} label="Sort By" onChange={(e) => setOrdering(e.target.value)}>
+              {SORT_OPTIONS.map((option) => (
+                <MenuItem key={option.value} value={option.value}>
+                  {option.label}
+                </MenuItem>
+              ))}
+            </Select>
+          </FormControl>
         </Box>
       </Paper>
 
+      {error && (
+        <Alert severity="error" sx={{ mb: 2 }}>
+          {error}
+        </Alert>
+      )}
+
       {/* Table (Story 1.1) */}
-      <TableContainer component={Paper}>
-        <Table>
-          <TableHead>
-            <TableRow>
-              <TableCell>Brand Name</TableCell>
-              <TableCell>Creator</TableCell>
-              <TableCell>Niche</TableCell>
-              <TableCell>Journey Status</TableCell>
-              <TableCell>Health Score</TableCell>
-              <TableCell>Last Updated</TableCell>
-            </TableRow>
-          </TableHead>
-          <TableBody>
-            {filteredCreators.map((creator) => (
-              <TableRow
-                key={creator.id}
-                component={RouterLink}
-                to={`/creators/${creator.id}`}
-                sx={{
-                  textDecoration: 'none',
-                  '&:hover': { backgroundColor: '#f5f5f5', cursor: 'pointer' },
-                }}
-              >
-                <TableCell>
-                  <Typography fontWeight="bold">{creator.brand_name}</Typography>
-                </TableCell>
-                <TableCell>{creator.creator_name}</TableCell>
-                <TableCell>{creator.brand_niche}</TableCell>
-                <TableCell>
-                  <Chip
-                    label={creator.journey_status_display}
-                    size="small"
-                    sx={{
-                      backgroundColor: getJourneyStatusColor(creator.journey_status),
-                      color: 'white',
-                    }}
-                  />
-                </TableCell>
-                <TableCell>
-                  <Chip
-                    label={creator.health_score}
-                    size="small"
-                    sx={{
-                      backgroundColor: getHealthScoreColor(creator.health_score),
-                      color: 'white',
-                    }}
-                  />
-                </TableCell>
-                <TableCell>{formatRelativeTime(creator.last_status_change)}</TableCell>
+      <Paper>
+        <Box height={4}>{loading && <LinearProgress />}</Box>
+        <TableContainer ref={containerRef} onScroll={handleScroll} sx={{ maxHeight: VIEWPORT_HEIGHT }}>
+          <Table stickyHeader sx={{ tableLayout: 'fixed' }}>
+            <TableHead>
+              <TableRow>
+                {COLUMNS.map((column) => (
+                  <TableCell key={column.label} sx={{ width: column.width }}>
+                    {column.label}
+                  </TableCell>
+                ))}
               </TableRow>
-            ))}
-          </TableBody>
-        </Table>
-      </TableContainer>
+            </TableHead>
+            <TableBody>
+              {firstRow > 0 && (
+                <TableRow sx={{ height: firstRow * ROW_HEIGHT }}>
+                  <TableCell colSpan={COLUMNS.length} sx={{ p: 0, border: 0 }} />
+                </TableRow>
+              )}
+              {visibleCreators.map((creator) => (
+                <TableRow
+                  key={creator.id}
+                  component={RouterLink}
+                  to={`/creators/${creator.id}`}
+                  sx={{
+                    height: ROW_HEIGHT,
+                    textDecoration: 'none',
+                    '&:hover': { backgroundColor: '#f5f5f5', cursor: 'pointer' },
+                  }}
+                >
+                  <TableCell sx={{ whiteSpace: 'nowrap', overflow: 'hidden', textOverflow: 'ellipsis' }}>
+                    <Typography fontWeight="bold" noWrap>
+                      {creator.brand_name}
+                    </Typography>
+                  </TableCell>
+                  <TableCell sx={{ whiteSpace: 'nowrap', overflow: 'hidden', textOverflow: 'ellipsis' }}>
+                    {creator.creator_name}
+                  </TableCell>
+                  <TableCell sx={{ whiteSpace: 'nowrap', overflow: 'hidden', textOverflow: 'ellipsis' }}>
+                    {creator.brand_niche}
+                  </TableCell>
+                  <TableCell>
+                    <Chip
+                      label={creator.journey_status_display}
+                      size="small"
+                      sx={{
+                        backgroundColor: getJourneyStatusColor(creator.journey_status),
+                        color: 'white',
+                      }}
+                    />
+                  </TableCell>
+                  <TableCell>
+                    <Chip
+                      label={creator.health_score}
+                      size="small"
+                      sx={{
+                        backgroundColor: getHealthScoreColor(creator.health_score),
+                        color: 'white',
+                      }}
+                    />
+                  </TableCell>
+                  <TableCell>{formatRelativeTime(creator.last_status_change)}</TableCell>
+                </TableRow>
+              ))}
+              {lastRow < creators.length && (
+                <TableRow sx={{ height: (creators.length - lastRow) * ROW_HEIGHT }}>
+                  <TableCell colSpan={COLUMNS.length} sx={{ p: 0, border: 0 }} />
+                </TableRow>
+              )}
+            </TableBody>
+          </Table>
+        </TableContainer>
+      </Paper>
 
-      {filteredCreators.length === 0 && (
+      {!loading && !error && creators.length === 0 && (
         <Box textAlign="center" py={4}>
           <Typography color="text.secondary">No creators found</Typography>
         </Box>
@@ -26,8 +26,18 @@ import TrendingUpIcon from '@mui/icons-material/TrendingUp';
 import WarningIcon from '@mui/icons-material/Warning';
 import PeopleIcon from '@mui/icons-material/People';
 import CheckCircleIcon from '@mui/icons-material/CheckCircle';
+import {
+  ResponsiveContainer,
+  LineChart,
+  Line,
+  XAxis,
+  YAxis,
+  CartesianGrid,
+  Tooltip,
+  Legend,
+} from 'recharts';
 
-import { getDashboardStats } from '../services/api';
+import { getDashboardStats, getHealthTrend } from '../services/api';
 import {
   getHealthScoreColor,
   getJourneyStatusLabel,
@@ -39,11 +49,22 @@ export default function Dashboard() {
   const [stats, setStats] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const [trend, setTrend] = useState(null);
 
   useEffect(() => {
     loadDashboardStats();
+    loadHealthTrend();
   }, []);
 
+  // Story 2.3: Health trend chart, loaded separately so it never delays the stats
+  const loadHealthTrend = async () => {
+    try {
+      setTrend(await getHealthTrend({ days: 30 }));
+    } catch (err) {
+      console.error('Health trend error:', err);
+    }
+  };
+
   const loadDashboardStats = async () => {
     try {
       setLoading(true);
@@ -170,6 +191,37 @@ export default function Dashboard() {
         </Grid>
       </Grid>
 
+      {/* Health Trend (Story 2.3) */}
+      {trend && trend.points.length > 0 && (
+        <Grid container spacing={3} sx={{ mt: 2 }}>
+          <Grid item xs={12}>
+            <Paper elevation={3} sx={{ p: 3 }}>
+              <Typography variant="h6" gutterBottom fontWeight="bold">
+                Health Trend (30 days)
+              </Typography>
+              <ResponsiveContainer width="100%" height={280}>
+                <LineChart data={trend.points}>
+                  <CartesianGrid strokeDasharray="3 3" />
+                  <XAxis dataKey="date" />
+                  <YAxis allowDecimals={false} />
+                  <Tooltip />
+                  <Legend />
+                  {trend.series.map((score) => (
+                    <Line
+                      key={score}
+                      type="monotone"
+                      dataKey={score}
+                      stroke={getHealthScoreColor(score)}
+                      dot={false}
+                    />
+                  ))}
+                </LineChart>
+              </ResponsiveContainer>
+            </Paper>
+          </Grid>
+        </Grid>
+      )}
+
       {/* Journey Status Distribution */}
       <Grid container spacing={3} sx={{ mt: 2 }}>
         <Grid item xs={12} md={6}>
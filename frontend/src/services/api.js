@@ -58,10 +58,21 @@ export const getStatusSummary = async () => {
   return response.data;
 };
 
+// Story 2.3: Daily counts for the health trend chart
+// Params: days (1-365), group_by ('health' or 'status'), active_only
+export const getHealthTrend = async (params = {}) => {
+  const response = await api.get('/dashboard/health_trend/', { params });
+  return response.data;
+};
+
 // ===== CREATORS API (Epic 1 & 2) =====
 
-export const getCreators = async (params = {}) => {
-  const response = await api.get('/creators/', { params });
+// True for requests cancelled through an AbortController signal
+export const isCanceled = (error) => axios.isCancel(error);
+
+// Pass { signal } from an AbortController to cancel a superseded request
+export const getCreators = async (params = {}, { signal } = {}) => {
+  const response = await api.get('/creators/', { params, signal });
   return response.data;
 };
 
@@ -85,12 +96,21 @@ export const deleteCreator = async (id) => {
   return response.data;
 };
 
+// Story 1.2: Creator profile with milestones, credential metadata,
+// recent activity and latest deliverables, in one request
+export const getCreatorBundle = async (id) => {
+  const response = await api.get(`/creators/${id}/bundle/`);
+  return response.data;
+};
+
 // Story 2.2: Change Journey Status
-export const updateJourneyStatus = async (id, journeyStatus, notes = '') => {
-  const response = await api.post(`/creators/${id}/update_journey_status/`, {
-    journey_status: journeyStatus,
-    notes,
-  });
+// With { bundle: true } the response is the refreshed creator bundle
+export const updateJourneyStatus = async (id, journeyStatus, notes = '', { bundle = false } = {}) => {
+  const response = await api.post(
+    `/creators/${id}/update_journey_status/`,
+    { journey_status: journeyStatus, notes },
+    { params: bundle ? { bundle: true } : {} }
+  );
   return response.data;
 };
 
@@ -106,6 +126,13 @@ export const getCreatorsByStatus = async () => {
   return response.data;
 };
 
+// Story 1.1: Many creators by id in one request (at most 100 ids)
+// Returns { results, missing }
+export const batchGetCreators = async (ids) => {
+  const response = await api.post('/creators/batch_get/', { ids });
+  return response.data;
+};
+
 // ===== MILESTONES API (Story 2.1) =====
 
 export const getMilestones = async (params = {}) => {
@@ -179,6 +206,24 @@ export const getCreatorAuditLogs = async (creatorId) => {
   return response.data;
 };
 
+// ===== STATUS HISTORY API (Story 2.2) =====
+
+export const getStatusTransitions = async (params = {}) => {
+  const response = await api.get('/status-transitions/', { params });
+  return response.data;
+};
+
+// Cohort params: created_after, created_before (ISO 8601), brand_niche, is_active
+export const getStatusFunnel = async (params = {}) => {
+  const response = await api.get('/status-transitions/funnel/', { params });
+  return response.data;
+};
+
+export const getTimeInStage = async (params = {}) => {
+  const response = await api.get('/status-transitions/time_in_stage/', { params });
+  return response.data;
+};
+
 // ===== AI DELIVERABLES API (Epic 3) =====
 
 export const getDeliverables = async (params = {}) => {
@@ -191,4 +236,51 @@ export const createDeliverable = async (data) => {
   return response.data;
 };
 
+// ===== BATCH API (Epic 2) =====
+
+// Several GETs in one round trip, e.g. batch(['creators/urgent/', 'dashboard/']).
+// Paths are relative to the API root; resolves to [{ path, status, body }]
+// in the same order (at most 20 paths).
+export const batch = async (paths) => {
+  const response = await api.post('/batch/', {
+    requests: paths.map((path) => ({ path })),
+  });
+  return response.data.responses;
+};
+
+// ===== DELTA SYNC API (Epic 2) =====
+
+// Tombstone model_name of each syncable collection
+const SYNC_MODELS = {
+  creators: 'creator',
+  milestones: 'milestone',
+  credentials: 'creatorcredential',
+  deliverables: 'aideliverable',
+};
+
+// Every page of a cursor-paginated list
+const getAllPages = async (path, params) => {
+  const rows = [];
+  let response = await api.get(path, { params });
+  rows.push(...response.data.results);
+  while (response.data.next) {
+    response = await api.get(response.data.next);
+    rows.push(...response.data.results);
+  }
+  return rows;
+};
+
+// Rows of `collection` changed or deleted since `since` (ISO 8601).
+// Pass the returned `since` to the next call; a 410 error means the
+// client is too far behind and must reload the full collection.
+export const syncCollection = async (collection, since) => {
+  const changed = await getAllPages(`/${collection}/`, { updated_since: since });
+  const deleted = await getAllPages('/tombstones/', {
+    deleted_since: since,
+    model_name: SYNC_MODELS[collection],
+  });
+  const latest = changed.reduce((max, row) => (row.updated_at > max ? row.updated_at : max), since);
+  return { changed, deleted: deleted.map((tombstone) => tombstone.object_id), since: latest };
+};
+
 export default api;
@@ -0,0 +1,20 @@
+/**
+ * Shared React hooks
+ */
+
+import { useEffect, useState } from 'react';
+
+/**
+ * `value`, updated only once it has stopped changing for `delay` ms
+ * (e.g. to send one search request per pause in typing, not per keystroke)
+ */
+export const useDebouncedValue = (value, delay = 300) => {
+  const [debouncedValue, setDebouncedValue] = useState(value);
+
+  useEffect(() => {
+    const timeout = setTimeout(() => setDebouncedValue(value), delay);
+    return () => clearTimeout(timeout);
+  }, [value, delay]);
+
+  return debouncedValue;
+};
@@ -5,13 +5,45 @@ Epic 1: Story 1.1, 1.2 - View and manage creators/brands
 Customized admin interface optimized for founder workflows.
 """
 
+from django.conf import settings
 from django.contrib import admin
+from django.core.cache import cache
 from django.utils.html import format_html
-from .models import Creator, CreatorCredential, Milestone, AuditLog, AIDeliverable
+from .models import Creator, CreatorCredential, Milestone, AuditLog, AIDeliverable, SlowQuery
+from .pagination import EstimatedCountPaginator
+
+
+class CachedValuesListFilter(admin.AllValuesFieldListFilter):
+    """
+    List filter over a free-text column whose values (a DISTINCT over the
+    whole table) are cached for ADMIN_FACET_CACHE_TIMEOUT seconds, so
+    opening a changelist does not rescan the table. New values show up
+    once the cache entry expires.
+    """
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super().__init__(field, request, params, model, model_admin, field_path)
+        key = f'studio_crm:admin_facets:{model._meta.label_lower}:{field_path}'
+        choices = cache.get(key)
+        if choices is None:
+            choices = list(self.lookup_choices)
+            cache.set(key, choices, getattr(settings, 'ADMIN_FACET_CACHE_TIMEOUT', 600))
+        self.lookup_choices = choices
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelists over tables that grow without bound: the row count is
+    estimated above ESTIMATED_COUNT_THRESHOLD (pagination.py) and the
+    unfiltered total ("N total") is not counted at all.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Creator)
-class CreatorAdmin(admin.ModelAdmin):
+class CreatorAdmin(LargeTableAdmin):
     """
     Story 1.1: Creator/Brand List with filters
     Story 1.2: Full profile view with all sections
@@ -22,6 +54,8 @@ class CreatorAdmin(admin.ModelAdmin):
         'creator_name',
         'journey_status_badge',
         'health_score_badge',
+        'milestone_progress',
+        'active_credential_count',
         'last_status_change',
         'created_at',
     ]
@@ -29,9 +63,9 @@ class CreatorAdmin(admin.ModelAdmin):
     list_filter = [
         'journey_status',
         'health_score',
-        'brand_niche',
+        ('brand_niche', CachedValuesListFilter),
         'is_active',
-        'priority_level',
+        ('priority_level', CachedValuesListFilter),
     ]
 
     search_fields = [
@@ -48,6 +82,11 @@ class CreatorAdmin(admin.ModelAdmin):
         'created_by',
         'last_updated_by',
         'health_score',
+        'milestone_count',
+        'completed_milestone_count',
+        'overdue_milestone_count',
+        'credential_count',
+        'active_credential_count',
     ]
 
     fieldsets = (
@@ -77,6 +116,11 @@ class CreatorAdmin(admin.ModelAdmin):
                 'health_score',
                 'last_status_change',
                 'priority_level',
+                'milestone_count',
+                'completed_milestone_count',
+                'overdue_milestone_count',
+                'credential_count',
+                'active_credential_count',
             )
         }),
         ('Operational Links', {
@@ -151,6 +195,18 @@ class CreatorAdmin(admin.ModelAdmin):
         )
     health_score_badge.short_description = 'Health'
 
+    def milestone_progress(self, obj):
+        """Story 2.1: Completed/total milestones from denormalized counters"""
+        progress = f'{obj.completed_milestone_count}/{obj.milestone_count}'
+        if obj.overdue_milestone_count:
+            return format_html(
+                '{} <span style="color: #dc3545;">({} overdue)</span>',
+                progress,
+                obj.overdue_milestone_count
+            )
+        return progress
+    milestone_progress.short_description = 'Milestones'
+
     def save_model(self, request, obj, form, change):
         """Track who created/updated the record"""
         if not change:
@@ -160,7 +216,7 @@ class CreatorAdmin(admin.ModelAdmin):
 
 
 @admin.register(CreatorCredential)
-class CreatorCredentialAdmin(admin.ModelAdmin):
+class CreatorCredentialAdmin(LargeTableAdmin):
     """
     Story 1.4: Secure credential vault management
     Masked passwords with controlled access
@@ -174,12 +230,16 @@ class CreatorCredentialAdmin(admin.ModelAdmin):
         'is_active',
     ]
 
+    list_select_related = ['creator']
+
     list_filter = [
-        'platform_name',
+        ('platform_name', CachedValuesListFilter),
         'is_active',
         'last_verified_date',
     ]
 
+    autocomplete_fields = ['creator']
+
     search_fields = [
         'creator__brand_name',
         'creator__creator_name',
@@ -233,7 +293,7 @@ class CreatorCredentialAdmin(admin.ModelAdmin):
 
 
 @admin.register(Milestone)
-class MilestoneAdmin(admin.ModelAdmin):
+class MilestoneAdmin(LargeTableAdmin):
     """Story 2.1: Project Timeline & Milestones"""
 
     list_display = [
@@ -245,6 +305,9 @@ class MilestoneAdmin(admin.ModelAdmin):
         'status_icon',
     ]
 
+    # Milestone.__str__ and the creator column read creator.brand_name
+    list_select_related = ['creator']
+
     list_filter = [
         'is_completed',
         'related_journey_stage',
@@ -257,6 +320,8 @@ class MilestoneAdmin(admin.ModelAdmin):
         'description',
     ]
 
+    autocomplete_fields = ['creator']
+
     fieldsets = (
         (None, {
             'fields': (
@@ -284,7 +349,7 @@ class MilestoneAdmin(admin.ModelAdmin):
 
 
 @admin.register(AuditLog)
-class AuditLogAdmin(admin.ModelAdmin):
+class AuditLogAdmin(LargeTableAdmin):
     """
     Epic 0.4: System Audit Log
     Read-only view of all sensitive actions
@@ -299,8 +364,8 @@ class AuditLogAdmin(admin.ModelAdmin):
     ]
 
     list_filter = [
-        'action_type',
-        'target_model',
+        ('action_type', CachedValuesListFilter),
+        ('target_model', CachedValuesListFilter),
         'timestamp',
     ]
 
@@ -338,7 +403,7 @@ class AuditLogAdmin(admin.ModelAdmin):
 
 
 @admin.register(AIDeliverable)
-class AIDeliverableAdmin(admin.ModelAdmin):
+class AIDeliverableAdmin(LargeTableAdmin):
     """Epic 3: AI Deliverable Generation Management"""
 
     list_display = [
@@ -350,10 +415,12 @@ class AIDeliverableAdmin(admin.ModelAdmin):
         'created_by',
     ]
 
+    list_select_related = ['creator', 'created_by']
+
     list_filter = [
         'status',
         'deliverable_type',
-        'ai_model',
+        ('ai_model', CachedValuesListFilter),
         'created_at',
     ]
 
@@ -362,6 +429,8 @@ class AIDeliverableAdmin(admin.ModelAdmin):
         'deliverable_type',
     ]
 
+    autocomplete_fields = ['creator']
+
     readonly_fields = [
         'id',
         'created_at',
@@ -406,3 +475,63 @@ class AIDeliverableAdmin(admin.ModelAdmin):
         if not change:
             obj.created_by = request.user
         super().save_model(request, obj, form, change)
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    """
+    Slow SQL captured from live traffic, with EXPLAIN plans
+    Read-only; entries can be deleted once dealt with
+    """
+
+    list_display = [
+        'recorded_at',
+        'duration_ms',
+        'view',
+        'database',
+        'sql_preview',
+    ]
+
+    list_filter = [
+        'view',
+        'database',
+        'recorded_at',
+    ]
+
+    search_fields = [
+        'sql',
+        'view',
+        'path',
+    ]
+
+    readonly_fields = [
+        'recorded_at',
+        'database',
+        'duration_ms',
+        'view',
+        'method',
+        'path',
+        'sql_formatted',
+        'plan_formatted',
+    ]
+
+    fields = readonly_fields
+
+    def sql_preview(self, obj):
+        return obj.sql[:120]
+    sql_preview.short_description = 'SQL'
+
+    def sql_formatted(self, obj):
+        return format_html('<pre style="white-space: pre-wrap">{}</pre>', obj.sql)
+    sql_formatted.short_description = 'SQL'
+
+    def plan_formatted(self, obj):
+        return format_html('<pre>{}</pre>', obj.plan or 'No plan (PostgreSQL only)')
+    plan_formatted.short_description = 'Query plan'
+
+    def has_add_permission(self, request):
+        """Slow queries are only recorded from traffic"""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
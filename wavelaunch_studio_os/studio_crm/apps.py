@@ -12,3 +12,8 @@ class StudioCrmConfig(AppConfig):
     def ready(self):
         """Import signal handlers when app is ready"""
         import studio_crm.signals
+        import studio_crm.profiling
+        import studio_crm.slow_queries
+        from studio_crm.checks import check_replica_pin_cache
+
+        check_replica_pin_cache()
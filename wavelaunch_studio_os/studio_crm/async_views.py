@@ -0,0 +1,272 @@
+"""
+Async read endpoints for Studio CRM
+Epic 2: Project Lifecycle Visibility & Tracking
+
+Async-capable versions of the hottest read endpoints (creator list/detail,
+dashboard, recent audit log), served under ASGI with Django's async ORM so a
+request waiting on Postgres does not pin a worker thread.
+
+Each view produces the same payload as its DRF viewset counterpart and falls
+back to that viewset (run in a thread) for anything it does not serve
+natively: write methods, authentication/permission failures, invalid filters
+and missing objects. Under WSGI the views still work, just without the
+concurrency benefit.
+"""
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .models import CreatorStatsSnapshot
+from .pagination import CreatorCursorPagination, estimated_count
+from .profiling import profile_serialization
+from .serializers import DashboardStatsSerializer
+from .views import (
+    AuditLogViewSet,
+    CreatorViewSet,
+    DashboardViewSet,
+    dashboard_creator_lists,
+    health_summary,
+    live_health,
+    status_summary,
+)
+
+
+async def dashboard_counts():
+    """
+    Dashboard counters from CreatorStatsSnapshot (or Creator, with live
+    health), read with the async ORM
+    """
+    return CreatorStatsSnapshot.summarize(
+        [row async for row in CreatorStatsSnapshot.rows()]
+    )
+
+
+class FallbackToSync(Exception):
+    """Raised by a handler to let the synchronous viewset answer the request"""
+
+
+class AsyncReadView(View):
+    """
+    Base class for async read endpoints
+
+    Subclasses set `viewset_class` and `fallback_actions` (the DRF action map
+    for the URL they replace) and implement `async def get()`.
+    """
+
+    viewset_class = None
+    fallback_actions = None
+    viewset_action = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Same as DRF's APIView: CSRF is enforced by SessionAuthentication only
+        view.csrf_exempt = True
+        return view
+
+    @classmethod
+    def get_fallback_view(cls):
+        """Synchronous DRF view used for anything not served natively"""
+        if '_fallback_view' not in cls.__dict__:
+            cls._fallback_view = cls.viewset_class.as_view(cls.fallback_actions)
+        return cls._fallback_view
+
+    async def fallback(self, request, *args, **kwargs):
+        return await sync_to_async(self.get_fallback_view())(request, *args, **kwargs)
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return await self.fallback(request, *args, **kwargs)
+
+        drf_request = Request(
+            request,
+            authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES],
+        )
+        try:
+            self.viewset = await sync_to_async(self.initialize_viewset)(drf_request, args, kwargs)
+            return await self.get(drf_request, *args, **kwargs)
+        except (FallbackToSync, APIException, ObjectDoesNotExist, ValidationError):
+            return await self.fallback(request, *args, **kwargs)
+
+    def initialize_viewset(self, drf_request, args, kwargs):
+        """
+        Build the DRF viewset instance so filtering, ordering, serializer
+        selection and permissions stay identical to the sync endpoint.
+        Runs in a thread: authenticating the user may query the database.
+        """
+        viewset = self.viewset_class(
+            request=drf_request,
+            args=args,
+            kwargs=kwargs,
+            format_kwarg=None,
+            action=self.viewset_action,
+        )
+        viewset.check_permissions(drf_request)
+        viewset.route_reads(drf_request)
+        return viewset
+
+    def render(self, data):
+        """Render with the first configured DRF renderer, as the viewsets do"""
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f'{content_type}; charset={renderer.charset}'
+        with profile_serialization():
+            content = renderer.render(data)
+        return HttpResponse(content, content_type=content_type)
+
+
+class AsyncCreatorListView(AsyncReadView):
+    """
+    Story 1.1 / 2.4: Creator list
+    GET /api/crm/async/creators/
+    """
+
+    viewset_class = CreatorViewSet
+    fallback_actions = {'get': 'list', 'post': 'create'}
+    viewset_action = 'list'
+
+    async def get(self, request, *args, **kwargs):
+        fast_serializer = self.viewset.get_fast_serializer()
+        queryset = fast_serializer.values(self.viewset.filter_queryset(self.viewset.get_queryset()))
+        paginator = self.viewset.paginator
+        if isinstance(paginator, CreatorCursorPagination) or 'updated_since' in request.query_params:
+            raise FallbackToSync()
+
+        if paginator is None:
+            rows = [row async for row in queryset]
+            with profile_serialization():
+                data = fast_serializer.serialize_rows(rows)
+            return self.render(data)
+
+        page_size = paginator.get_page_size(request)
+        try:
+            page_number = int(request.query_params.get(paginator.page_query_param, 1))
+        except ValueError:
+            raise FallbackToSync()
+
+        # Same (possibly estimated) count as EstimatedCountPagination
+        count, approximate = await sync_to_async(estimated_count)(queryset)
+        last_page = max(1, -(-count // page_size))
+        if page_number < 1 or (page_number > last_page and not approximate):
+            raise FallbackToSync()
+
+        offset = (page_number - 1) * page_size
+        rows = [row async for row in queryset[offset:offset + page_size]]
+
+        url = request.build_absolute_uri()
+        next_link = None
+        if (len(rows) == page_size) if approximate else (page_number < last_page):
+            next_link = replace_query_param(url, paginator.page_query_param, page_number + 1)
+        previous_link = None
+        if page_number > 1:
+            if page_number == 2:
+                previous_link = remove_query_param(url, paginator.page_query_param)
+            else:
+                previous_link = replace_query_param(url, paginator.page_query_param, page_number - 1)
+
+        with profile_serialization():
+            results = fast_serializer.serialize_rows(rows)
+        return self.render({
+            'count': count,
+            'count_approximate': approximate,
+            'next': next_link,
+            'previous': previous_link,
+            'results': results,
+        })
+
+
+class AsyncCreatorDetailView(AsyncReadView):
+    """
+    Story 1.2: Creator profile
+    GET /api/crm/async/creators/{id}/
+    """
+
+    viewset_class = CreatorViewSet
+    fallback_actions = {
+        'get': 'retrieve',
+        'put': 'update',
+        'patch': 'partial_update',
+        'delete': 'destroy',
+    }
+    viewset_action = 'retrieve'
+
+    async def get(self, request, *args, **kwargs):
+        queryset = self.viewset.filter_queryset(self.viewset.get_queryset())
+        creator = await queryset.aget(pk=kwargs['pk'])
+        live_health([creator])
+        return self.render(self.viewset.get_serializer(creator).data)
+
+
+class AsyncDashboardView(AsyncReadView):
+    """
+    Epic 0.3: Dashboard statistics
+    GET /api/crm/async/dashboard/
+    """
+
+    viewset_class = DashboardViewSet
+    fallback_actions = {'get': 'list'}
+    viewset_action = 'list'
+
+    async def get(self, request, *args, **kwargs):
+        counts = await dashboard_counts()
+        recent_updates, urgent_projects = dashboard_creator_lists()
+
+        stats = {
+            **counts,
+            'recent_updates': live_health([creator async for creator in recent_updates]),
+            'urgent_projects': live_health([creator async for creator in urgent_projects]),
+        }
+        return self.render(DashboardStatsSerializer(stats).data)
+
+
+class AsyncHealthSummaryView(AsyncReadView):
+    """
+    Story 2.3: Health score distribution
+    GET /api/crm/async/dashboard/health_summary/
+    """
+
+    viewset_class = DashboardViewSet
+    fallback_actions = {'get': 'health_summary'}
+    viewset_action = 'health_summary'
+
+    async def get(self, request, *args, **kwargs):
+        return self.render(health_summary(await dashboard_counts()))
+
+
+class AsyncStatusSummaryView(AsyncReadView):
+    """
+    Story 2.2: Journey status distribution
+    GET /api/crm/async/dashboard/status_summary/
+    """
+
+    viewset_class = DashboardViewSet
+    fallback_actions = {'get': 'status_summary'}
+    viewset_action = 'status_summary'
+
+    async def get(self, request, *args, **kwargs):
+        return self.render(status_summary(await dashboard_counts()))
+
+
+class AsyncRecentAuditLogView(AsyncReadView):
+    """
+    Epic 0.4: Recent audit log entries (last 50)
+    GET /api/crm/async/audit-logs/recent/
+    """
+
+    viewset_class = AuditLogViewSet
+    fallback_actions = {'get': 'recent'}
+    viewset_action = 'recent'
+
+    async def get(self, request, *args, **kwargs):
+        fast_serializer = self.viewset.get_fast_serializer()
+        rows = [row async for row in fast_serializer.values(self.viewset.get_queryset()[:50])]
+        with profile_serialization():
+            data = fast_serializer.serialize_rows(rows)
+        return self.render(data)
@@ -0,0 +1,50 @@
+"""
+Startup checks for Studio CRM
+Settings that work with one worker but silently misbehave with several
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+# Cache backends whose entries only the writing process sees
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# DATABASES keys that identify the server and database an alias reads
+SERVER_KEYS = ('ENGINE', 'HOST', 'PORT', 'NAME')
+
+
+def cache_is_shared(alias='default'):
+    """Whether every worker process sees the same `alias` cache"""
+    return settings.CACHES[alias]['BACKEND'] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def lagging_replicas():
+    """
+    Replica aliases on another server or database than 'default', i.e.
+    real replicas that can lag (the 'readonly' alias defaults to the primary)
+    """
+    from .db_routers import get_replica_aliases
+
+    primary = [settings.DATABASES['default'].get(key) for key in SERVER_KEYS]
+    return [
+        alias for alias in get_replica_aliases()
+        if [settings.DATABASES[alias].get(key) for key in SERVER_KEYS] != primary
+    ]
+
+
+def check_replica_pin_cache():
+    """
+    Read-your-writes pins (db_routers.pin_to_primary) live in the cache: a
+    per-process cache pins a user only in the worker that served the write,
+    and the next read may hit a lagging replica through another worker.
+    """
+    replicas = lagging_replicas()
+    if replicas and not cache_is_shared():
+        raise ImproperlyConfigured(
+            f'DATABASE_REPLICAS ({", ".join(replicas)}) needs a cache shared by all workers for '
+            f'read-your-writes; {settings.CACHES["default"]["BACKEND"]} is per process. Set '
+            f'CACHE_BACKEND / CACHE_LOCATION (e.g. RedisCache) or stop routing reads to the replicas.'
+        )
@@ -0,0 +1,155 @@
+"""
+Response compression for Studio CRM
+gzip, and brotli when the `brotli` package is installed
+
+CompressionMiddleware compresses text and JSON responses of at least
+COMPRESSION_MIN_SIZE bytes with the best encoding the client accepts
+(brotli over gzip at equal preference). Streaming responses are compressed
+chunk by chunk, flushing after each chunk so rows still reach the client as
+they are produced.
+
+Responses served from the response cache (response_cache.py) carry their
+body already compressed in every encoding; the middleware sends those bytes
+as they are instead of compressing the body again.
+
+Like Django's GZipMiddleware, gzip output is padded with random bytes to
+mitigate BREACH.
+"""
+
+import gzip
+import re
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:  # optional; gzip only without it
+    brotli = None
+
+# Content types worth compressing (prefix match)
+COMPRESSIBLE_CONTENT_TYPES = (
+    'text/',
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+)
+
+MAX_RANDOM_BYTES = 100
+
+accept_encoding_re = re.compile(r'\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*')
+
+
+def available_encodings():
+    """Supported encodings, most preferred first"""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate_encoding(accept_encoding):
+    """Best encoding allowed by an Accept-Encoding header, or None"""
+    weights = {}
+    for part in accept_encoding.split(','):
+        match = accept_encoding_re.fullmatch(part)
+        if not match:
+            continue
+        try:
+            weights[match[1].lower()] = float(match[2]) if match[2] else 1.0
+        except ValueError:
+            continue
+
+    best, best_weight = None, 0.0
+    for encoding in available_encodings():
+        weight = weights.get(encoding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(encoding, content, level=None):
+    """`content` compressed with `encoding`; `level` None uses the on-the-fly setting"""
+    if encoding == 'br':
+        quality = level if level is not None else getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4)
+        return brotli.compress(content, quality=quality)
+    if level is None:
+        return compress_string(content, max_random_bytes=MAX_RANDOM_BYTES)
+    return gzip.compress(content, compresslevel=level, mtime=0)
+
+
+def brotli_sequence(sequence, quality):
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def abrotli_sequence(sequence, quality):
+    compressor = brotli.Compressor(quality=quality)
+    async for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def compressible(response):
+    content_type = response.get('Content-Type', '').lower()
+    return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    gzip / brotli response compression
+    Add near the top of MIDDLEWARE, in place of GZipMiddleware
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or not compressible(response):
+            return response
+        if not response.streaming and len(response.content) < getattr(settings, 'COMPRESSION_MIN_SIZE', 1024):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            self.compress_stream(response, encoding)
+        else:
+            precompressed = getattr(response, 'precompressed', {}).get(encoding)
+            content = precompressed if precompressed is not None else compress(encoding, response.content)
+            # Only worth sending when actually smaller
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response.headers['Content-Length'] = str(len(content))
+
+        # A strong ETag must not match the compressed representation
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    def compress_stream(self, response, encoding):
+        content = response.streaming_content
+        if encoding == 'br':
+            quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4)
+            if response.is_async:
+                response.streaming_content = abrotli_sequence(content, quality)
+            else:
+                response.streaming_content = brotli_sequence(content, quality)
+        elif response.is_async:
+            async def gzip_chunks():
+                async for chunk in content:
+                    yield compress_string(chunk, max_random_bytes=MAX_RANDOM_BYTES)
+            response.streaming_content = gzip_chunks()
+        else:
+            response.streaming_content = compress_sequence(content, max_random_bytes=MAX_RANDOM_BYTES)
+        # The compressed length is unknown until the stream ends
+        del response.headers['Content-Length']
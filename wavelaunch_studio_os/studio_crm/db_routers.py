@@ -0,0 +1,150 @@
+"""
+Database Routers for Studio CRM
+Read-replica routing for reporting endpoints
+
+Reads issued while serving a read-only endpoint (dashboard, audit log
+browsing, list actions - see ReadReplicaMixin in views.py) go to one of the
+aliases in settings.DATABASE_REPLICAS. Everything else, including every write,
+uses 'default'.
+
+- Replication lag: each replica's lag is sampled at most every
+  REPLICA_LAG_CHECK_INTERVAL seconds; replicas lagging more than
+  REPLICA_MAX_LAG_SECONDS (or unreachable) are skipped.
+- Read-your-writes: a user who writes anything is pinned to the primary for
+  REPLICA_STICKY_SECONDS, so e.g. the list reloaded right after
+  update_journey_status shows the new status. Pins live in the Django cache,
+  which must be shared between workers for this to hold across processes;
+  startup fails when a real replica is configured with a per-process cache
+  (checks.check_replica_pin_cache).
+
+Locally, point two aliases at the same database (the 'readonly' alias does
+this by default) to exercise the routing without a real replica.
+"""
+
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from rest_framework.permissions import SAFE_METHODS
+
+from .metrics import record_cache_lookup
+from .signals import get_current_request
+
+PIN_CACHE_KEY = 'studio_crm:pin_primary:{user_id}'
+
+# alias -> (monotonic time of last check, replica usable)
+_replica_status = {}
+
+
+def get_replica_aliases():
+    """Configured replica aliases that exist in DATABASES"""
+    return [
+        alias for alias in getattr(settings, 'DATABASE_REPLICAS', [])
+        if alias in settings.DATABASES and alias != 'default'
+    ]
+
+
+def allow_replica_reads(request):
+    """Mark the current request as read-only so its reads may use a replica"""
+    http_request = getattr(request, '_request', request)
+    http_request.use_read_replica = True
+
+
+def pin_to_primary(user):
+    """Story 2.2: Read-your-writes - send this user's reads to the primary for a while"""
+    cache.set(
+        PIN_CACHE_KEY.format(user_id=user.pk),
+        True,
+        getattr(settings, 'REPLICA_STICKY_SECONDS', 10),
+    )
+
+
+def is_pinned_to_primary(request):
+    """Whether the request's user wrote recently (memoized per request)"""
+    if not hasattr(request, '_pinned_to_primary'):
+        user = getattr(request, 'user', None)
+        request._pinned_to_primary = False
+        if user is not None and user.is_authenticated:
+            request._pinned_to_primary = bool(cache.get(PIN_CACHE_KEY.format(user_id=user.pk)))
+            record_cache_lookup('replica_pin', request._pinned_to_primary)
+    return request._pinned_to_primary
+
+
+def measure_replication_lag(alias):
+    """Seconds the replica is behind its primary (0 when caught up or not Postgres)"""
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return 0.0
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT CASE
+                WHEN NOT pg_is_in_recovery()
+                    OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+                THEN 0
+                ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+            END
+            """
+        )
+        return float(cursor.fetchone()[0])
+
+
+def replica_is_usable(alias):
+    """Replica reachable and within REPLICA_MAX_LAG_SECONDS (cached per process)"""
+    now = time.monotonic()
+    checked_at, usable = _replica_status.get(alias, (None, True))
+    fresh = checked_at is not None and now - checked_at < getattr(settings, 'REPLICA_LAG_CHECK_INTERVAL', 5)
+    record_cache_lookup('replica_status', fresh)
+    if fresh:
+        return usable
+
+    try:
+        usable = measure_replication_lag(alias) <= getattr(settings, 'REPLICA_MAX_LAG_SECONDS', 5)
+    except DatabaseError:
+        usable = False
+
+    _replica_status[alias] = (now, usable)
+    return usable
+
+
+class ReplicaRouter:
+    """
+    Route reads of read-only endpoints to a fresh replica, everything else
+    to 'default'.
+    """
+
+    def db_for_read(self, model, **hints):
+        request = get_current_request()
+        if request is None or not getattr(request, 'use_read_replica', False):
+            return None
+        if request.method not in SAFE_METHODS or is_pinned_to_primary(request):
+            return None
+
+        replicas = [alias for alias in get_replica_aliases() if replica_is_usable(alias)]
+        if not replicas:
+            return None
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        request = get_current_request()
+        if request is not None and not getattr(request, '_wrote_to_primary', False):
+            request._wrote_to_primary = True
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                pin_to_primary(user)
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        databases = {'default', *get_replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replica_aliases():
+            return False
+        return None
@@ -0,0 +1,188 @@
+"""
+Configurable creator health rules
+Story 2.3: Health score calculation
+
+A rule set is an ordered list of rules. The first rule whose conditions all
+hold gives the creator's score; GREEN when none does. Each rule is a dict:
+
+    {'score': 'RED', 'idle_days_over': 14, 'journey_status_in': ['ONBOARDING']}
+
+Conditions (a rule needs at least one):
+    idle_days_over           whole days since last_status_change > n
+    journey_status_in        journey_status is one of the listed statuses
+    follow_up_overdue        next_follow_up_date is before today (true/false)
+    overdue_milestones_over  overdue_milestone_count > n
+
+settings.HEALTH_RULES replaces DEFAULT_HEALTH_RULES. A rule set compiles to a
+Python evaluator (HealthRules.evaluate, run when a creator is saved) and an
+equivalent SQL CASE (HealthRules.expression, used to rescore creators in one
+UPDATE and, with HEALTH_SCORE_SOURCE = 'live', to compute scores at query
+time). `manage.py check_health_rules` verifies the two agree.
+"""
+
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.db import models
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import HealthScore, JourneyStatus
+
+EARLY_STAGES = [JourneyStatus.ONBOARDING, JourneyStatus.BRAND_BUILDING]
+
+# The thresholds Creator.calculate_health_score() used to hard-code
+DEFAULT_HEALTH_RULES = [
+    # Red flags (urgent attention needed)
+    {'score': HealthScore.RED, 'idle_days_over': 14, 'journey_status_in': EARLY_STAGES},
+    {'score': HealthScore.RED, 'idle_days_over': 30},
+    {'score': HealthScore.YELLOW, 'journey_status_in': [JourneyStatus.PAUSED], 'idle_days_over': 7},
+    # Yellow flags (needs attention soon)
+    {'score': HealthScore.YELLOW, 'idle_days_over': 7, 'journey_status_in': EARLY_STAGES},
+    {'score': HealthScore.YELLOW, 'follow_up_overdue': True},
+    {'score': HealthScore.YELLOW, 'overdue_milestones_over': 0},
+]
+
+DEFAULT_SCORE = HealthScore.GREEN
+
+
+def _count(name, value):
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ImproperlyConfigured(f'Health rule condition {name!r} must be a non-negative integer, got {value!r}')
+    return value
+
+
+def _statuses(name, value):
+    if isinstance(value, str) or not value or any(status not in JourneyStatus.values for status in value):
+        raise ImproperlyConfigured(
+            f'Health rule condition {name!r} must be a list of journey statuses '
+            f'({", ".join(JourneyStatus.values)}), got {value!r}'
+        )
+    return list(value)
+
+
+def _flag(name, value):
+    if not isinstance(value, bool):
+        raise ImproperlyConfigured(f'Health rule condition {name!r} must be true or false, got {value!r}')
+    return value
+
+
+class HealthRule:
+    """One rule: a score and the conditions that must all hold for it"""
+
+    # condition -> validator
+    CONDITIONS = {
+        'idle_days_over': _count,
+        'journey_status_in': _statuses,
+        'follow_up_overdue': _flag,
+        'overdue_milestones_over': _count,
+    }
+
+    def __init__(self, spec):
+        if not isinstance(spec, dict):
+            raise ImproperlyConfigured(f'Health rule must be a dict, got {spec!r}')
+        spec = dict(spec)
+        self.score = spec.pop('score', None)
+        if self.score not in HealthScore.values:
+            raise ImproperlyConfigured(
+                f'Health rule score must be one of {", ".join(HealthScore.values)}, got {self.score!r}'
+            )
+        unknown = set(spec) - set(self.CONDITIONS)
+        if unknown:
+            raise ImproperlyConfigured(f'Unknown health rule condition(s): {", ".join(sorted(unknown))}')
+        if not spec:
+            raise ImproperlyConfigured(f'Health rule for {self.score} has no conditions')
+        self.conditions = {name: self.CONDITIONS[name](name, value) for name, value in spec.items()}
+
+    @property
+    def spec(self):
+        """The rule as a dict, as written in settings.HEALTH_RULES"""
+        return {'score': self.score, **self.conditions}
+
+    def matches(self, creator, now):
+        """Python evaluation against a Creator instance"""
+        for name, value in self.conditions.items():
+            if name == 'idle_days_over':
+                holds = (now - creator.last_status_change).days > value
+            elif name == 'journey_status_in':
+                holds = creator.journey_status in value
+            elif name == 'follow_up_overdue':
+                overdue = creator.next_follow_up_date is not None and creator.next_follow_up_date < now.date()
+                holds = overdue == value
+            else:
+                holds = creator.overdue_milestone_count > value
+            if not holds:
+                return False
+        return True
+
+    def condition(self, now):
+        """The same test as a Q object"""
+        q = models.Q()
+        for name, value in self.conditions.items():
+            if name == 'idle_days_over':
+                # (now - last_status_change).days > n  <=>  last_status_change <= now - (n + 1) days
+                q &= models.Q(last_status_change__lte=now - timedelta(days=value + 1))
+            elif name == 'journey_status_in':
+                q &= models.Q(journey_status__in=value)
+            elif name == 'follow_up_overdue':
+                overdue = models.Q(next_follow_up_date__lt=now.date())
+                q &= overdue if value else ~overdue
+            else:
+                q &= models.Q(overdue_milestone_count__gt=value)
+        return q
+
+    def __repr__(self):
+        return f'HealthRule({self.score}, {self.conditions})'
+
+
+class HealthRules:
+    """An ordered rule set, evaluated first match wins"""
+
+    def __init__(self, specs):
+        if not isinstance(specs, (list, tuple)):
+            raise ImproperlyConfigured(f'HEALTH_RULES must be a list of rules, got {specs!r}')
+        self.rules = [HealthRule(spec) for spec in specs]
+
+    @property
+    def specs(self):
+        return [rule.spec for rule in self.rules]
+
+    def evaluate(self, creator, now=None):
+        """Score one creator in Python"""
+        now = now or timezone.now()
+        for rule in self.rules:
+            if rule.matches(creator, now):
+                return rule.score
+        return DEFAULT_SCORE
+
+    def expression(self, now=None):
+        """evaluate() as a SQL CASE over Creator columns"""
+        now = now or timezone.now()
+        if not self.rules:
+            return models.Value(DEFAULT_SCORE, output_field=models.CharField())
+        return models.Case(
+            *[models.When(rule.condition(now), then=models.Value(rule.score)) for rule in self.rules],
+            default=models.Value(DEFAULT_SCORE),
+            output_field=models.CharField(),
+        )
+
+
+@lru_cache(maxsize=1)
+def active_health_rules():
+    """The configured rule set (settings.HEALTH_RULES, else the defaults)"""
+    specs = getattr(settings, 'HEALTH_RULES', None)
+    return HealthRules(DEFAULT_HEALTH_RULES if specs is None else specs)
+
+
+def health_score_is_live():
+    """True when reads compute health in SQL instead of using the stored column"""
+    return getattr(settings, 'HEALTH_SCORE_SOURCE', 'stored') == 'live'
+
+
+@receiver(setting_changed)
+def reset_health_rules(setting, **kwargs):
+    if setting == 'HEALTH_RULES':
+        active_health_rules.cache_clear()
@@ -0,0 +1,253 @@
+"""
+Health rule what-if simulation
+Story 2.3: Health score calculation
+
+Shows how many creators would change health score under candidate rules
+before the rules are changed. The columns the rules read are loaded for
+every creator into NumPy arrays once. Creators the rules cannot tell apart
+are then collapsed into groups: same journey status, follow-up state, and
+idle days and overdue milestone counts capped just past the largest
+threshold. A whole grid of rule variants is scored against the groups with
+vectorized first-match evaluation, so hundreds of variants over 100k
+creators take milliseconds. Scores follow HealthRules.evaluate exactly.
+
+A grid maps '<rule index>.<condition>' to the values to try for that
+condition of the base rule set, e.g.
+
+    {'0.idle_days_over': [10, 14, 21], '1.idle_days_over': [30, 45]}
+
+and every combination is simulated (6 variants here).
+"""
+
+import itertools
+import time
+from datetime import timedelta
+
+import numpy as np
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from .health_rules import DEFAULT_SCORE, HealthRule, HealthRules
+from .models import Creator, HealthScore, JourneyStatus
+
+MAX_COMBINATIONS = 1000
+
+SCORES = list(HealthScore.values)
+STATUSES = list(JourneyStatus.values)
+ONE_MICROSECOND = timedelta(microseconds=1)
+MICROSECONDS_PER_DAY = 86400 * 10 ** 6
+
+
+def expand_grid(base_rules, grid):
+    """[(parameters, HealthRules)] for every combination in `grid`"""
+    base_specs = base_rules.specs
+    keys = []
+    for key in grid:
+        index, _, condition = key.partition('.')
+        if not index.isdigit() or int(index) >= len(base_specs) or condition not in HealthRule.CONDITIONS:
+            raise ImproperlyConfigured(
+                f'Grid key {key!r} must be "<rule index>.<condition>" with a rule index below '
+                f'{len(base_specs)} and one of {", ".join(HealthRule.CONDITIONS)}'
+            )
+        keys.append((key, int(index), condition))
+
+    combinations = 1
+    for values in grid.values():
+        combinations *= len(values)
+    if combinations > MAX_COMBINATIONS:
+        raise ImproperlyConfigured(f'Grid has {combinations} combinations; at most {MAX_COMBINATIONS} allowed')
+
+    candidates = []
+    for values in itertools.product(*grid.values()):
+        specs = [dict(spec) for spec in base_specs]
+        for (key, index, condition), value in zip(keys, values):
+            specs[index][condition] = value
+        candidates.append((dict(zip(grid, values)), HealthRules(specs)))
+    return candidates
+
+
+class RuleGroups:
+    """
+    Creators collapsed into groups no rule in a set of rule sets can tell
+    apart, with the per-group columns the rules are evaluated on
+    """
+
+    def __init__(self, simulation, rule_sets):
+        idle_cap = overdue_cap = 0
+        for rules in rule_sets:
+            for rule in rules.rules:
+                idle_cap = max(idle_cap, rule.conditions.get('idle_days_over', -1) + 1)
+                overdue_cap = max(overdue_cap, rule.conditions.get('overdue_milestones_over', -1) + 1)
+        idle = np.minimum(simulation.idle_days, idle_cap)
+        overdue = np.clip(simulation.overdue, 0, overdue_cap)
+
+        idle_base = int(idle.min()) if len(idle) else 0
+        keys = (
+            (((idle - idle_base) * len(STATUSES) + simulation.status) * 2 + simulation.follow_up_overdue)
+            * (overdue_cap + 1) + overdue
+        )
+        _, self.first, inverse, self.sizes = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True,
+        )
+        self.columns = {
+            'idle_days_over': idle[self.first],
+            'journey_status_in': simulation.status[self.first],
+            'follow_up_overdue': simulation.follow_up_overdue[self.first],
+            'overdue_milestones_over': overdue[self.first],
+        }
+        # Creators ordered by group, to pick examples from a group
+        self.members = np.argsort(inverse.ravel(), kind='stable')
+        self.member_start = np.concatenate([[0], np.cumsum(self.sizes)[:-1]]).astype(np.int64)
+        self.masks = {}
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def condition_mask(self, name, value):
+        """Groups meeting one rule condition; cached across rule sets"""
+        key = (name, tuple(value) if isinstance(value, list) else value)
+        if key not in self.masks:
+            column = self.columns[name]
+            if name == 'journey_status_in':
+                self.masks[key] = np.isin(column, [STATUSES.index(status) for status in value])
+            elif name == 'follow_up_overdue':
+                self.masks[key] = column == value
+            else:
+                self.masks[key] = column > value
+        return self.masks[key]
+
+    def scores(self, rules):
+        """Score (index into SCORES) of every group, first matching rule wins"""
+        result = np.full(len(self), SCORES.index(DEFAULT_SCORE), dtype=np.int64)
+        unmatched = np.ones(len(self), dtype=bool)
+        for rule in rules.rules:
+            matched = unmatched.copy()
+            for name, value in rule.conditions.items():
+                matched &= self.condition_mask(name, value)
+            result[matched] = SCORES.index(rule.score)
+            unmatched &= ~matched
+        return result
+
+    def distribution(self, scores):
+        counts = np.bincount(scores, weights=self.sizes, minlength=len(SCORES))
+        return {score: int(counts[index]) for index, score in enumerate(SCORES)}
+
+    def examples(self, groups, limit):
+        """Creator indexes of up to `limit` members of `groups`"""
+        found = []
+        for group in groups:
+            if len(found) >= limit:
+                break
+            start = self.member_start[group]
+            found.extend(self.members[start:start + min(self.sizes[group], limit - len(found))])
+        return found
+
+
+class HealthSimulation:
+    """Creator columns read by the health rules, as NumPy arrays"""
+
+    def __init__(self, ids, statuses, last_status_changes, follow_ups, overdue_counts, now=None):
+        self.now = now or timezone.now()
+        self.rows = (ids, statuses, last_status_changes, follow_ups, overdue_counts)
+        today = self.now.date()
+
+        self.status = np.array([STATUSES.index(status) for status in statuses], dtype=np.int64)
+        # Whole days idle, rounded down like timedelta.days
+        self.idle_days = np.array(
+            [(self.now - changed) // ONE_MICROSECOND for changed in last_status_changes], dtype=np.int64,
+        ) // MICROSECONDS_PER_DAY
+        self.follow_up_overdue = np.array(
+            [follow_up is not None and follow_up < today for follow_up in follow_ups], dtype=bool,
+        )
+        self.overdue = np.array(overdue_counts, dtype=np.int64)
+
+    @classmethod
+    def load(cls, queryset=None, now=None):
+        """Read the columns of every creator in `queryset` (all creators) in one query"""
+        queryset = Creator.objects.all() if queryset is None else queryset
+        rows = list(queryset.order_by().values_list(
+            'pk', 'journey_status', 'last_status_change', 'next_follow_up_date', 'overdue_milestone_count',
+        ))
+        return cls(*(list(zip(*rows)) or [()] * 5), now=now)
+
+    def __len__(self):
+        return len(self.rows[0])
+
+    def creator(self, index):
+        """Creator `index` as an unsaved instance, for HealthRules.evaluate"""
+        pk, journey_status, last_status_change, next_follow_up_date, overdue_count = (
+            column[index] for column in self.rows
+        )
+        return Creator(
+            pk=pk,
+            journey_status=journey_status,
+            last_status_change=last_status_change,
+            next_follow_up_date=next_follow_up_date,
+            overdue_milestone_count=overdue_count,
+        )
+
+    def run(self, base_rules, grid, examples=3):
+        """
+        Score every creator under `base_rules` and under every combination of
+        `grid`. Returns the baseline distribution and, per combination, the
+        distribution, its change from the baseline and the transitions
+        between scores with example creator ids.
+        """
+        started = time.perf_counter()
+        candidates = expand_grid(base_rules, grid)
+        groups = RuleGroups(self, [base_rules] + [rules for _, rules in candidates])
+
+        baseline_scores = groups.scores(base_rules)
+        baseline = groups.distribution(baseline_scores)
+        results = []
+        for parameters, rules in candidates:
+            scores = groups.scores(rules)
+            distribution = groups.distribution(scores)
+            moves = baseline_scores * len(SCORES) + scores
+            moved = np.bincount(moves, weights=groups.sizes, minlength=len(SCORES) ** 2)
+            transitions = []
+            for move in np.flatnonzero(moved):
+                before, after = divmod(int(move), len(SCORES))
+                if before != after:
+                    transitions.append({
+                        'from': SCORES[before],
+                        'to': SCORES[after],
+                        'count': int(moved[move]),
+                        'examples': [
+                            str(self.rows[0][index])
+                            for index in groups.examples(np.flatnonzero(moves == move), examples)
+                        ],
+                    })
+            results.append({
+                'parameters': parameters,
+                'distribution': distribution,
+                'change': {score: distribution[score] - baseline[score] for score in SCORES},
+                'changed': sum(transition['count'] for transition in transitions),
+                'transitions': transitions,
+            })
+
+        return {
+            'creators': len(self),
+            'groups': len(groups),
+            'combinations': len(results),
+            'baseline': baseline,
+            'results': results,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    def verify(self, base_rules, grid):
+        """
+        Check the vectorized scores against HealthRules.evaluate on one
+        creator of every group, for the base rules and every combination.
+        Returns descriptions of disagreements.
+        """
+        rule_sets = [({}, base_rules)] + expand_grid(base_rules, grid)
+        groups = RuleGroups(self, [rules for _, rules in rule_sets])
+        representatives = [self.creator(index) for index in groups.first]
+        mismatches = []
+        for parameters, rules in rule_sets:
+            for creator, score in zip(representatives, groups.scores(rules)):
+                expected = rules.evaluate(creator, self.now)
+                if expected != SCORES[score]:
+                    mismatches.append(f'{parameters or "base rules"}: {creator.pk} {expected} != {SCORES[score]}')
+        return mismatches
@@ -0,0 +1,99 @@
+"""
+Backfill journey status history (StatusTransition) from the audit log
+
+Status changes made before StatusTransition existed are only recorded in
+AuditLog.changes: the CREATE entry of a creator holds its initial status,
+UPDATE entries hold {"journey_status": {"from": ..., "to": ...}}. This
+command streams those entries oldest first, in batches, and writes one
+StatusTransition per entry.
+
+Safe to re-run and to interrupt: entries already backfilled are skipped
+(StatusTransition.audit_log is unique), as are entries from the time the
+Creator signal started recording a creator's transitions, and entries of
+deleted creators.
+
+Usage:
+    python manage.py backfill_status_transitions
+    python manage.py backfill_status_transitions --batch-size 5000 --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import F, Min, OuterRef, Q, Subquery
+
+from studio_crm.models import AuditLog, Creator, JourneyStatus, StatusTransition
+
+
+def parse_transition(action_type, changes):
+    """(from_status, to_status) recorded by an audit entry, or None"""
+    if action_type == 'CREATE':
+        from_status, to_status = None, (changes.get('created') or {}).get('journey_status')
+    else:
+        change = changes.get('journey_status') or {}
+        from_status, to_status = change.get('from'), change.get('to')
+    if to_status not in JourneyStatus.values:
+        return None
+    return (from_status if from_status in JourneyStatus.values else None), to_status
+
+
+class Command(BaseCommand):
+    help = 'Create StatusTransition rows from journey status changes in the audit log'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--dry-run', action='store_true', help='Count the transitions without writing them')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        # When the signal started recording each creator's transitions
+        recorded_from = (
+            StatusTransition.objects.filter(creator=OuterRef('target_id'), audit_log__isnull=True)
+            .order_by()
+            .values('creator')
+            .annotate(first=Min('transitioned_at'))
+            .values('first')
+        )
+        entries = (
+            AuditLog.objects.filter(
+                target_model='Creator',
+                action_type__in=['CREATE', 'UPDATE'],
+                target_id__in=Creator.objects.values('pk'),
+                status_transition__isnull=True,
+            )
+            .filter(Q(changes__has_key='journey_status') | Q(changes__created__has_key='journey_status'))
+            .alias(recorded_from=Subquery(recorded_from))
+            .filter(Q(recorded_from__isnull=True) | Q(timestamp__lt=F('recorded_from')))
+            .order_by('timestamp')
+            .values_list('pk', 'target_id', 'timestamp', 'user_id', 'action_type', 'changes')
+        )
+
+        batch = []
+        parsed = skipped = 0
+        for audit_log_id, creator_id, timestamp, user_id, action_type, changes in entries.iterator(chunk_size=batch_size):
+            transition = parse_transition(action_type, changes or {})
+            if transition is None:
+                skipped += 1
+                continue
+            from_status, to_status = transition
+            batch.append(StatusTransition(
+                creator_id=creator_id,
+                from_status=from_status,
+                to_status=to_status,
+                transitioned_at=timestamp,
+                changed_by_id=user_id,
+                audit_log_id=audit_log_id,
+            ))
+            parsed += 1
+            if len(batch) >= batch_size:
+                self.write(batch, options['dry_run'])
+                batch = []
+        self.write(batch, options['dry_run'])
+
+        verb = 'Would create' if options['dry_run'] else 'Created'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {parsed} status transitions; skipped {skipped} unparseable audit entries'
+        ))
+
+    def write(self, batch, dry_run):
+        if batch and not dry_run:
+            StatusTransition.objects.bulk_create(batch, ignore_conflicts=True)
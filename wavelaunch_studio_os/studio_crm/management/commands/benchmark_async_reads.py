@@ -0,0 +1,92 @@
+"""
+Concurrency benchmark: sync DRF viewsets vs async read endpoints
+
+Fires concurrent GET requests at a running server (ideally the same build
+served by gunicorn/WSGI and by uvicorn/ASGI) and reports throughput and
+latency percentiles for each sync endpoint and its async counterpart.
+
+Usage:
+    python manage.py benchmark_async_reads --base-url http://localhost:8000 \\
+        --token <JWT access token> --concurrency 50 --requests 500
+"""
+
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+# (sync path, async path) pairs, relative to /api/crm/
+ENDPOINTS = [
+    ('creators/', 'async/creators/'),
+    ('dashboard/', 'async/dashboard/'),
+    ('dashboard/health_summary/', 'async/dashboard/health_summary/'),
+    ('dashboard/status_summary/', 'async/dashboard/status_summary/'),
+    ('audit-logs/recent/', 'async/audit-logs/recent/'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare throughput/latency of sync and async read endpoints under concurrency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000')
+        parser.add_argument('--token', default='', help='JWT access token')
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--requests', type=int, default=500, help='Requests per endpoint')
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/') + '/api/crm/'
+        headers = {'Accept': 'application/json'}
+        if options['token']:
+            headers['Authorization'] = f"Bearer {options['token']}"
+
+        self.stdout.write(
+            f"{'endpoint':45} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+        )
+        for sync_path, async_path in ENDPOINTS:
+            for path in (sync_path, async_path):
+                result = self.run_endpoint(
+                    base_url + path,
+                    headers,
+                    options['concurrency'],
+                    options['requests'],
+                )
+                self.stdout.write(
+                    f"{path:45} {result['throughput']:9.1f} {result['p50']:9.1f} "
+                    f"{result['p95']:9.1f} {result['p99']:9.1f} {result['errors']:7d}"
+                )
+
+    def run_endpoint(self, url, headers, concurrency, total_requests):
+        """Issue `total_requests` GETs with `concurrency` workers"""
+
+        def fetch(_):
+            request = urllib.request.Request(url, headers=headers)
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    response.read()
+                    ok = response.status == 200
+            except urllib.error.HTTPError:
+                ok = False
+            except urllib.error.URLError as exc:
+                raise CommandError(f'Cannot reach {url}: {exc.reason}')
+            return time.perf_counter() - started, ok
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(fetch, range(total_requests)))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency * 1000 for latency, _ in results)
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        return {
+            'throughput': total_requests / elapsed,
+            'p50': quantiles[49],
+            'p95': quantiles[94],
+            'p99': quantiles[98],
+            'errors': sum(1 for _, ok in results if not ok),
+        }
@@ -0,0 +1,70 @@
+"""
+Fast serializer check and benchmark
+
+For every viewset using FastListMixin, serializes the same rows with the
+DRF serializer and with its compiled FastSerializer, fails if the rendered
+JSON differs by a single byte, and reports the time each takes (query plus
+serialization) per page.
+
+Usage:
+    python manage.py seed_benchmark --creators 10000
+    python manage.py benchmark_fast_serializers --page-size 50 --iterations 50
+"""
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from studio_crm.urls import router
+from studio_crm.views import FastListMixin
+
+
+class Command(BaseCommand):
+    help = 'Verify fast list serializers match their DRF serializers byte for byte, and time both'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=50)
+        parser.add_argument('--iterations', type=int, default=50)
+
+    def handle(self, *args, **options):
+        page_size = options['page_size']
+        iterations = options['iterations']
+        renderer = JSONRenderer()
+
+        self.stdout.write(f"{'serializer':32} {'rows':>5} {'drf p50':>10} {'fast p50':>10} {'speedup':>8}")
+        for _, viewset_class, _ in router.registry:
+            if not issubclass(viewset_class, FastListMixin) or not viewset_class.fast_actions:
+                continue
+            viewset = viewset_class(action='list', format_kwarg=None)
+            serializer_class = viewset.get_serializer_class()
+            fast_serializer = viewset.get_fast_serializer()
+            # The viewset's own queryset and ordering; get_queryset() needs a request
+            queryset = viewset_class.queryset.order_by(*getattr(viewset_class, 'ordering', None) or ['pk'])
+
+            def drf():
+                return serializer_class(queryset.all()[:page_size], many=True).data
+
+            def fast():
+                return fast_serializer.serialize(queryset.all()[:page_size])
+
+            expected = renderer.render(drf())
+            if renderer.render(fast()) != expected:
+                raise CommandError(f'{serializer_class.__name__}: FastSerializer output differs')
+
+            drf_ms, fast_ms = self.time(drf, iterations), self.time(fast, iterations)
+            self.stdout.write(
+                f'{serializer_class.__name__:32} {len(drf()):5} {drf_ms:8.3f}ms {fast_ms:8.3f}ms '
+                f'{drf_ms / fast_ms:7.1f}x'
+            )
+        self.stdout.write(self.style.SUCCESS('All fast serializers match.'))
+
+    def time(self, function, iterations):
+        """Median milliseconds per call"""
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,82 @@
+"""
+JSON renderer benchmark: DRF's JSONRenderer/JSONParser vs the orjson-backed
+ORJSONRenderer/ORJSONParser (studio_crm/renderers.py)
+
+Serializes pages of real rows (creators through CreatorListSerializer, audit
+logs with their `changes` JSON through AuditLogSerializer) once, then times
+rendering and parsing of the same data with both implementations. Also
+verifies that both renderers produce identical bytes.
+
+Usage:
+    python manage.py seed_benchmark --creators 10000
+    python manage.py benchmark_renderers --page-sizes 50 500 --iterations 200
+"""
+
+import statistics
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from studio_crm.renderers import ORJSONParser, ORJSONRenderer, orjson
+from studio_crm.serializers import AuditLogSerializer, CreatorListSerializer
+from studio_crm.views import AuditLogViewSet, CreatorViewSet
+
+
+class Command(BaseCommand):
+    help = 'Compare DRF JSONRenderer/JSONParser with the orjson-backed renderer and parser'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-sizes', type=int, nargs='+', default=[50, 500])
+        parser.add_argument('--iterations', type=int, default=200)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError('orjson is not installed; ORJSONRenderer is using the stdlib fallback.')
+
+        self.stdout.write(
+            f"{'payload':28} {'bytes':>9} {'json p50':>10} {'orjson p50':>11} {'speedup':>8}"
+        )
+        for page_size in options['page_sizes']:
+            for name, data in self.payloads(page_size):
+                self.compare(name, data, options['iterations'])
+
+    def payloads(self, page_size):
+        """(name, serialized data) for one page of each list endpoint"""
+        creators = CreatorViewSet.queryset[:page_size]
+        audit_logs = AuditLogViewSet.queryset.order_by('-timestamp')[:page_size]
+        if not creators:
+            raise CommandError('No creators; run `manage.py seed_benchmark` first.')
+        yield f'creators x{page_size}', CreatorListSerializer(creators, many=True).data
+        yield f'audit-logs x{page_size}', AuditLogSerializer(audit_logs, many=True).data
+
+    def compare(self, name, data, iterations):
+        stdlib_content = JSONRenderer().render(data)
+        orjson_content = ORJSONRenderer().render(data)
+        if stdlib_content != orjson_content:
+            raise CommandError(f'{name}: ORJSONRenderer output differs from JSONRenderer')
+
+        rendering = [
+            self.time(lambda: JSONRenderer().render(data), iterations),
+            self.time(lambda: ORJSONRenderer().render(data), iterations),
+        ]
+        parsing = [
+            self.time(lambda: JSONParser().parse(BytesIO(stdlib_content)), iterations),
+            self.time(lambda: ORJSONParser().parse(BytesIO(stdlib_content)), iterations),
+        ]
+        for operation, (stdlib_ms, orjson_ms) in (('render', rendering), ('parse', parsing)):
+            self.stdout.write(
+                f'{name + " " + operation:28} {len(stdlib_content):9} {stdlib_ms:8.3f}ms '
+                f'{orjson_ms:9.3f}ms {stdlib_ms / orjson_ms:7.1f}x'
+            )
+
+    def time(self, function, iterations):
+        """Median milliseconds per call"""
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
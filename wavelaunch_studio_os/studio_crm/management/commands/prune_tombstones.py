@@ -0,0 +1,26 @@
+"""
+Delete delta sync tombstones older than TOMBSTONE_RETENTION_DAYS
+
+Deletion tombstones (Tombstone, written by the post_delete signals) are only
+needed until every incremental client has synced past them. Run daily, e.g.
+next to `refresh_overdue_milestones`. Clients that last synced before the
+retention period get 410 from /api/crm/tombstones/ and run a full sync.
+
+Usage:
+    python manage.py prune_tombstones
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from studio_crm.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = 'Delete deletion tombstones older than TOMBSTONE_RETENTION_DAYS (run daily)'
+
+    def handle(self, *args, **options):
+        pruned = Tombstone.prune()
+        self.stdout.write(self.style.SUCCESS(
+            f'Pruned {pruned} tombstones older than {getattr(settings, "TOMBSTONE_RETENTION_DAYS", 90)} days'
+        ))
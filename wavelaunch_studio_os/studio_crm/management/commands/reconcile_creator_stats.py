@@ -0,0 +1,40 @@
+"""
+Rebuild the CreatorStatsSnapshot dashboard summary from Creator
+
+The snapshot is maintained incrementally by signals; run this periodically
+(e.g. nightly cron) and after bulk changes that bypass save()/delete(), such
+as QuerySet.update(), to correct any drift.
+
+Usage:
+    python manage.py reconcile_creator_stats
+"""
+
+from django.core.management.base import BaseCommand
+
+from studio_crm.models import CreatorStatsSnapshot
+
+
+def bucket_key(row):
+    return (row['journey_status'], row['health_score'], row['is_active'])
+
+
+class Command(BaseCommand):
+    help = 'Recompute dashboard creator counts (CreatorStatsSnapshot) from the Creator table'
+
+    def handle(self, *args, **options):
+        before = {bucket_key(row): row['creator_count'] for row in CreatorStatsSnapshot.rows()}
+        after = {bucket_key(row): row['creator_count'] for row in CreatorStatsSnapshot.rebuild()}
+
+        drifted = {
+            bucket for bucket in before.keys() | after.keys()
+            if before.get(bucket, 0) != after.get(bucket, 0)
+        }
+        for bucket in sorted(drifted):
+            self.stdout.write(
+                f"  {' / '.join(map(str, bucket))}: {before.get(bucket, 0)} -> {after.get(bucket, 0)}"
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {len(after)} buckets ({sum(after.values())} creators), '
+            f'{len(drifted)} corrected'
+        ))
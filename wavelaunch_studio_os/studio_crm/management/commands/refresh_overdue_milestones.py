@@ -0,0 +1,41 @@
+"""
+Daily milestone job: overdue counters and health scores
+
+Milestones become overdue by the calendar passing, not by being saved, so
+signals cannot keep overdue_milestone_count current. Run this once a day
+(e.g. a cron entry shortly after midnight UTC):
+- recomputes overdue_milestone_count for every creator in one UPDATE
+- recomputes health scores (which count overdue milestones) in one UPDATE
+- rebuilds the CreatorStatsSnapshot dashboard buckets if any score changed
+
+No per-creator queries are issued, whatever the number of creators. Only
+creators whose counters or score changed are written (and get a new
+updated_at), so delta sync clients fetch just those. Also run it after
+changing settings.HEALTH_RULES to rescore stored health scores.
+
+Usage:
+    python manage.py refresh_overdue_milestones
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from studio_crm.models import Creator, CreatorStatsSnapshot, Milestone
+from studio_crm.response_cache import invalidate_group
+
+
+class Command(BaseCommand):
+    help = 'Recompute overdue milestone counts and creator health scores (run daily)'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            Creator.refresh_counters(fields=['overdue_milestone_count'])
+            rescored = Creator.refresh_health_scores()
+            if rescored:
+                CreatorStatsSnapshot.rebuild()
+            transaction.on_commit(lambda: invalidate_group('dashboard'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{Milestone.overdue().count()} overdue milestones; '
+            f'{rescored} creator health scores changed'
+        ))
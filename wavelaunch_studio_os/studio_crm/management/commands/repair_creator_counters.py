@@ -0,0 +1,36 @@
+"""
+Recompute the denormalized Creator counters
+
+milestone_count, completed_milestone_count, overdue_milestone_count,
+credential_count and active_credential_count are maintained incrementally by
+signals. Run this after bulk changes that bypass save()/delete(). Milestones
+whose target_date has just passed are counted as overdue by the daily
+`refresh_overdue_milestones` job.
+
+Usage:
+    python manage.py repair_creator_counters
+    python manage.py repair_creator_counters --fields overdue_milestone_count
+"""
+
+from django.core.management.base import BaseCommand
+
+from studio_crm.models import Creator
+
+
+class Command(BaseCommand):
+    help = 'Recompute denormalized milestone/credential counters on Creator'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fields',
+            nargs='+',
+            choices=Creator.COUNTER_FIELDS,
+            default=list(Creator.COUNTER_FIELDS),
+            help='Counters to recompute (default: all)',
+        )
+
+    def handle(self, *args, **options):
+        updated = Creator.refresh_counters(fields=options['fields'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Recomputed {', '.join(options['fields'])}; corrected {updated} creators"
+        ))
@@ -0,0 +1,310 @@
+"""
+API benchmark suite
+
+Exercises every endpoint in studio_crm/urls.py in-process (no network) and
+records latency percentiles, SQL query counts, peak Python memory and
+response size. Results are written as JSON so runs on different commits
+(against the same `seed_benchmark` dataset) can be compared.
+
+Write endpoints run inside a transaction that is rolled back, so the
+dataset is unchanged between runs.
+
+Usage:
+    python manage.py seed_benchmark --creators 10000
+    python manage.py run_benchmarks --iterations 30 --output bench-10k.json
+    python manage.py run_benchmarks --compare bench-10k.json
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from contextlib import ExitStack
+from datetime import timedelta
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from studio_crm.health_rules import DEFAULT_HEALTH_RULES
+from studio_crm.models import AIDeliverable, AuditLog, Creator, CreatorCredential, Milestone
+from .seed_benchmark import BENCHMARK_USERNAME
+
+
+# name -> (method, path template, JSON body). Paths are relative to /api/crm/
+# and formatted with sample object ids; {since} is a delta sync timestamp
+# a day ago.
+ENDPOINTS = {
+    'creators.list': ('get', 'creators/', None),
+    'creators.list.filtered': ('get', 'creators/?journey_status=LIVE&health_score=GREEN&ordering=brand_name', None),
+    'creators.list.search': ('get', 'creators/?search=Nova', None),
+    'creators.list.page_10': ('get', 'creators/?page=10', None),
+    'creators.list.updated_since': ('get', 'creators/?updated_since={since}', None),
+    'creators.retrieve': ('get', 'creators/{creator}/', None),
+    'creators.urgent': ('get', 'creators/urgent/', None),
+    'creators.by_status': ('get', 'creators/by_status/', None),
+    'creators.bundle': ('get', 'creators/{creator}/bundle/', None),
+    'creators.batch_get': ('post', 'creators/batch_get/', {'ids': ['{creator}', '{other_creator}']}),
+    'creators.create': ('post', 'creators/', {
+        'creator_name': 'Benchmark Create',
+        'creator_email': 'bench-create@benchmark.wavelaunch.test',
+        'brand_name': 'Benchmark Brand',
+        'brand_niche': 'Tech',
+    }),
+    'creators.partial_update': ('patch', 'creators/{creator}/', {'priority_level': 2}),
+    'creators.update_journey_status': ('post', 'creators/{creator}/update_journey_status/', {
+        'journey_status': 'LAUNCH',
+    }),
+    'creators.destroy': ('delete', 'creators/{creator}/', None),
+    'credentials.list': ('get', 'credentials/', None),
+    'credentials.list.by_creator': ('get', 'credentials/?creator_id={creator}', None),
+    'credentials.list.updated_since': ('get', 'credentials/?updated_since={since}', None),
+    'credentials.retrieve': ('get', 'credentials/{credential}/', None),
+    'credentials.partial_update': ('patch', 'credentials/{credential}/', {'notes': 'benchmark'}),
+    'milestones.list': ('get', 'milestones/', None),
+    'milestones.list.updated_since': ('get', 'milestones/?updated_since={since}', None),
+    'milestones.retrieve': ('get', 'milestones/{milestone}/', None),
+    'milestones.by_creator': ('get', 'milestones/by_creator/?creator_id={creator}', None),
+    'milestones.create': ('post', 'milestones/', {
+        'creator': '{creator}',
+        'title': 'Benchmark Milestone',
+        'related_journey_stage': 'LAUNCH',
+    }),
+    'milestones.mark_complete': ('post', 'milestones/{milestone}/mark_complete/', None),
+    'milestones.overdue': ('get', 'milestones/overdue/', None),
+    'milestones.upcoming': ('get', 'milestones/upcoming/?days=30', None),
+    'audit_logs.list': ('get', 'audit-logs/', None),
+    'audit_logs.list.filtered': ('get', 'audit-logs/?action_type=UPDATE', None),
+    'audit_logs.retrieve': ('get', 'audit-logs/{audit_log}/', None),
+    'audit_logs.recent': ('get', 'audit-logs/recent/', None),
+    'audit_logs.by_creator': ('get', 'audit-logs/by_creator/?creator_id={creator}', None),
+    'deliverables.list': ('get', 'deliverables/', None),
+    'deliverables.list.updated_since': ('get', 'deliverables/?updated_since={since}', None),
+    'deliverables.retrieve': ('get', 'deliverables/{deliverable}/', None),
+    'tombstones.list': ('get', 'tombstones/?deleted_since={since}', None),
+    'status_transitions.list': ('get', 'status-transitions/', None),
+    'status_transitions.funnel': ('get', 'status-transitions/funnel/', None),
+    'status_transitions.funnel.cohort': ('get', 'status-transitions/funnel/?brand_niche=Tech&is_active=true', None),
+    'status_transitions.time_in_stage': ('get', 'status-transitions/time_in_stage/', None),
+    'batch.create': ('post', 'batch/', {'requests': [
+        {'path': 'creators/urgent/'},
+        {'path': 'creators/{creator}/'},
+        {'path': 'milestones/upcoming/?days=7'},
+        {'path': 'dashboard/'},
+    ]}),
+    'dashboard.list': ('get', 'dashboard/', None),
+    'dashboard.health_summary': ('get', 'dashboard/health_summary/', None),
+    'dashboard.status_summary': ('get', 'dashboard/status_summary/', None),
+    'dashboard.health_trend': ('get', 'dashboard/health_trend/?days=90', None),
+    'dashboard.health_trend.by_status': ('get', 'dashboard/health_trend/?days=90&group_by=status', None),
+    # The default rules, so the grid matches whatever HEALTH_RULES is set to
+    'dashboard.health_simulation': ('post', 'dashboard/health_simulation/', {
+        'rules': DEFAULT_HEALTH_RULES,
+        'grid': {'0.idle_days_over': [10, 14, 21], '1.idle_days_over': [30, 45]},
+    }),
+    'async.creators.list': ('get', 'async/creators/', None),
+    'async.creators.retrieve': ('get', 'async/creators/{creator}/', None),
+    'async.dashboard.list': ('get', 'async/dashboard/', None),
+    'async.audit_logs.recent': ('get', 'async/audit-logs/recent/', None),
+}
+
+
+class Rollback(Exception):
+    """Raised to roll back the transaction wrapping a write benchmark"""
+
+
+def percentile(sorted_values, fraction):
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    return statistics.quantiles(sorted_values, n=100, method='inclusive')[int(fraction * 100) - 1]
+
+
+def format_body(body, ids):
+    if isinstance(body, str):
+        return body.format(**ids)
+    if isinstance(body, list):
+        return [format_body(item, ids) for item in body]
+    if isinstance(body, dict):
+        return {key: format_body(value, ids) for key, value in body.items()}
+    return body
+
+
+class Command(BaseCommand):
+    help = 'Benchmark every studio_crm API endpoint (latency, queries, memory)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--only', nargs='+', help='Endpoint names (prefix match)')
+        parser.add_argument('--output', help='Write results JSON to this file')
+        parser.add_argument('--compare', help='Baseline results JSON to compare against')
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=BENCHMARK_USERNAME).first()
+        if user is None:
+            raise CommandError('No benchmark data; run `manage.py seed_benchmark` first.')
+
+        ids = self.sample_ids()
+        host = next((host for host in settings.ALLOWED_HOSTS if host[:1] not in ('*', '.', '')), 'localhost')
+        client = APIClient(HTTP_HOST=host)
+        client.force_authenticate(user)
+
+        endpoints = {
+            name: spec for name, spec in ENDPOINTS.items()
+            if not options['only'] or any(name.startswith(prefix) for prefix in options['only'])
+        }
+
+        results = {}
+        for name, (method, path, body) in endpoints.items():
+            results[name] = self.run_endpoint(
+                client,
+                method,
+                '/api/crm/' + path.format(**ids),
+                format_body(body, ids),
+                options['iterations'],
+                options['warmup'],
+            )
+            self.stdout.write(self.format_row(name, results[name]))
+
+        report = {
+            'meta': {
+                'commit': self.git_commit(),
+                'timestamp': timezone.now().isoformat(),
+                'iterations': options['iterations'],
+                'dataset': {
+                    'creators': Creator.objects.count(),
+                    'milestones': Milestone.objects.count(),
+                    'credentials': CreatorCredential.objects.count(),
+                    'audit_logs': AuditLog.objects.count(),
+                    'deliverables': AIDeliverable.objects.count(),
+                },
+                'database': connections['default'].vendor,
+                'python': platform.python_version(),
+                'django': django.get_version(),
+            },
+            'endpoints': results,
+        }
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+        if options['compare']:
+            with open(options['compare']) as baseline_file:
+                self.compare(json.load(baseline_file), report)
+
+    def sample_ids(self):
+        """A creator with related rows, used to fill path templates"""
+        creator = Creator.objects.filter(milestone_count__gt=0, active_credential_count__gt=0).first()
+        if creator is None:
+            raise CommandError('Dataset has no creator with milestones and credentials.')
+        return {
+            'creator': creator.pk,
+            'other_creator': Creator.objects.exclude(pk=creator.pk).values_list('pk', flat=True).first(),
+            'milestone': creator.milestones.values_list('pk', flat=True).first(),
+            'credential': creator.credentials.values_list('pk', flat=True).first(),
+            'audit_log': AuditLog.objects.values_list('pk', flat=True).first(),
+            'deliverable': AIDeliverable.objects.values_list('pk', flat=True).first(),
+            'since': (timezone.now() - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        }
+
+    def request(self, client, method, path, body):
+        """Issue one request; writes are rolled back"""
+        if method == 'get':
+            return client.get(path)
+
+        response = None
+        try:
+            with transaction.atomic():
+                response = getattr(client, method)(path, body, format='json')
+                raise Rollback()
+        except Rollback:
+            pass
+        return response
+
+    def run_endpoint(self, client, method, path, body, iterations, warmup):
+        for _ in range(warmup):
+            self.request(client, method, path, body)
+
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            response = self.request(client, method, path, body)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        # Query count and memory are measured on separate passes so the
+        # instrumentation does not skew the timings
+        with ExitStack() as stack:
+            captures = [
+                stack.enter_context(CaptureQueriesContext(connections[alias]))
+                for alias in settings.DATABASES
+            ]
+            self.request(client, method, path, body)
+        query_count = sum(len(capture) for capture in captures)
+
+        tracemalloc.start()
+        try:
+            self.request(client, method, path, body)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        timings.sort()
+        return {
+            'method': method.upper(),
+            'path': path,
+            'status': response.status_code,
+            'p50_ms': round(percentile(timings, 0.50), 3),
+            'p90_ms': round(percentile(timings, 0.90), 3),
+            'p99_ms': round(percentile(timings, 0.99), 3),
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'min_ms': round(timings[0], 3),
+            'max_ms': round(timings[-1], 3),
+            'queries': query_count,
+            'peak_memory_kb': round(peak_memory / 1024, 1),
+            'response_bytes': len(response.content),
+        }
+
+    def format_row(self, name, result):
+        return (
+            f"{name:34} {result['status']:4} p50 {result['p50_ms']:9.2f}ms "
+            f"p99 {result['p99_ms']:9.2f}ms  {result['queries']:4} queries "
+            f"{result['peak_memory_kb']:10.1f} KiB  {result['response_bytes']:9} B"
+        )
+
+    def compare(self, baseline, report):
+        """Print p50/query/memory changes against a previous run"""
+        self.stdout.write(
+            f"\nCompared to {baseline['meta'].get('commit') or 'baseline'} "
+            f"({baseline['meta']['dataset']['creators']} creators):"
+        )
+        for name, result in report['endpoints'].items():
+            before = baseline['endpoints'].get(name)
+            if before is None:
+                continue
+            change = (result['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100 if before['p50_ms'] else 0
+            self.stdout.write(
+                f"{name:34} p50 {before['p50_ms']:9.2f} -> {result['p50_ms']:9.2f}ms ({change:+6.1f}%)  "
+                f"queries {before['queries']:4} -> {result['queries']:4}  "
+                f"memory {before['peak_memory_kb']:9.1f} -> {result['peak_memory_kb']:9.1f} KiB"
+            )
+
+    def git_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=settings.BASE_DIR,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,263 @@
+"""
+Seeded synthetic data generator for benchmarks
+
+Creates realistic creators with milestones, credentials, audit log entries
+and AI deliverables. The same --seed and --creators always produce the same
+data, so benchmark runs on different commits are comparable.
+
+Rows are written with bulk_create (signals do not fire); denormalized
+counters and the dashboard snapshot are rebuilt at the end. Run it against
+an empty, dedicated benchmark database.
+
+Usage:
+    python manage.py seed_benchmark --creators 10000 --seed 42
+"""
+
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from studio_crm.models import (
+    AIDeliverable,
+    AuditLog,
+    Creator,
+    CreatorCredential,
+    CreatorStatsSnapshot,
+    JourneyStatus,
+    Milestone,
+)
+
+BENCHMARK_USERNAME = 'benchmark'
+EMAIL_DOMAIN = 'benchmark.wavelaunch.test'
+
+NICHES = [
+    'Fitness', 'Tech', 'Finance', 'Beauty', 'Gaming', 'Food', 'Travel',
+    'Education', 'Fashion', 'Parenting', 'Music', 'Wellness',
+]
+FIRST_NAMES = [
+    'Alex', 'Jordan', 'Sam', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie',
+    'Avery', 'Quinn', 'Rowan', 'Drew', 'Skyler', 'Reese', 'Emerson', 'Kai',
+]
+LAST_NAMES = [
+    'Rivera', 'Chen', 'Patel', 'Okafor', 'Novak', 'Silva', 'Kim', 'Haddad',
+    'Larsen', 'Moreau', 'Tanaka', 'Walsh', 'Gupta', 'Ortiz', 'Berg', 'Adeyemi',
+]
+BRAND_WORDS = [
+    'Peak', 'Nova', 'Pulse', 'Forge', 'Bloom', 'Atlas', 'Echo', 'Summit',
+    'Wild', 'Lumen', 'Orbit', 'Craft', 'Drift', 'Spark', 'Haven', 'Vertex',
+]
+PLATFORMS = [
+    'Instagram Business', 'YouTube Studio', 'TikTok', 'Shopify Admin',
+    'Stripe', 'Mailchimp', 'Google Workspace', 'Notion',
+]
+MILESTONE_TITLES = {
+    JourneyStatus.ONBOARDING: ['Kickoff Call', 'Contract Signed', 'Discovery Questionnaire'],
+    JourneyStatus.BRAND_BUILDING: ['Brand Identity Delivered', 'Logo Approved', 'Website Draft'],
+    JourneyStatus.LAUNCH: ['Launch Plan Approved', 'Pre-launch Campaign', 'Launch Day'],
+    JourneyStatus.LIVE: ['First 1K Subscribers', 'First 100 Orders', 'Monthly Review'],
+    JourneyStatus.PAUSED: ['Pause Review'],
+    JourneyStatus.CLOSED: ['Offboarding Complete'],
+}
+DELIVERABLE_TYPES = [
+    'Brand Guidelines', 'Progress Report', 'Launch Plan',
+    'Strategy Document', 'Social Media Kit', 'Content Calendar',
+]
+
+# Journey status mix of a mature studio
+STATUS_WEIGHTS = {
+    JourneyStatus.ONBOARDING: 12,
+    JourneyStatus.BRAND_BUILDING: 20,
+    JourneyStatus.LAUNCH: 10,
+    JourneyStatus.LIVE: 40,
+    JourneyStatus.PAUSED: 8,
+    JourneyStatus.CLOSED: 10,
+}
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Let bulk_create keep the generated auto_now/auto_now_add values"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = 'Generate a reproducible synthetic dataset for benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--creators', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        if Creator.objects.filter(creator_email__endswith=f'@{EMAIL_DOMAIN}').exists():
+            raise CommandError(
+                'Benchmark data already present; seed an empty database instead.'
+            )
+
+        self.rng = random.Random(options['seed'])
+        self.now = timezone.now()
+        self.batch_size = options['batch_size']
+        self.user, _ = User.objects.get_or_create(
+            username=BENCHMARK_USERNAME,
+            defaults={'email': f'{BENCHMARK_USERNAME}@{EMAIL_DOMAIN}', 'is_staff': True},
+        )
+
+        started = time.perf_counter()
+        totals = {'creators': 0, 'milestones': 0, 'credentials': 0, 'audit_logs': 0, 'deliverables': 0}
+
+        with explicit_timestamps(Creator, CreatorCredential, Milestone, AuditLog, AIDeliverable):
+            for offset in range(0, options['creators'], self.batch_size):
+                count = min(self.batch_size, options['creators'] - offset)
+                with transaction.atomic():
+                    batch = self.seed_batch(offset, count)
+                for key, value in batch.items():
+                    totals[key] += value
+                self.stdout.write(f"  {offset + count}/{options['creators']} creators")
+
+        Creator.refresh_counters()
+        CreatorStatsSnapshot.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(
+            'Seeded ' + ', '.join(f'{value} {key}' for key, value in totals.items())
+            + f' in {time.perf_counter() - started:.1f}s'
+        ))
+
+    def uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def days_ago(self, low, high):
+        return self.now - timedelta(days=self.rng.uniform(low, high))
+
+    def seed_batch(self, offset, count):
+        rng = self.rng
+        statuses = list(STATUS_WEIGHTS)
+        weights = list(STATUS_WEIGHTS.values())
+
+        creators = []
+        for index in range(offset, offset + count):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            created_at = self.days_ago(1, 720)
+            last_status_change = created_at + (self.now - created_at) * rng.random()
+            follow_up = None
+            if rng.random() < 0.4:
+                follow_up = (self.now + timedelta(days=rng.randint(-20, 30))).date()
+            creator = Creator(
+                id=self.uuid(),
+                created_at=created_at,
+                updated_at=last_status_change,
+                created_by=self.user,
+                last_updated_by=self.user,
+                creator_name=f'{first} {last}',
+                creator_email=f'creator{index}@{EMAIL_DOMAIN}',
+                creator_location=rng.choice(['Austin, USA', 'London, UK', 'Lagos, Nigeria', 'Berlin, Germany']),
+                brand_name=f'{rng.choice(BRAND_WORDS)} {rng.choice(BRAND_WORDS)} {index}',
+                brand_niche=rng.choice(NICHES),
+                brand_description='Synthetic benchmark brand. ' * rng.randint(1, 8),
+                journey_status=rng.choices(statuses, weights)[0],
+                last_status_change=last_status_change,
+                priority_level=rng.randint(1, 5),
+                instagram_handle=f'@{first.lower()}{index}',
+                next_follow_up_date=follow_up,
+                last_contacted_date=(last_status_change + timedelta(days=rng.randint(0, 10))).date(),
+                communication_notes='Weekly sync. ' * rng.randint(0, 20),
+                custom_fields={'revenue_tier': rng.choice(['A', 'B', 'C']), 'audience': rng.randint(1000, 2000000)},
+                is_active=rng.random() < 0.9,
+                tags=rng.sample(['VIP', 'High-Revenue', 'Needs-Attention', 'Partner', 'New'], rng.randint(0, 3)),
+            )
+            creator.health_score = creator.calculate_health_score()
+            creators.append(creator)
+        Creator.objects.bulk_create(creators, batch_size=self.batch_size)
+
+        milestones, credentials, audit_logs, deliverables = [], [], [], []
+        for creator in creators:
+            for _ in range(rng.randint(0, 8)):
+                stage = rng.choice(statuses)
+                target_date = (creator.created_at + timedelta(days=rng.randint(7, 365))).date()
+                is_completed = target_date < self.now.date() and rng.random() < 0.7
+                milestones.append(Milestone(
+                    id=self.uuid(),
+                    creator=creator,
+                    created_at=creator.created_at,
+                    updated_at=creator.created_at,
+                    title=rng.choice(MILESTONE_TITLES[stage]),
+                    description='Milestone details. ' * rng.randint(0, 5),
+                    target_date=target_date,
+                    completed_date=target_date if is_completed else None,
+                    is_completed=is_completed,
+                    related_journey_stage=stage,
+                ))
+
+            for platform in rng.sample(PLATFORMS, rng.randint(0, 4)):
+                credentials.append(CreatorCredential(
+                    id=self.uuid(),
+                    creator=creator,
+                    created_at=creator.created_at,
+                    updated_at=creator.created_at,
+                    created_by=self.user,
+                    platform_name=platform,
+                    account_identifier=creator.creator_email,
+                    login_url='https://example.com/login',
+                    password=f'bench-{rng.getrandbits(48):x}',
+                    is_active=rng.random() < 0.85,
+                ))
+
+            for _ in range(rng.randint(1, 8)):
+                audit_logs.append(AuditLog(
+                    id=self.uuid(),
+                    timestamp=self.days_ago(0, (self.now - creator.created_at).days + 1),
+                    user=self.user,
+                    user_email=self.user.email,
+                    ip_address='10.0.0.1',
+                    action_type=rng.choice(['CREATE', 'UPDATE', 'UPDATE', 'UPDATE', 'VIEW_CREDENTIAL']),
+                    target_model='Creator',
+                    target_id=creator.id,
+                    target_display=str(creator),
+                    changes={'journey_status': {'from': 'ONBOARDING', 'to': creator.journey_status}},
+                    notes='Creator/brand record updated',
+                ))
+
+            for _ in range(rng.choice([0, 0, 1, 2])):
+                created_at = self.days_ago(0, 180)
+                deliverables.append(AIDeliverable(
+                    id=self.uuid(),
+                    creator=creator,
+                    created_at=created_at,
+                    updated_at=created_at,
+                    created_by=self.user,
+                    deliverable_type=rng.choice(DELIVERABLE_TYPES),
+                    prompt_used='Generate a document for {brand_name}',
+                    context_data={'brand_name': creator.brand_name, 'niche': creator.brand_niche},
+                    generated_content='Generated content. ' * rng.randint(20, 200),
+                    status=rng.choice(['COMPLETED', 'COMPLETED', 'COMPLETED', 'FAILED', 'PENDING']),
+                ))
+
+        Milestone.objects.bulk_create(milestones, batch_size=self.batch_size)
+        CreatorCredential.objects.bulk_create(credentials, batch_size=self.batch_size)
+        AuditLog.objects.bulk_create(audit_logs, batch_size=self.batch_size)
+        AIDeliverable.objects.bulk_create(deliverables, batch_size=self.batch_size)
+
+        return {
+            'creators': len(creators),
+            'milestones': len(milestones),
+            'credentials': len(credentials),
+            'audit_logs': len(audit_logs),
+            'deliverables': len(deliverables),
+        }
@@ -0,0 +1,98 @@
+"""
+Health rule what-if simulation
+
+Loads every creator once and reports how the health score distribution
+would change under each combination of candidate rule parameters (see
+studio_crm/health_simulation.py), with example creators per transition.
+Nothing is written.
+
+Usage:
+    python manage.py simulate_health_rules --grid '{"0.idle_days_over": [10, 14, 21], "4.follow_up_overdue": [true, false]}'
+    python manage.py simulate_health_rules --rules candidate_rules.json --grid grid.json --verify
+    python manage.py simulate_health_rules --grid grid.json --json > simulation.json
+"""
+
+import json
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from studio_crm.health_rules import HealthRules, active_health_rules
+from studio_crm.health_simulation import SCORES, HealthSimulation
+
+
+def load_json(value):
+    """JSON given inline or as a file path"""
+    if value.lstrip()[:1] in ('{', '['):
+        return json.loads(value)
+    with open(value) as json_file:
+        return json.load(json_file)
+
+
+class Command(BaseCommand):
+    help = 'Show how health scores would change under candidate health rule parameters'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grid', default='{}', help='Parameter grid, JSON or a JSON file')
+        parser.add_argument('--rules', help='Base rule set, JSON or a JSON file (default: settings.HEALTH_RULES)')
+        parser.add_argument('--examples', type=int, default=3, help='Example creators per transition')
+        parser.add_argument('--verify', action='store_true', help='Check vectorized scores against HealthRules.evaluate')
+        parser.add_argument('--json', action='store_true', help='Print the full result as JSON')
+
+    def handle(self, *args, **options):
+        try:
+            base_rules = HealthRules(load_json(options['rules'])) if options['rules'] else active_health_rules()
+            grid = load_json(options['grid'])
+        except (OSError, ValueError, ImproperlyConfigured) as error:
+            raise CommandError(f'Invalid rules or grid: {error}')
+        if not isinstance(grid, dict):
+            raise CommandError('The grid must be a JSON object')
+
+        started = time.perf_counter()
+        simulation = HealthSimulation.load()
+        load_ms = (time.perf_counter() - started) * 1000
+
+        try:
+            result = simulation.run(base_rules, grid, examples=options['examples'])
+        except ImproperlyConfigured as error:
+            raise CommandError(str(error))
+
+        if options['json']:
+            self.stdout.write(json.dumps(result, indent=2))
+        else:
+            self.report(result)
+        self.stderr.write(
+            f"Loaded {result['creators']} creators in {load_ms:.0f}ms; simulated {result['combinations']} "
+            f"combinations over {result['groups']} groups in {result['elapsed_ms']:.1f}ms"
+        )
+
+        if options['verify']:
+            mismatches = simulation.verify(base_rules, grid)
+            if mismatches:
+                raise CommandError(
+                    f'{len(mismatches)} vectorized score(s) differ from HealthRules.evaluate:\n'
+                    + '\n'.join(mismatches[:20])
+                )
+            self.stderr.write(self.style.SUCCESS('Vectorized scores match HealthRules.evaluate.'))
+
+    def report(self, result):
+        def distribution(counts, change=None):
+            return ' '.join(
+                f"{str(counts[score]) + (f' ({change[score]:+d})' if change else ''):>16}"
+                for score in SCORES
+            )
+
+        self.stdout.write(f"{'parameters':48} " + ' '.join(f'{score:>16}' for score in SCORES) + f" {'changed':>8}")
+        self.stdout.write(f"{'(base rules)':48} {distribution(result['baseline'])}")
+        for row in result['results']:
+            parameters = ', '.join(f'{key}={json.dumps(value)}' for key, value in row['parameters'].items())
+            self.stdout.write(
+                f"{parameters or '(base rules)':48} {distribution(row['distribution'], row['change'])} "
+                f"{row['changed']:>8}"
+            )
+            for transition in row['transitions']:
+                self.stdout.write(
+                    f"    {transition['from']} -> {transition['to']}: {transition['count']}"
+                    + (f" (e.g. {', '.join(transition['examples'])})" if transition['examples'] else '')
+                )
@@ -0,0 +1,45 @@
+"""
+Record today's creator health scores for the health trend chart
+
+Writes one HealthHistory row per creator for the day (bulk inserts, in
+batches), aggregates them into the day's HealthRollup rows read by
+/api/crm/dashboard/health_trend/, and prunes history older than
+HEALTH_HISTORY_RETENTION_DAYS. Run daily, after `refresh_overdue_milestones`
+so stored scores are current. Re-running on the same day replaces that
+day's rows.
+
+Usage:
+    python manage.py snapshot_health_history
+    python manage.py snapshot_health_history --date 2024-01-31 --batch-size 10000
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from studio_crm.models import HealthHistory, HealthRollup
+
+
+class Command(BaseCommand):
+    help = 'Record the daily health score history and trend rollups (run daily)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='Day to record the current scores as (YYYY-MM-DD, default today)')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        try:
+            day = date.fromisoformat(options['date']) if options['date'] else timezone.now().date()
+        except ValueError:
+            raise CommandError('--date must be YYYY-MM-DD')
+
+        written = HealthHistory.capture(day, batch_size=options['batch_size'])
+        buckets = HealthRollup.rebuild_day(day)
+        pruned = HealthHistory.prune()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Recorded {written} creators for {day} in {len(buckets)} rollup rows; pruned {pruned} history rows '
+            f'older than {getattr(settings, "HEALTH_HISTORY_RETENTION_DAYS", 400)} days'
+        ))
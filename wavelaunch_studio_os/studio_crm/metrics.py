@@ -0,0 +1,229 @@
+"""
+Prometheus metrics for Studio CRM
+Request rates and latency, cache hit rates, audit writes, health score
+computation and AI deliverable pipeline state
+
+Exposed at /metrics in the Prometheus text format. Scrapes must present
+`Authorization: Bearer <METRICS_TOKEN>`, or come from a logged-in staff user.
+
+Multiprocess (gunicorn): set PROMETHEUS_MULTIPROC_DIR to an empty directory
+writable by all workers, and clear it on deploy. Each worker then writes its
+samples there and /metrics aggregates all workers, whichever one serves the
+scrape. Add to gunicorn.conf.py:
+
+    from prometheus_client import multiprocess
+
+    def child_exit(server, worker):
+        multiprocess.mark_process_dead(worker.pid)
+"""
+
+import hmac
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.models import Count
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from .profiling import count_queries
+
+# === API requests ===
+
+HTTP_REQUESTS = Counter(
+    'wlos_http_requests_total',
+    'HTTP requests served, by URL name',
+    ['method', 'view', 'status'],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    'wlos_http_request_duration_seconds',
+    'Time to serve an HTTP request',
+    ['method', 'view'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_REQUEST_QUERIES = Histogram(
+    'wlos_http_request_queries',
+    'SQL queries issued per HTTP request',
+    ['method', 'view'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+
+# === Caches ===
+
+CACHE_REQUESTS = Counter(
+    'wlos_cache_requests_total',
+    'Cache lookups, by cache and result (hit/miss)',
+    ['cache', 'result'],
+)
+
+# === Audit log (Epic 0.4) ===
+
+AUDIT_WRITES = Counter(
+    'wlos_audit_writes_total',
+    'Audit log entries written',
+    ['target_model', 'action_type'],
+)
+AUDIT_WRITE_DURATION = Histogram(
+    'wlos_audit_write_duration_seconds',
+    'Time to insert one audit log entry',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+AUDIT_WRITE_LAG = Histogram(
+    'wlos_audit_write_lag_seconds',
+    'Time from the start of a request to an audit entry it caused being written',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+# === Health score (Story 2.3) ===
+
+HEALTH_SCORE_COMPUTATIONS = Counter(
+    'wlos_health_score_computations_total',
+    'Creator health score computations, by resulting score',
+    ['health_score'],
+)
+HEALTH_SCORE_DURATION = Histogram(
+    'wlos_health_score_duration_seconds',
+    'Time to compute one creator health score',
+    buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.001, 0.01),
+)
+
+# === AI deliverables (Epic 3) ===
+
+DELIVERABLE_TRANSITIONS = Counter(
+    'wlos_deliverable_status_transitions_total',
+    'AI deliverable status changes (from_status NONE = created)',
+    ['from_status', 'to_status'],
+)
+
+# Deliverable states that are still waiting on generation
+QUEUED_DELIVERABLE_STATUSES = ['PENDING', 'GENERATING']
+
+
+def record_cache_lookup(cache_name, hit):
+    CACHE_REQUESTS.labels(cache_name, 'hit' if hit else 'miss').inc()
+
+
+def record_audit_write(request, target_model, action_type, duration):
+    AUDIT_WRITES.labels(target_model, action_type).inc()
+    AUDIT_WRITE_DURATION.observe(duration)
+    started = getattr(request, 'metrics_started', None)
+    if started is not None:
+        AUDIT_WRITE_LAG.observe(time.perf_counter() - started)
+
+
+class DeliverableQueueCollector:
+    """Deliverable queue depth, read from the database at scrape time"""
+
+    def gauge(self):
+        return GaugeMetricFamily(
+            'wlos_deliverable_queue_depth',
+            'AI deliverables waiting on generation, by status',
+            labels=['status'],
+        )
+
+    def describe(self):
+        yield self.gauge()
+
+    def collect(self):
+        from .models import AIDeliverable
+
+        depth = dict.fromkeys(QUEUED_DELIVERABLE_STATUSES, 0)
+        depth.update(
+            AIDeliverable.objects
+            .filter(status__in=QUEUED_DELIVERABLE_STATUSES)
+            .order_by()
+            .values_list('status')
+            .annotate(n=Count('pk'))
+        )
+
+        gauge = self.gauge()
+        for status, count in depth.items():
+            gauge.add_metric([status], count)
+        yield gauge
+
+
+# Collected per scrape by the serving process only (never aggregated
+# across workers - it is a database read, not process state)
+DATABASE_REGISTRY = CollectorRegistry()
+DATABASE_REGISTRY.register(DeliverableQueueCollector())
+
+
+def metrics_authorized(request):
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        expected = f'Bearer {token}'
+        if hmac.compare_digest(request.META.get('HTTP_AUTHORIZATION', '').encode(), expected.encode()):
+            return True
+    user = getattr(request, 'user', None)
+    return user is not None and user.is_authenticated and user.is_staff
+
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint
+    GET /metrics
+    """
+    if not metrics_authorized(request):
+        return HttpResponse('Forbidden\n', status=403, content_type='text/plain')
+
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    output = generate_latest(registry) + generate_latest(DATABASE_REGISTRY)
+    return HttpResponse(output, content_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """
+    Middleware recording request counts, latency and query counts per URL name
+    Add at the top of MIDDLEWARE
+
+    Sync and async capable, like AuditMiddleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request.metrics_started = time.perf_counter()
+        with count_queries() as queries:
+            response = self.get_response(request)
+        self.record(request, response, len(queries))
+        return response
+
+    async def __acall__(self, request):
+        request.metrics_started = time.perf_counter()
+        with count_queries() as queries:
+            response = await self.get_response(request)
+        self.record(request, response, len(queries))
+        return response
+
+    def record(self, request, response, query_count):
+        # URL names keep label cardinality bounded (no ids in paths)
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match is not None else 'unmatched'
+        HTTP_REQUESTS.labels(request.method, view, str(response.status_code)).inc()
+        HTTP_REQUEST_DURATION.labels(request.method, view).observe(
+            time.perf_counter() - request.metrics_started
+        )
+        HTTP_REQUEST_QUERIES.labels(request.method, view).observe(query_count)
@@ -7,12 +7,16 @@ Story 1.3: 24+ custom fields for comprehensive tracking
 Story 1.4: Secure credential vault with encryption
 """
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import User
 from django.core.validators import URLValidator, EmailValidator
 from django.utils import timezone
 from encrypted_model_fields.fields import EncryptedCharField, EncryptedTextField
 import uuid
+from operator import itemgetter
+
+from .metrics import HEALTH_SCORE_COMPUTATIONS, HEALTH_SCORE_DURATION
 
 
 class JourneyStatus(models.TextChoices):
@@ -49,7 +53,7 @@ class Creator(models.Model):
     # Primary Identity
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # delta sync (?updated_since=)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='creators_created')
     last_updated_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='creators_updated')
 
@@ -134,6 +138,23 @@ class Creator(models.Model):
         help_text="Tags for filtering (e.g., ['VIP', 'High-Revenue', 'Needs-Attention'])"
     )
 
+    # === DENORMALIZED COUNTERS (Story 2.1) ===
+    # Maintained with F() updates by the Milestone/CreatorCredential signals;
+    # `manage.py repair_creator_counters` recomputes them.
+    milestone_count = models.IntegerField(default=0, editable=False)
+    completed_milestone_count = models.IntegerField(default=0, editable=False)
+    overdue_milestone_count = models.IntegerField(default=0, editable=False)
+    credential_count = models.IntegerField(default=0, editable=False)
+    active_credential_count = models.IntegerField(default=0, editable=False)
+
+    COUNTER_FIELDS = (
+        'milestone_count',
+        'completed_milestone_count',
+        'overdue_milestone_count',
+        'credential_count',
+        'active_credential_count',
+    )
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Creator/Brand"
@@ -149,34 +170,141 @@ class Creator(models.Model):
 
     def save(self, *args, **kwargs):
         """Auto-update health score on save based on business logic"""
-        self.health_score = self.calculate_health_score()
+        if self.last_status_change is None:
+            # New creator: auto_now_add only fills this in after save() starts
+            self.last_status_change = timezone.now()
+        with HEALTH_SCORE_DURATION.time():
+            self.health_score = self.calculate_health_score()
+        HEALTH_SCORE_COMPUTATIONS.labels(self.health_score).inc()
+
+        # Counter columns are only written with F() updates; never overwrite
+        # them from a possibly stale instance
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+
         super().save(*args, **kwargs)
 
+    @classmethod
+    def refresh_counters(cls, queryset=None, fields=COUNTER_FIELDS):
+        """
+        Recompute denormalized counters from Milestone/CreatorCredential in a
+        single UPDATE (correlated subqueries, no per-creator queries), touching
+        only creators whose counters changed. Returns the number of creators
+        updated.
+        """
+        today = timezone.now().date()
+        milestones = Milestone.objects.filter(creator=models.OuterRef('pk'))
+        sources = {
+            'milestone_count': milestones,
+            'completed_milestone_count': milestones.filter(is_completed=True),
+            'overdue_milestone_count': milestones.filter(is_completed=False, target_date__lt=today),
+            'credential_count': CreatorCredential.objects.filter(creator=models.OuterRef('pk')),
+            'active_credential_count': CreatorCredential.objects.filter(
+                creator=models.OuterRef('pk'),
+                is_active=True
+            ),
+        }
+
+        def count_of(related):
+            return Coalesce(
+                models.Subquery(
+                    related.order_by().values('creator').annotate(n=models.Count('pk')).values('n')
+                ),
+                0
+            )
+
+        counts = {field: count_of(sources[field]) for field in fields}
+        changed = models.Q()
+        for field, count in counts.items():
+            changed |= ~models.Q(**{field: count})
+
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.filter(changed).update(**counts, updated_at=timezone.now())
+
+    @classmethod
+    def adjust_counters(cls, creator_id, deltas):
+        """Atomically apply counter deltas ({field: +n/-n}) to one creator"""
+        cls.adjust_counters_many({creator_id: deltas})
+
+    @classmethod
+    def adjust_counters_many(cls, deltas_by_creator):
+        """
+        adjust_counters() for several creators ({creator_id: deltas}) in a
+        single UPDATE, e.g. a milestone moving to another creator
+        """
+        deltas_by_creator = {
+            creator_id: {field: delta for field, delta in deltas.items() if delta}
+            for creator_id, deltas in deltas_by_creator.items()
+            if creator_id
+        }
+        deltas_by_creator = {creator_id: deltas for creator_id, deltas in deltas_by_creator.items() if deltas}
+        if not deltas_by_creator:
+            return
+
+        fields = {field for deltas in deltas_by_creator.values() for field in deltas}
+        if len(deltas_by_creator) == 1:
+            [deltas] = deltas_by_creator.values()
+            changes = {field: models.F(field) + deltas.get(field, 0) for field in fields}
+        else:
+            changes = {
+                field: models.F(field) + models.Case(
+                    *[
+                        models.When(pk=creator_id, then=models.Value(deltas.get(field, 0)))
+                        for creator_id, deltas in deltas_by_creator.items()
+                    ],
+                    default=models.Value(0),
+                    output_field=models.IntegerField(),
+                )
+                for field in fields
+            }
+        cls.objects.filter(pk__in=list(deltas_by_creator)).update(**changes, updated_at=timezone.now())
+
     def calculate_health_score(self):
         """
         Story 2.3: Health score calculation logic
-        Based on last status change age and journey stage
+        Based on last status change age and journey stage; the thresholds are
+        the configured rule set (see health_rules.py)
         """
-        from datetime import timedelta
+        from .health_rules import active_health_rules
 
-        days_since_update = (timezone.now() - self.last_status_change).days
+        return active_health_rules().evaluate(self)
 
-        # Red flags (urgent attention needed)
-        if days_since_update > 14 and self.journey_status in ['ONBOARDING', 'BRAND_BUILDING']:
-            return HealthScore.RED
-        if days_since_update > 30:
-            return HealthScore.RED
-        if self.journey_status == 'PAUSED' and days_since_update > 7:
-            return HealthScore.YELLOW
+    @classmethod
+    def health_score_expression(cls, now=None):
+        """
+        calculate_health_score() as a SQL CASE, compiled from the same rule
+        set, for recomputing or annotating many creators at once
+        """
+        from .health_rules import active_health_rules
 
-        # Yellow flags (needs attention soon)
-        if days_since_update > 7 and self.journey_status in ['ONBOARDING', 'BRAND_BUILDING']:
-            return HealthScore.YELLOW
-        if self.next_follow_up_date and self.next_follow_up_date < timezone.now().date():
-            return HealthScore.YELLOW
+        return active_health_rules().expression(now)
 
-        # Green (on track)
-        return HealthScore.GREEN
+    @classmethod
+    def live_health_rows(cls, queryset=None):
+        """
+        Creator rows (values) whose `health_score` is computed by the rules at
+        query time rather than read from the stored column; filters, ordering
+        and values() on the result all see the live score
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.values('pk').annotate(health_score=cls.health_score_expression())
+
+    @classmethod
+    def refresh_health_scores(cls, queryset=None):
+        """
+        Story 2.3: Recompute health scores in a single UPDATE, touching only
+        creators whose score changed. Returns the number of creators updated.
+        CreatorStatsSnapshot is not adjusted; rebuild it afterwards.
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        expression = cls.health_score_expression()
+        return queryset.exclude(health_score=expression).update(
+            health_score=expression,
+            updated_at=timezone.now(),
+        )
 
 
 class CreatorCredential(models.Model):
@@ -190,7 +318,7 @@ class CreatorCredential(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     creator = models.ForeignKey(Creator, on_delete=models.CASCADE, related_name='credentials')
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # delta sync (?updated_since=)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
 
     # Credential Identification
@@ -224,6 +352,10 @@ class CreatorCredential(models.Model):
     def __str__(self):
         return f"{self.creator.brand_name} - {self.platform_name} ({self.account_identifier})"
 
+    def counter_contribution(self):
+        """Story 1.4: What this credential adds to its creator's counters"""
+        return {'credential_count': 1, 'active_credential_count': int(self.is_active)}
+
 
 class Milestone(models.Model):
     """
@@ -234,6 +366,7 @@ class Milestone(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     creator = models.ForeignKey(Creator, on_delete=models.CASCADE, related_name='milestones')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # delta sync (?updated_since=)
 
     title = models.CharField(max_length=200, help_text="E.g., 'Brand Identity Delivered', 'First 1K Subscribers'")
     description = models.TextField(blank=True)
@@ -252,11 +385,55 @@ class Milestone(models.Model):
         ordering = ['target_date', '-is_completed']
         verbose_name = "Milestone"
         verbose_name_plural = "Milestones"
+        indexes = [
+            # Overdue / upcoming reviews only ever look at open milestones
+            models.Index(
+                fields=['target_date'],
+                condition=models.Q(is_completed=False),
+                name='milestone_open_target_idx',
+            ),
+            models.Index(
+                fields=['creator', 'target_date'],
+                condition=models.Q(is_completed=False),
+                name='milestone_open_creator_idx',
+            ),
+        ]
 
     def __str__(self):
         status = "✓" if self.is_completed else "○"
         return f"{status} {self.title} - {self.creator.brand_name}"
 
+    @classmethod
+    def overdue(cls, today=None):
+        """Open milestones whose target date has passed"""
+        today = today or timezone.now().date()
+        return cls.objects.filter(is_completed=False, target_date__lt=today)
+
+    @classmethod
+    def upcoming(cls, days, today=None):
+        """Open milestones due within the next `days` days (today included)"""
+        from datetime import timedelta
+
+        today = today or timezone.now().date()
+        return cls.objects.filter(
+            is_completed=False,
+            target_date__gte=today,
+            target_date__lte=today + timedelta(days=days),
+        )
+
+    def counter_contribution(self):
+        """Story 2.1: What this milestone adds to its creator's counters"""
+        is_overdue = (
+            not self.is_completed
+            and self.target_date is not None
+            and self.target_date < timezone.now().date()
+        )
+        return {
+            'milestone_count': 1,
+            'completed_milestone_count': int(self.is_completed),
+            'overdue_milestone_count': int(is_overdue),
+        }
+
 
 class AuditLog(models.Model):
     """
@@ -300,12 +477,46 @@ class AuditLog(models.Model):
         indexes = [
             models.Index(fields=['-timestamp', 'action_type']),
             models.Index(fields=['user', '-timestamp']),
+            # Story 1.2: a creator's recent history (profile bundle, by_creator)
+            models.Index(fields=['target_id', '-timestamp']),
         ]
 
     def __str__(self):
         return f"{self.timestamp.strftime('%Y-%m-%d %H:%M')} - {self.user_email} - {self.action_type} on {self.target_display}"
 
 
+class StatusTransition(models.Model):
+    """
+    Story 2.2: Journey status history
+    One row per journey_status a creator enters: its initial status
+    (from_status empty) and every change after. Written by the Creator
+    post_save signal; history from before it existed is recovered from the
+    audit log by `manage.py backfill_status_transitions`.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    creator = models.ForeignKey(Creator, on_delete=models.CASCADE, related_name='status_transitions')
+    from_status = models.CharField(max_length=20, choices=JourneyStatus.choices, blank=True, null=True)
+    to_status = models.CharField(max_length=20, choices=JourneyStatus.choices)
+    transitioned_at = models.DateTimeField(default=timezone.now)
+    changed_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    # The audit entry a backfilled transition was parsed from (backfill is idempotent)
+    audit_log = models.OneToOneField(
+        AuditLog, on_delete=models.SET_NULL, null=True, blank=True, related_name='status_transition'
+    )
+
+    class Meta:
+        ordering = ['transitioned_at']
+        indexes = [
+            # A creator's history in order (time-in-stage window)
+            models.Index(fields=['creator', 'transitioned_at']),
+            models.Index(fields=['to_status', 'transitioned_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.creator_id}: {self.from_status or '-'} -> {self.to_status} at {self.transitioned_at:%Y-%m-%d %H:%M}"
+
+
 class AIDeliverable(models.Model):
     """
     Epic 3: Automated Deliverable Generation
@@ -315,6 +526,7 @@ class AIDeliverable(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     creator = models.ForeignKey(Creator, on_delete=models.CASCADE, related_name='deliverables')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # delta sync (?updated_since=)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
 
     # Deliverable Type
@@ -352,3 +564,349 @@ class AIDeliverable(models.Model):
 
     def __str__(self):
         return f"{self.deliverable_type} for {self.creator.brand_name} - {self.status}"
+
+
+class CreatorStatsSnapshot(models.Model):
+    """
+    Epic 0.3: Materialized dashboard summary
+    Creator counts per (journey_status, health_score, is_active) bucket.
+
+    Kept up to date incrementally by the Creator save/delete signals
+    (+1/-1 as creators move between buckets) and rebuilt from scratch by
+    `manage.py reconcile_creator_stats`. The dashboard reads these few rows
+    instead of scanning Creator. Every bucket has a row, empty ones
+    included, so each signal update is a single UPDATE.
+    """
+
+    journey_status = models.CharField(max_length=20, choices=JourneyStatus.choices)
+    health_score = models.CharField(max_length=10, choices=HealthScore.choices)
+    is_active = models.BooleanField()
+    creator_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Creator Stats Snapshot"
+        verbose_name_plural = "Creator Stats Snapshots"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['journey_status', 'health_score', 'is_active'],
+                name='unique_creator_stats_bucket',
+            ),
+        ]
+
+    def __str__(self):
+        active = 'active' if self.is_active else 'inactive'
+        return f"{self.journey_status} / {self.health_score} / {active}: {self.creator_count}"
+
+    @staticmethod
+    def bucket_for(creator):
+        """Bucket key of a Creator instance"""
+        return {
+            'journey_status': creator.journey_status,
+            'health_score': creator.health_score,
+            'is_active': creator.is_active,
+        }
+
+    @staticmethod
+    def all_buckets():
+        """Every (journey_status, health_score, is_active) combination"""
+        return [
+            {'journey_status': status, 'health_score': score, 'is_active': is_active}
+            for status in JourneyStatus.values
+            for score in HealthScore.values
+            for is_active in (True, False)
+        ]
+
+    @classmethod
+    def ensure_buckets(cls, using='default'):
+        """Create the missing bucket rows (empty); run after migrate"""
+        cls.objects.using(using).bulk_create([cls(**bucket) for bucket in cls.all_buckets()], ignore_conflicts=True)
+
+    @classmethod
+    def adjust(cls, bucket, delta):
+        """Atomically add `delta` to a bucket's count"""
+        cls._apply(models.Q(**bucket), models.Value(delta), rows=1)
+
+    @classmethod
+    def move(cls, old_bucket, new_bucket):
+        """Move one creator from `old_bucket` to `new_bucket` in one UPDATE"""
+        cls._apply(
+            models.Q(**old_bucket) | models.Q(**new_bucket),
+            models.Case(models.When(models.Q(**old_bucket), then=models.Value(-1)), default=models.Value(1)),
+            rows=2,
+        )
+
+    @classmethod
+    def _apply(cls, buckets, delta, rows):
+        """Add `delta` to the `rows` bucket rows matching `buckets`"""
+        def update(change):
+            return cls.objects.filter(buckets).update(creator_count=change, updated_at=timezone.now())
+
+        if update(models.F('creator_count') + delta) < rows:
+            # A bucket row is missing (ensure_buckets() not run since the
+            # table was emptied): undo, create every bucket, redo
+            update(models.F('creator_count') - delta)
+            cls.ensure_buckets()
+            update(models.F('creator_count') + delta)
+
+    @classmethod
+    def rebuild(cls):
+        """Full reconciliation: recompute every bucket from Creator"""
+        with transaction.atomic():
+            buckets = list(
+                Creator.objects.order_by()
+                .values('journey_status', 'health_score', 'is_active')
+                .annotate(creator_count=models.Count('id'))
+            )
+            cls.objects.all().delete()
+            # Empty buckets get a row too (see _apply())
+            key = itemgetter('journey_status', 'health_score', 'is_active')
+            counts = {key(bucket): bucket['creator_count'] for bucket in buckets}
+            cls.objects.bulk_create([
+                cls(**bucket, creator_count=counts.get(key(bucket), 0))
+                for bucket in cls.all_buckets()
+            ])
+        return buckets
+
+    @classmethod
+    def rows(cls):
+        """
+        Snapshot rows as consumed by summarize(). With live health scores
+        (HEALTH_SCORE_SOURCE = 'live') the same buckets are grouped from
+        Creator instead, since stored scores may be stale.
+        """
+        from .health_rules import health_score_is_live
+
+        if health_score_is_live():
+            return (
+                Creator.live_health_rows()
+                .values('journey_status', 'health_score', 'is_active')
+                .annotate(creator_count=models.Count('pk'))
+                .order_by()
+            )
+        return cls.objects.values('journey_status', 'health_score', 'is_active', 'creator_count')
+
+    @staticmethod
+    def summarize(rows):
+        """
+        Fold snapshot rows into the dashboard counters: totals, per journey
+        status and per health score (same keys as DashboardStatsSerializer).
+        """
+        counts = {
+            'total_creators': 0,
+            'active_creators': 0,
+            **{f'{status.lower()}_count': 0 for status in JourneyStatus.values},
+            **{f'{score.lower()}_health_count': 0 for score in HealthScore.values},
+        }
+        for row in rows:
+            count = row['creator_count']
+            counts['total_creators'] += count
+            if row['is_active']:
+                counts['active_creators'] += count
+            counts[f"{row['journey_status'].lower()}_count"] += count
+            counts[f"{row['health_score'].lower()}_health_count"] += count
+        return counts
+
+    @classmethod
+    def dashboard_counts(cls):
+        """Dashboard counters read from the snapshot (a handful of rows)"""
+        return cls.summarize(cls.rows())
+
+
+class HealthHistory(models.Model):
+    """
+    Story 2.3: Daily health score history
+    One compact row per creator per day (health score, journey status,
+    active flag), written in bulk by `manage.py snapshot_health_history`.
+    Rows older than HEALTH_HISTORY_RETENTION_DAYS are pruned; the
+    HealthRollup rows aggregated from them are kept.
+    """
+
+    date = models.DateField()
+    creator_id = models.UUIDField()
+    journey_status = models.CharField(max_length=20, choices=JourneyStatus.choices)
+    health_score = models.CharField(max_length=10, choices=HealthScore.choices)
+    is_active = models.BooleanField()
+
+    class Meta:
+        ordering = ['date']
+        verbose_name_plural = "Health history"
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'creator_id'], name='unique_health_history_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.creator_id}: {self.health_score}"
+
+    @classmethod
+    def capture(cls, date, batch_size=5000):
+        """
+        Record every creator's current state as of `date`, replacing rows
+        already captured for that day. Health scores are the ones the API
+        shows (computed live with HEALTH_SCORE_SOURCE = 'live').
+        Returns the number of rows written.
+        """
+        from .health_rules import health_score_is_live
+
+        creators = Creator.live_health_rows() if health_score_is_live() else Creator.objects.all()
+        rows = creators.order_by().values_list('pk', 'journey_status', 'health_score', 'is_active')
+
+        written = 0
+        with transaction.atomic():
+            cls.objects.filter(date=date).delete()
+            batch = []
+            for creator_id, journey_status, health_score, is_active in rows.iterator(chunk_size=batch_size):
+                batch.append(cls(
+                    date=date,
+                    creator_id=creator_id,
+                    journey_status=journey_status,
+                    health_score=health_score,
+                    is_active=is_active,
+                ))
+                if len(batch) >= batch_size:
+                    cls.objects.bulk_create(batch)
+                    written += len(batch)
+                    batch = []
+            cls.objects.bulk_create(batch)
+            written += len(batch)
+        return written
+
+    @staticmethod
+    def horizon():
+        """Oldest day of raw history kept"""
+        from datetime import timedelta
+        from django.conf import settings
+
+        return timezone.now().date() - timedelta(days=getattr(settings, 'HEALTH_HISTORY_RETENTION_DAYS', 400))
+
+    @classmethod
+    def prune(cls):
+        """Delete raw history past the retention period; returns how many rows"""
+        deleted, _ = cls.objects.filter(date__lt=cls.horizon()).delete()
+        return deleted
+
+
+class HealthRollup(models.Model):
+    """
+    Story 2.3: Daily creator counts per (journey_status, health_score,
+    is_active) bucket, aggregated from HealthHistory. Trend charts read only
+    these rows (a few dozen per day), never the per-creator history.
+
+    entered_count: creators in the bucket whose health score differs from
+    the previous day's (new creators included); empty when the previous day
+    was not captured.
+    """
+
+    date = models.DateField()
+    journey_status = models.CharField(max_length=20, choices=JourneyStatus.choices)
+    health_score = models.CharField(max_length=10, choices=HealthScore.choices)
+    is_active = models.BooleanField()
+    creator_count = models.PositiveIntegerField(default=0)
+    entered_count = models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'journey_status', 'health_score', 'is_active'],
+                name='unique_health_rollup_bucket',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.journey_status} / {self.health_score}: {self.creator_count}"
+
+    @classmethod
+    def rebuild_day(cls, date):
+        """Aggregate HealthHistory of `date` into its rollup rows (one query to read)"""
+        from datetime import timedelta
+
+        previous_day = date - timedelta(days=1)
+        history = HealthHistory.objects.filter(date=date)
+        if HealthHistory.objects.filter(date=previous_day).exists():
+            previous_health = models.Subquery(
+                HealthHistory.objects.filter(
+                    date=previous_day,
+                    creator_id=models.OuterRef('creator_id'),
+                ).values('health_score')[:1]
+            )
+            entered = models.Count(
+                'pk',
+                filter=models.Q(previous_health__isnull=True) | ~models.Q(previous_health=models.F('health_score')),
+            )
+            history = history.alias(previous_health=previous_health)
+        else:
+            entered = models.Value(None, output_field=models.IntegerField())
+
+        buckets = list(
+            history.order_by()
+            .values('journey_status', 'health_score', 'is_active')
+            .annotate(creator_count=models.Count('pk'), entered_count=entered)
+        )
+        with transaction.atomic():
+            cls.objects.filter(date=date).delete()
+            cls.objects.bulk_create([cls(date=date, **bucket) for bucket in buckets])
+        return buckets
+
+
+class SlowQuery(models.Model):
+    """
+    Slow SQL captured from live traffic (see slow_queries.py)
+    Bounded: trimmed to the newest SLOW_QUERY_BUFFER_SIZE rows every minute.
+    """
+
+    recorded_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    database = models.CharField(max_length=50, help_text="DATABASES alias the query ran on")
+    duration_ms = models.FloatField()
+    sql = models.TextField(help_text="Parameterized SQL (parameter values are not stored)")
+    plan = models.TextField(blank=True, help_text="EXPLAIN output (PostgreSQL only)")
+
+    # Originating request
+    view = models.CharField(max_length=200, blank=True, help_text="Viewset action or URL name")
+    method = models.CharField(max_length=10, blank=True)
+    path = models.CharField(max_length=500, blank=True)
+
+    class Meta:
+        ordering = ['-recorded_at']
+        verbose_name = "Slow Query"
+        verbose_name_plural = "Slow Queries"
+
+    def __str__(self):
+        return f"{self.duration_ms:.0f}ms {self.view or 'no request'}"
+
+
+class Tombstone(models.Model):
+    """
+    Epic 2: Delta sync - a deleted Creator, Milestone, CreatorCredential or
+    AIDeliverable, so incremental clients (?updated_since=) learn about
+    deletions. Written by the post_delete signals; rows older than
+    TOMBSTONE_RETENTION_DAYS are pruned (prune_tombstones).
+    """
+
+    model_name = models.CharField(max_length=50, help_text="Model label, e.g. 'milestone'")
+    object_id = models.UUIDField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['deleted_at']
+        indexes = [
+            models.Index(fields=['model_name', 'deleted_at']),
+            models.Index(fields=['deleted_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.model_name} {self.object_id} deleted {self.deleted_at:%Y-%m-%d %H:%M}"
+
+    @staticmethod
+    def horizon():
+        """Oldest deletion still guaranteed to be recorded"""
+        from datetime import timedelta
+        from django.conf import settings
+
+        return timezone.now() - timedelta(days=getattr(settings, 'TOMBSTONE_RETENTION_DAYS', 90))
+
+    @classmethod
+    def prune(cls):
+        """Delete tombstones past the retention period; returns how many"""
+        deleted, _ = cls.objects.filter(deleted_at__lt=cls.horizon()).delete()
+        return deleted
@@ -0,0 +1,168 @@
+"""
+Pagination for Studio CRM list endpoints
+Story 1.1: Creator list infinite scroll
+"""
+
+import json
+
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+
+class CreatorCursorPagination(CursorPagination):
+    """
+    Keyset pages for the creator list: each page is a range read from the
+    ordering column instead of an OFFSET, with no COUNT query, so the cost of
+    a page does not grow as the user scrolls. Honours ?ordering= (the
+    cursor follows the first ordering field). Follow `next` for more rows.
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = '-last_status_change'
+
+
+class SyncCursorPagination(CursorPagination):
+    """
+    Pages of a delta sync (?updated_since= lists, tombstones): oldest change
+    first, in large keyset pages, whatever ?ordering= says, so a sync that
+    is interrupted can resume from its last cursor.
+    """
+
+    page_size = 500
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    ordering = ('updated_at', 'pk')
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
+
+
+class TombstoneCursorPagination(SyncCursorPagination):
+    ordering = ('deleted_at', 'pk')
+
+
+def planner_estimate(queryset):
+    """
+    PostgreSQL's estimate of the rows in `queryset`, without running it:
+    pg_class.reltuples for a whole table, the EXPLAIN row estimate
+    otherwise. None on other databases or when the table was never analyzed.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    queryset = queryset.order_by()
+    with connection.cursor() as cursor:
+        if not (queryset.query.where or queryset.query.distinct or queryset.query.group_by):
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+            estimate = row[0] if row else -1
+        else:
+            sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]['Plan']['Plan Rows']
+    return int(estimate) if estimate >= 0 else None
+
+
+def estimated_count(queryset, threshold=None):
+    """
+    (count, approximate) for `queryset`. Counts exactly up to `threshold`
+    rows (settings.ESTIMATED_COUNT_THRESHOLD) with a COUNT bounded by LIMIT,
+    so small results stay exact and the count never reads more than
+    threshold + 1 rows; larger results use planner_estimate().
+    """
+    if threshold is None:
+        threshold = getattr(settings, 'ESTIMATED_COUNT_THRESHOLD', 10000)
+    if not threshold or connections[queryset.db].vendor != 'postgresql':
+        return queryset.count(), False
+    bounded = queryset.order_by()[:threshold + 1].count()
+    if bounded <= threshold:
+        return bounded, False
+    estimate = planner_estimate(queryset)
+    if estimate is None:
+        return queryset.count(), False
+    # Never report fewer rows than were just counted
+    return max(estimate, bounded), True
+
+
+class EstimatedPage(Page):
+    def has_next(self):
+        """With an estimated count, a full page may be followed by more rows"""
+        if self.paginator.approximate:
+            return len(self) == self.paginator.per_page
+        return super().has_next()
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator whose count comes from estimated_count(): exact for small
+    querysets, a planner estimate (self.approximate = True) for large
+    ones, so paging a big table never runs a full COUNT(*). With an
+    estimate, pages past the estimated last page are still served (empty
+    when there are no more rows) and a page has a next page when it is full.
+    """
+
+    approximate = False
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        count, self.approximate = estimated_count(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.approximate or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.approximate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
+
+    def _get_page(self, *args, **kwargs):
+        return EstimatedPage(*args, **kwargs)
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Default page-number pagination of the studio_crm API: DRF's
+    PageNumberPagination with EstimatedCountPaginator counts, so a page of
+    a large table (the audit log, all creators) does not wait on an exact
+    COUNT(*). "count_approximate" is true when "count" is an estimate;
+    follow `next` rather than computing the last page from it.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.page.paginator.count,
+            'count_approximate': self.page.paginator.approximate,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_approximate'] = {'type': 'boolean', 'example': False}
+        return response_schema
@@ -0,0 +1,292 @@
+"""
+Request profiling for Studio CRM
+Per-request query count, SQL time and N+1 detection
+
+QueryProfilingMiddleware records, for a sample of requests:
+- number of SQL queries and total time spent in the database (all aliases)
+- duplicated query shapes - the same SQL executed repeatedly with different
+  parameters, the signature of an N+1 (e.g. a per-row COUNT in a serializer)
+- serialization time (building serializer output - including the queries
+  serializers trigger, where N+1s happen - and rendering it) and response size
+
+Results are returned as a Server-Timing header (shown in the browser dev
+tools network panel) and logged as one key=value line per request on the
+`studio_crm.profiling` logger, plus a warning per N+1 suspect.
+
+count_queries() uses the same hook to enforce per-action query budgets (see
+QueryBudgetMixin in views.py and studio_crm/tests/test_query_budgets.py).
+
+Settings:
+    QUERY_PROFILING_SAMPLE_RATE       fraction of requests profiled (0 disables)
+    QUERY_PROFILING_SERVER_TIMING     add the Server-Timing header
+    QUERY_PROFILING_DUPLICATE_THRESHOLD  repeats of one query shape reported as N+1
+"""
+
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+
+from asgiref.local import Local
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+logger = logging.getLogger('studio_crm.profiling')
+
+# Request-local like signals._thread_locals, so queries run from
+# sync_to_async() threads are attributed to the right request
+_profile_locals = Local()
+
+
+def get_current_profile():
+    """Profile of the request being served, None when not sampled"""
+    return getattr(_profile_locals, 'profile', None)
+
+
+class RequestProfile:
+    """Measurements collected while serving one request"""
+
+    def __init__(self, request):
+        self.method = request.method
+        self.path = request.path
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.sql_time = 0.0
+        self.serialize_time = 0.0
+        self.serializing = False
+        self.query_shapes = Counter()
+
+    def record_query(self, sql, duration):
+        self.query_count += 1
+        self.sql_time += duration
+        self.query_shapes[sql] += 1
+
+    def duplicates(self, threshold):
+        """(sql, count) for query shapes executed at least `threshold` times"""
+        return [
+            (sql, count) for sql, count in self.query_shapes.most_common()
+            if count >= threshold
+        ]
+
+    @property
+    def total_time(self):
+        return time.perf_counter() - self.started
+
+
+def view_label(match, method):
+    """'CreatorViewSet.by_status' for viewset actions, else the URL name"""
+    viewset = getattr(match.func, 'cls', None)
+    actions = getattr(match.func, 'actions', None) or {}
+    if viewset is not None and method.lower() in actions:
+        return f'{viewset.__name__}.{actions[method.lower()]}'
+    return match.view_name or 'unnamed'
+
+
+class QueryBudgetExceeded(Exception):
+    """A view issued more queries than its declared query budget"""
+
+
+@contextmanager
+def count_queries():
+    """
+    Collect the SQL of every query run in the enclosed block, on any alias
+    and in sync_to_async() threads. Yields the (growing) list of statements.
+    """
+    queries = []
+    counters = getattr(_profile_locals, 'counters', ())
+    _profile_locals.counters = (*counters, queries)
+    try:
+        yield queries
+    finally:
+        _profile_locals.counters = counters
+
+
+@contextmanager
+def untracked_queries():
+    """Queries run in the enclosed block are neither counted nor profiled"""
+    counters = getattr(_profile_locals, 'counters', ())
+    profile = get_current_profile()
+    _profile_locals.counters = ()
+    _profile_locals.profile = None
+    try:
+        yield
+    finally:
+        _profile_locals.counters = counters
+        _profile_locals.profile = profile
+
+
+def enforce_query_budget(label, query_count, budget, mode='raise'):
+    """Warn or raise (mode 'warn' / 'raise') when query_count exceeds budget"""
+    if budget is None or query_count <= budget:
+        return
+    message = f'{label} issued {query_count} queries (budget {budget})'
+    if mode == 'raise':
+        raise QueryBudgetExceeded(message)
+    logger.warning('query budget exceeded: %s', message)
+
+
+def profile_query(execute, sql, params, many, context):
+    """Connection execute wrapper feeding the current request's profile"""
+    profile = get_current_profile()
+    for queries in getattr(_profile_locals, 'counters', ()):
+        queries.append(sql)
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        # `sql` is still parameterized (%s placeholders), so repeats of one
+        # query with different values share a shape
+        profile.record_query(sql, time.perf_counter() - started)
+
+
+@receiver(connection_created)
+def install_query_profiler(sender, connection, **kwargs):
+    """Wrap every new database connection (any alias, any thread)"""
+    if profile_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(profile_query)
+
+
+@contextmanager
+def profile_serialization():
+    """Count the enclosed block as serialization time of the current request"""
+    profile = get_current_profile()
+    if profile is None or profile.serializing:
+        # Not sampled, or already inside a timed block
+        yield
+        return
+    profile.serializing = True
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.serializing = False
+        profile.serialize_time += time.perf_counter() - started
+
+
+@lru_cache(maxsize=None)
+def profiled_serializer_class(serializer_class):
+    """Subclass of a DRF serializer class whose .data is timed"""
+
+    class ProfiledSerializer(serializer_class):
+        @property
+        def data(self):
+            with profile_serialization():
+                return super().data
+
+    ProfiledSerializer.__name__ = serializer_class.__name__
+    ProfiledSerializer.__qualname__ = serializer_class.__qualname__
+    return ProfiledSerializer
+
+
+def profile_serializer(serializer):
+    """
+    Count `serializer.data` as serialization time of the current request
+    (no-op when the request is not sampled). For serializers whose .data
+    is read inside DRF code, e.g. ListModelMixin.list.
+    """
+    if get_current_profile() is not None:
+        serializer.__class__ = profiled_serializer_class(type(serializer))
+    return serializer
+
+
+class QueryProfilingMiddleware:
+    """
+    Middleware recording per-request database and serialization cost
+    Add near the top of MIDDLEWARE so queries made by other middleware count
+
+    Sync and async capable, like AuditMiddleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'QUERY_PROFILING_SAMPLE_RATE', 0)
+        self.server_timing = getattr(settings, 'QUERY_PROFILING_SERVER_TIMING', False)
+        self.duplicate_threshold = getattr(settings, 'QUERY_PROFILING_DUPLICATE_THRESHOLD', 3)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        profile = self.start(request)
+        if profile is None:
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _profile_locals.profile = None
+        return self.finish(profile, response)
+
+    async def __acall__(self, request):
+        profile = self.start(request)
+        if profile is None:
+            return await self.get_response(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _profile_locals.profile = None
+        return self.finish(profile, response)
+
+    def process_template_response(self, request, response):
+        """Time rendering of DRF responses (serializer output -> bytes)"""
+        profile = get_current_profile()
+        if profile is not None:
+            started = time.perf_counter()
+
+            def rendered(response):
+                profile.serialize_time += time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def start(self, request):
+        if self.sample_rate <= 0 or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return None
+        profile = RequestProfile(request)
+        _profile_locals.profile = profile
+        return profile
+
+    def finish(self, profile, response):
+        total_time = profile.total_time
+        duplicates = profile.duplicates(self.duplicate_threshold)
+        response_bytes = None if response.streaming else len(response.content)
+
+        if self.server_timing:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={profile.sql_time * 1000:.1f};desc="{profile.query_count} queries"',
+                f'serialize;dur={profile.serialize_time * 1000:.1f}',
+                f'total;dur={total_time * 1000:.1f}',
+            ])
+
+        logger.info(
+            'request method=%s path=%s status=%s queries=%d duplicate_queries=%d '
+            'sql_ms=%.1f serialize_ms=%.1f total_ms=%.1f bytes=%s',
+            profile.method,
+            profile.path,
+            response.status_code,
+            profile.query_count,
+            sum(count - 1 for _, count in duplicates),
+            profile.sql_time * 1000,
+            profile.serialize_time * 1000,
+            total_time * 1000,
+            response_bytes if response_bytes is not None else '-',
+        )
+        for sql, count in duplicates:
+            logger.warning(
+                'n+1 suspect method=%s path=%s count=%d sql="%s"',
+                profile.method,
+                profile.path,
+                count,
+                sql[:300],
+            )
+        return response
@@ -0,0 +1,103 @@
+"""
+Response cache for hot read endpoints (the dashboard)
+Stores rendered bodies together with their gzip / brotli encodings
+
+A view action decorated with @cache_response('dashboard') is served from the
+Django cache for RESPONSE_CACHE_TIMEOUT seconds. Each entry holds the
+rendered JSON plus the body pre-compressed (at maximum level) in every
+encoding CompressionMiddleware supports, so a hit costs neither rendering
+nor compression.
+
+Entries are shared by all users, so only decorate actions whose output does
+not depend on the user. Writes invalidate a group by bumping its version
+(invalidate_group, called on commit from signals.py); with a per-process
+cache (LocMemCache) other workers see the change when their entries expire.
+"""
+
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .compression import available_encodings, compress
+from .metrics import record_cache_lookup
+
+VERSION_KEY = 'studio_crm:response:{group}:version'
+ENTRY_KEY = 'studio_crm:response:{group}:{version}:{request_hash}'
+
+# Cached bodies are compressed once per fill, so at the slowest levels
+CACHED_LEVELS = {'gzip': 9, 'br': 11}
+
+
+def group_version(group):
+    version = cache.get(VERSION_KEY.format(group=group))
+    if version is None:
+        version = 1
+        cache.add(VERSION_KEY.format(group=group), version, None)
+    return version
+
+
+def invalidate_group(group):
+    """Drop every cached response of `group`"""
+    key = VERSION_KEY.format(group=group)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, None)
+
+
+def entry_key(group, request):
+    return ENTRY_KEY.format(
+        group=group,
+        version=group_version(group),
+        request_hash=hashlib.md5(
+            f'{request.accepted_media_type}|{request.get_full_path()}'.encode()
+        ).hexdigest(),
+    )
+
+
+def store(key, response, timeout):
+    content = response.content
+    cache.set(key, {
+        'status': response.status_code,
+        'content_type': response['Content-Type'],
+        'content': content,
+        'encodings': {
+            encoding: compress(encoding, content, CACHED_LEVELS[encoding])
+            for encoding in available_encodings()
+            if len(content) >= getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        },
+    }, timeout)
+
+
+def cached(entry):
+    response = HttpResponse(entry['content'], status=entry['status'], content_type=entry['content_type'])
+    response.precompressed = entry['encodings']
+    return response
+
+
+def cache_response(group):
+    """Viewset action decorator: serve GETs from the response cache"""
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            timeout = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 0)
+            # Browsable API pages embed the user; only cache JSON
+            if not timeout or request.method != 'GET' or request.accepted_renderer.format != 'json':
+                return view_method(self, request, *args, **kwargs)
+
+            key = entry_key(group, request)
+            entry = cache.get(key)
+            record_cache_lookup(f'response_{group}', entry is not None)
+            if entry is not None:
+                return cached(entry)
+
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                response.add_post_render_callback(lambda rendered: store(key, rendered, timeout))
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,292 @@
+"""
+Sampling profiler for Studio CRM
+Flamegraphs of slow endpoints, captured in production
+
+While a capture session is running (started from the admin-only
+/api/crm/profiler/start/ endpoint), a fraction of requests - optionally only
+those for given URL names - is sampled: a background thread records the
+stack of the thread serving each such request every few milliseconds.
+Stacks are aggregated per viewset action and written to
+SAMPLING_PROFILER_OUTPUT_DIR/<session>/ as
+- <action>.<pid>.collapsed        flamegraph.pl / speedscope collapsed stacks
+- <action>.<pid>.speedscope.json  https://www.speedscope.app
+
+Each worker process writes its own files (concatenate the .collapsed files
+to merge workers). Sessions live in the Django cache, which must be shared
+by all workers (CACHE_BACKEND, e.g. RedisCache): with a per-process cache a
+session would only reach the worker that started it, so start and stop are
+refused.
+
+Overhead: with SAMPLING_PROFILER_ENABLED off the middleware removes itself.
+When enabled but idle, a worker reads the session from the cache at most
+once per second. Only sampled requests pay for stack sampling. Requests
+served on the ASGI event loop are not sampled.
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.urls import Resolver404, resolve
+from django.utils import timezone
+
+from .checks import cache_is_shared
+from .profiling import view_label
+
+SESSION_CACHE_KEY = 'studio_crm:profiler:session'
+SESSION_CHECK_INTERVAL = 1.0
+
+
+def require_shared_cache():
+    if not cache_is_shared():
+        raise ImproperlyConfigured(
+            f'Profiler sessions need a cache shared by all workers; {settings.CACHES["default"]["BACKEND"]} '
+            f'is per process. Set CACHE_BACKEND / CACHE_LOCATION (e.g. RedisCache).'
+        )
+
+
+def start_session(sample_rate, url_names, duration, interval_ms):
+    """Start a capture session in every worker (expires after `duration` seconds)"""
+    require_shared_cache()
+    session = {
+        'id': timezone.now().strftime('%Y%m%d-%H%M%S'),
+        'sample_rate': sample_rate,
+        'url_names': list(url_names),
+        'interval_ms': interval_ms,
+        'expires_at': (timezone.now() + timedelta(seconds=duration)).isoformat(),
+    }
+    cache.set(SESSION_CACHE_KEY, session, duration)
+    return session
+
+
+def stop_session():
+    """Stop the running session; workers write their files on their next request"""
+    require_shared_cache()
+    session = cache.get(SESSION_CACHE_KEY)
+    cache.delete(SESSION_CACHE_KEY)
+    return session
+
+
+def get_session():
+    return cache.get(SESSION_CACHE_KEY)
+
+
+def output_dir():
+    return Path(getattr(settings, 'SAMPLING_PROFILER_OUTPUT_DIR', Path(settings.BASE_DIR) / 'profiles'))
+
+
+def list_captures(limit=20):
+    """Files written by recent sessions, newest session first"""
+    root = output_dir()
+    if not root.is_dir():
+        return []
+    sessions = sorted((path for path in root.iterdir() if path.is_dir()), reverse=True)[:limit]
+    return [
+        {'session': path.name, 'files': sorted(file.name for file in path.iterdir())}
+        for path in sessions
+    ]
+
+
+# code object -> frame label, so each function is formatted once
+_frame_labels = {}
+
+
+def frame_label(code):
+    label = _frame_labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        base_dir = str(settings.BASE_DIR)
+        if filename.startswith(base_dir):
+            filename = os.path.relpath(filename, base_dir)
+        elif 'site-packages' in filename:
+            filename = filename.split('site-packages' + os.sep, 1)[1]
+        label = _frame_labels[code] = f'{code.co_name} ({filename}:{code.co_firstlineno})'
+    return label
+
+
+def collapse(frame):
+    """Stack of `frame` as root;...;leaf"""
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame.f_code))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class StackSampler(threading.Thread):
+    """
+    Background thread sampling the stacks of registered threads every
+    `interval` seconds. Sleeps on an event while nothing is registered.
+    """
+
+    def __init__(self):
+        super().__init__(name='studio-crm-stack-sampler', daemon=True)
+        self.targets = {}
+        self.interval = 0.01
+        self.wakeup = threading.Event()
+
+    def watch(self, thread_id):
+        stacks = Counter()
+        self.targets[thread_id] = stacks
+        self.wakeup.set()
+        return stacks
+
+    def unwatch(self, thread_id):
+        self.targets.pop(thread_id, None)
+
+    def run(self):
+        while True:
+            if not self.targets:
+                self.wakeup.wait()
+                self.wakeup.clear()
+                continue
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            for thread_id, stacks in list(self.targets.items()):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    stacks[collapse(frame)] += 1
+
+
+def speedscope_document(label, stacks, interval_ms):
+    """Speedscope 'sampled' profile for one action"""
+    frames, frame_index, samples, weights = [], {}, [], []
+    for stack, count in stacks.most_common():
+        sample = []
+        for name in stack.split(';'):
+            if name not in frame_index:
+                frame_index[name] = len(frames)
+                frames.append({'name': name})
+            sample.append(frame_index[name])
+        samples.append(sample)
+        weights.append(count * interval_ms)
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': label,
+        'exporter': 'studio_crm.sampling_profiler',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled',
+            'name': label,
+            'unit': 'milliseconds',
+            'startValue': 0,
+            'endValue': sum(weights),
+            'samples': samples,
+            'weights': weights,
+        }],
+    }
+
+
+class SamplingProfilerMiddleware:
+    """
+    Middleware sampling requests during a capture session
+    Add at the top of MIDDLEWARE; needs SAMPLING_PROFILER_ENABLED = True
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'SAMPLING_PROFILER_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.flush_interval = getattr(settings, 'SAMPLING_PROFILER_FLUSH_INTERVAL', 30)
+        self.sampler = None
+        self.session = None
+        self.checked_at = 0.0
+        self.flushed_at = time.monotonic()
+        self.lock = threading.Lock()
+        # session id -> (sampling interval in ms, {action label: aggregated stacks})
+        self.profiles = {}
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        session = self.current_session()
+        label = self.sample_label(session, request) if session else None
+        if label is None:
+            return self.get_response(request)
+
+        thread_id = threading.get_ident()
+        stacks = self.get_sampler(session).watch(thread_id)
+        try:
+            return self.get_response(request)
+        finally:
+            self.sampler.unwatch(thread_id)
+            self.record(session, label, stacks)
+
+    async def __acall__(self, request):
+        # Stacks are sampled per thread; the event loop thread interleaves
+        # many requests, so async requests are not sampled
+        return await self.get_response(request)
+
+    def current_session(self):
+        """Session from the cache, re-read at most once per second"""
+        now = time.monotonic()
+        if now - self.checked_at >= SESSION_CHECK_INTERVAL:
+            self.checked_at = now
+            session = get_session()
+            if self.profiles and (session is None or session['id'] not in self.profiles):
+                self.flush()
+            self.session = session
+        return self.session
+
+    def sample_label(self, session, request):
+        """Action label when this request should be sampled, else None"""
+        if random.random() >= session['sample_rate']:
+            return None
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return None
+        if session['url_names'] and not {match.url_name, match.view_name} & set(session['url_names']):
+            return None
+        return view_label(match, request.method)
+
+    def get_sampler(self, session):
+        if self.sampler is None:
+            self.sampler = StackSampler()
+            self.sampler.start()
+        self.sampler.interval = session['interval_ms'] / 1000
+        return self.sampler
+
+    def record(self, session, label, stacks):
+        with self.lock:
+            _, actions = self.profiles.setdefault(session['id'], (session['interval_ms'], {}))
+            actions.setdefault(label, Counter()).update(stacks)
+        if time.monotonic() - self.flushed_at >= self.flush_interval:
+            self.flush(keep=True)
+
+    def flush(self, keep=False):
+        """Write this worker's profiles; `keep` leaves them in memory (periodic flush)"""
+        with self.lock:
+            snapshot = {
+                session_id: (interval_ms, {label: Counter(stacks) for label, stacks in actions.items()})
+                for session_id, (interval_ms, actions) in self.profiles.items()
+            }
+            if not keep:
+                self.profiles = {}
+            self.flushed_at = time.monotonic()
+
+        pid = os.getpid()
+        for session_id, (interval_ms, actions) in snapshot.items():
+            directory = output_dir() / session_id
+            directory.mkdir(parents=True, exist_ok=True)
+            for label, stacks in actions.items():
+                with open(directory / f'{label}.{pid}.collapsed', 'w') as output:
+                    output.writelines(f'{stack} {count}\n' for stack, count in stacks.most_common())
+                with open(directory / f'{label}.{pid}.speedscope.json', 'w') as output:
+                    json.dump(speedscope_document(label, stacks, interval_ms), output)
@@ -5,12 +5,15 @@ Epic 2: API layer for frontend integration
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
 from .models import (
     Creator,
     CreatorCredential,
     Milestone,
     AuditLog,
     AIDeliverable,
+    StatusTransition,
+    Tombstone,
     JourneyStatus,
     HealthScore
 )
@@ -43,8 +46,9 @@ class MilestoneSerializer(serializers.ModelSerializer):
             'is_completed',
             'related_journey_stage',
             'created_at',
+            'updated_at',
         ]
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
     def validate(self, data):
         """Ensure completed_date is set when is_completed is True"""
@@ -54,6 +58,19 @@ class MilestoneSerializer(serializers.ModelSerializer):
         return data
 
 
+class MilestoneScheduleSerializer(MilestoneSerializer):
+    """
+    Milestone with its creator's names, for the overdue / upcoming reviews
+    Story 2.1: Project timeline and milestones
+    """
+
+    creator_name = serializers.CharField(source='creator.creator_name', read_only=True)
+    brand_name = serializers.CharField(source='creator.brand_name', read_only=True)
+
+    class Meta(MilestoneSerializer.Meta):
+        fields = MilestoneSerializer.Meta.fields + ['creator_name', 'brand_name']
+
+
 class CreatorCredentialSerializer(serializers.ModelSerializer):
     """
     Serializer for CreatorCredential model
@@ -104,8 +121,6 @@ class CreatorListSerializer(serializers.ModelSerializer):
         source='get_health_score_display',
         read_only=True
     )
-    milestone_count = serializers.SerializerMethodField()
-    credential_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Creator
@@ -126,19 +141,14 @@ class CreatorListSerializer(serializers.ModelSerializer):
             'updated_at',
             'created_by',
             'milestone_count',
+            'completed_milestone_count',
+            'overdue_milestone_count',
             'credential_count',
+            'active_credential_count',
             'tags',
         ]
         read_only_fields = ['id', 'health_score', 'created_at', 'updated_at']
 
-    def get_milestone_count(self, obj):
-        """Count of milestones for this creator"""
-        return obj.milestones.count()
-
-    def get_credential_count(self, obj):
-        """Count of credentials for this creator"""
-        return obj.credentials.count()
-
 
 class CreatorDetailSerializer(serializers.ModelSerializer):
     """
@@ -188,6 +198,62 @@ class CreatorDetailSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class CredentialMetadataSerializer(serializers.ModelSerializer):
+    """
+    Credential metadata only: no encrypted field is read or decrypted
+    Story 1.4: Secure credential vault
+    """
+
+    class Meta:
+        model = CreatorCredential
+        fields = [
+            'id',
+            'creator',
+            'platform_name',
+            'account_identifier',
+            'last_verified_date',
+            'expires_on',
+            'is_active',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
+
+
+class DeliverableSummarySerializer(serializers.ModelSerializer):
+    """
+    Deliverable without its prompt, context and generated content
+    Epic 3: AI-generated documents
+    """
+
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+
+    class Meta:
+        model = AIDeliverable
+        fields = [
+            'id',
+            'deliverable_type',
+            'status',
+            'status_display',
+            'ai_model',
+            'file_url',
+            'error_message',
+            'created_at',
+            'created_by',
+        ]
+        read_only_fields = fields
+
+
+class CreatorCoreSerializer(CreatorDetailSerializer):
+    """
+    Creator profile fields without the nested milestones and credentials
+    Story 1.2: View Creator Profile (the `creator` part of the bundle)
+    """
+
+    milestones = None
+    credentials = None
+
+
 class CreatorCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating/updating Creator records
@@ -254,7 +320,8 @@ class AuditLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = AuditLog
         fields = '__all__'
-        read_only_fields = '__all__'  # Audit logs are immutable
+        # Audit logs are immutable
+        read_only_fields = [field.name for field in AuditLog._meta.fields]
 
 
 class AIDeliverableSerializer(serializers.ModelSerializer):
@@ -272,6 +339,40 @@ class AIDeliverableSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'created_by']
 
 
+class TombstoneSerializer(serializers.ModelSerializer):
+    """
+    A deleted row, for delta sync clients
+    Epic 2: API layer - incremental sync
+    """
+
+    class Meta:
+        model = Tombstone
+        fields = ['model_name', 'object_id', 'deleted_at']
+        read_only_fields = fields
+
+
+class StatusTransitionSerializer(serializers.ModelSerializer):
+    """
+    One journey status change (read-only)
+    Story 2.2: Journey status history
+    """
+
+    to_status_display = serializers.CharField(source='get_to_status_display', read_only=True)
+
+    class Meta:
+        model = StatusTransition
+        fields = [
+            'id',
+            'creator',
+            'from_status',
+            'to_status',
+            'to_status_display',
+            'transitioned_at',
+            'changed_by',
+        ]
+        read_only_fields = fields
+
+
 class JourneyStatusUpdateSerializer(serializers.Serializer):
     """
     Dedicated serializer for journey status updates
@@ -298,10 +399,80 @@ class JourneyStatusUpdateSerializer(serializers.Serializer):
 
         instance.save()
 
-        # Log to audit trail (handled by signals)
+        # Audit trail and status history (StatusTransition) are written by signals
         return instance
 
 
+class ProfilerSessionSerializer(serializers.Serializer):
+    """
+    Parameters of a sampling profiler capture session
+    Sample `sample_rate` of the requests to `url_names` (all URLs if empty)
+    """
+
+    sample_rate = serializers.FloatField(min_value=0.001, max_value=1, default=0.1)
+    url_names = serializers.ListField(child=serializers.CharField(), default=list)
+    duration = serializers.IntegerField(min_value=1, max_value=3600, default=300)
+    interval_ms = serializers.IntegerField(min_value=1, max_value=1000, default=10)
+
+
+class CreatorBatchGetSerializer(serializers.Serializer):
+    """
+    Creator ids for creators/batch_get/
+    Story 1.1: Fetch many creators in one request
+    """
+
+    MAX_IDS = 100
+
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_IDS)
+
+
+class BatchSubRequestSerializer(serializers.Serializer):
+    """One read-only sub-request of a batch: a GET of an API path"""
+
+    method = serializers.ChoiceField(choices=['GET'], default='GET')
+    path = serializers.CharField(max_length=2000)
+
+
+class BatchSerializer(serializers.Serializer):
+    """
+    Body of POST /api/crm/batch/
+    Epic 2: API layer - several reads in one round trip
+    """
+
+    MAX_REQUESTS = 20
+
+    requests = serializers.ListField(
+        child=BatchSubRequestSerializer(),
+        allow_empty=False,
+        max_length=MAX_REQUESTS,
+    )
+
+
+class HealthSimulationSerializer(serializers.Serializer):
+    """
+    Body of POST /api/crm/dashboard/health_simulation/
+    Story 2.3: Try health rule changes before making them
+
+    `rules` is the base rule set (default: the configured one), `grid` the
+    rule parameters to vary (see health_simulation.py)
+    """
+
+    rules = serializers.ListField(child=serializers.DictField(), required=False)
+    grid = serializers.DictField(child=serializers.ListField(allow_empty=False), default=dict)
+    examples = serializers.IntegerField(min_value=0, max_value=20, default=3)
+
+    def validate(self, attrs):
+        from .health_rules import HealthRules, active_health_rules
+        from .health_simulation import expand_grid
+
+        try:
+            base_rules = HealthRules(attrs['rules']) if 'rules' in attrs else active_health_rules()
+            expand_grid(base_rules, attrs['grid'])
+        except ImproperlyConfigured as error:
+            raise serializers.ValidationError(str(error))
+        return {'base_rules': base_rules, 'grid': attrs['grid'], 'examples': attrs['examples']}
+
+
 class DashboardStatsSerializer(serializers.Serializer):
     """
     Serializer for dashboard statistics
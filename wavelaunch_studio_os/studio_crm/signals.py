@@ -5,23 +5,41 @@ Epic 0.4: Automatic audit trail for sensitive actions
 Captures all CREATE, UPDATE, DELETE actions on critical models.
 """
 
-from django.db.models.signals import post_save, post_delete, pre_save
+import time
+
+from django.db import transaction
+from django.utils import timezone
+from django.db.models.signals import post_init, post_migrate, post_save, post_delete, pre_delete, pre_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import Creator, CreatorCredential, AuditLog
-import threading
-
-# Thread-local storage for request context
-_thread_locals = threading.local()
+from asgiref.local import Local
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from .models import (
+    Creator,
+    CreatorCredential,
+    Milestone,
+    AuditLog,
+    AIDeliverable,
+    CreatorStatsSnapshot,
+    StatusTransition,
+    Tombstone,
+)
+from .metrics import DELIVERABLE_TRANSITIONS, record_audit_write
+from .response_cache import invalidate_group
+
+# Request-local storage for request context. asgiref's Local behaves like
+# threading.local under WSGI and is also isolated per-coroutine under ASGI,
+# following the request into sync_to_async() threads.
+_thread_locals = Local()
 
 
 def get_current_request():
-    """Get the current HTTP request from thread-local storage"""
+    """Get the current HTTP request from request-local storage"""
     return getattr(_thread_locals, 'request', None)
 
 
 def set_current_request(request):
-    """Store the current HTTP request in thread-local storage"""
+    """Store the current HTTP request in request-local storage"""
     _thread_locals.request = request
 
 
@@ -29,23 +47,36 @@ class AuditMiddleware:
     """
     Middleware to capture request context for audit logging
     Add to MIDDLEWARE in settings.py after AuthenticationMiddleware
+
+    Sync and async capable, so it does not force async views served under
+    ASGI through a thread adapter.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         set_current_request(request)
         response = self.get_response(request)
         set_current_request(None)
         return response
 
+    async def __acall__(self, request):
+        set_current_request(request)
+        response = await self.get_response(request)
+        set_current_request(None)
+        return response
 
-def create_audit_log(user, action_type, target_model, target_id, target_display, changes=None, notes=''):
-    """
-    Helper function to create audit log entries
-    Story 0.4: Capture User ID, Action, Target, Timestamp
-    """
+
+def build_audit_log(user, action_type, target_model, target_id, target_display, changes=None, notes=''):
+    """Unsaved audit log entry, with the current request's IP address"""
     request = get_current_request()
     ip_address = None
 
@@ -57,7 +88,7 @@ def create_audit_log(user, action_type, target_model, target_id, target_display,
         else:
             ip_address = request.META.get('REMOTE_ADDR')
 
-    AuditLog.objects.create(
+    return AuditLog(
         user=user,
         user_email=user.email if user else 'system',
         ip_address=ip_address,
@@ -70,6 +101,76 @@ def create_audit_log(user, action_type, target_model, target_id, target_display,
     )
 
 
+def create_audit_log(user, action_type, target_model, target_id, target_display, changes=None, notes=''):
+    """
+    Helper function to create audit log entries
+    Story 0.4: Capture User ID, Action, Target, Timestamp
+    """
+    entry = build_audit_log(user, action_type, target_model, target_id, target_display, changes, notes)
+    started = time.perf_counter()
+    entry.save(force_insert=True)
+    record_audit_write(get_current_request(), target_model, action_type, time.perf_counter() - started)
+
+
+class CreatorCascade:
+    """
+    Bookkeeping of the rows deleted along with creators (Epic 2)
+
+    Deleting a creator cascades to its milestones, credentials and
+    deliverables, and Django sends post_delete for each of them. Instead of
+    one counter UPDATE, tombstone INSERT and audit INSERT per cascaded row,
+    the handlers below skip counters (the creator row goes too) and collect
+    tombstones and audit entries here; they are bulk-inserted when the
+    creator itself is deleted. Deleting a creator then costs the same number
+    of queries whatever it owns (Django's own cascade deletes aside).
+
+    Kept on the deletion's `origin` (the instance or queryset delete() was
+    called on), which every pre/post_delete signal of that deletion carries.
+    """
+
+    def __init__(self):
+        self.creators = {}
+        self.tombstones = []
+        self.audit_logs = []
+
+    @staticmethod
+    def start(origin, creator):
+        cascade = getattr(origin, '_creator_cascade', None)
+        if cascade is None:
+            cascade = CreatorCascade()
+            origin._creator_cascade = cascade
+        cascade.creators[creator.pk] = creator
+
+    @staticmethod
+    def of(origin, creator_id):
+        """The cascade deleting `creator_id`, None when it is not being deleted"""
+        cascade = getattr(origin, '_creator_cascade', None)
+        if cascade is not None and creator_id in cascade.creators:
+            return cascade
+        return None
+
+    def finish(self, creator):
+        """Write the collected rows once `creator` is deleted"""
+        del self.creators[creator.pk]
+        if self.audit_logs:
+            started = time.perf_counter()
+            AuditLog.objects.bulk_create(self.audit_logs)
+            duration = (time.perf_counter() - started) / len(self.audit_logs)
+            for entry in self.audit_logs:
+                record_audit_write(get_current_request(), entry.target_model, entry.action_type, duration)
+        if self.tombstones:
+            Tombstone.objects.bulk_create(self.tombstones)
+        self.audit_logs = []
+        self.tombstones = []
+
+
+@receiver(pre_delete, sender=Creator)
+def start_creator_cascade(sender, instance, origin=None, **kwargs):
+    """Collect the bookkeeping of this creator's cascaded rows (CreatorCascade)"""
+    if origin is not None:
+        CreatorCascade.start(origin, instance)
+
+
 # Store original values before update
 @receiver(pre_save, sender=Creator)
 def store_creator_original(sender, instance, **kwargs):
@@ -142,6 +243,83 @@ def audit_creator_changes(sender, instance, created, **kwargs):
                 )
 
 
+@receiver(post_save, sender=Creator)
+def update_creator_stats_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Epic 0.3: Keep CreatorStatsSnapshot in step with Creator
+    A new creator adds 1 to its bucket; a creator moving bucket (status,
+    health or active flag changed) moves 1 from the old bucket to the new one.
+    """
+    if created:
+        CreatorStatsSnapshot.adjust(CreatorStatsSnapshot.bucket_for(instance), 1)
+        return
+
+    original = getattr(instance, '_original', None)
+    if original is None:
+        return
+
+    old_bucket = CreatorStatsSnapshot.bucket_for(original)
+    new_bucket = CreatorStatsSnapshot.bucket_for(instance)
+    if update_fields is not None:
+        # Fields not in update_fields were not written
+        new_bucket = {
+            field: new_bucket[field] if field in update_fields else old_bucket[field]
+            for field in new_bucket
+        }
+
+    if old_bucket != new_bucket:
+        CreatorStatsSnapshot.move(old_bucket, new_bucket)
+
+
+@receiver(post_save, sender=Creator)
+def record_status_transition(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Story 2.2: Journey status history
+    Record a new creator's initial status and every journey_status change,
+    whichever path saved it (status update action, profile edit, admin)
+    """
+    original = getattr(instance, '_original', None)
+    if created:
+        from_status = None
+    elif (
+        original is None
+        or original.journey_status == instance.journey_status
+        or (update_fields is not None and 'journey_status' not in update_fields)
+    ):
+        return
+    else:
+        from_status = original.journey_status
+
+    # The status update action stamps last_status_change; other edits don't
+    if created or original.last_status_change != instance.last_status_change:
+        transitioned_at = instance.last_status_change
+    else:
+        transitioned_at = timezone.now()
+
+    request = get_current_request()
+    user = request.user if request and request.user.is_authenticated else None
+    StatusTransition.objects.create(
+        creator=instance,
+        from_status=from_status,
+        to_status=instance.journey_status,
+        transitioned_at=transitioned_at,
+        changed_by=user,
+    )
+
+
+@receiver(post_delete, sender=Creator)
+def update_creator_stats_on_delete(sender, instance, **kwargs):
+    """Epic 0.3: Remove a deleted creator from its CreatorStatsSnapshot bucket"""
+    CreatorStatsSnapshot.adjust(CreatorStatsSnapshot.bucket_for(instance), -1)
+
+
+@receiver(post_migrate)
+def create_stats_buckets(sender, using='default', **kwargs):
+    """Epic 0.3: Every CreatorStatsSnapshot bucket row exists, so updates never create one"""
+    if sender.name == 'studio_crm':
+        CreatorStatsSnapshot.ensure_buckets(using=using)
+
+
 @receiver(post_delete, sender=Creator)
 def audit_creator_deletion(sender, instance, **kwargs):
     """Log Creator DELETE actions"""
@@ -190,20 +368,130 @@ def audit_credential_access(sender, instance, created, **kwargs):
 
 
 @receiver(post_delete, sender=CreatorCredential)
-def audit_credential_deletion(sender, instance, **kwargs):
+def audit_credential_deletion(sender, instance, origin=None, **kwargs):
     """Log Credential DELETE - HIGH SECURITY"""
     request = get_current_request()
     user = request.user if request and request.user.is_authenticated else None
 
-    create_audit_log(
+    cascade = CreatorCascade.of(origin, instance.creator_id)
+    creator = cascade.creators[instance.creator_id] if cascade else instance.creator
+    entry = dict(
         user=user,
         action_type='DELETE',
         target_model='CreatorCredential',
         target_id=instance.id,
-        target_display=f"{instance.creator.brand_name} - {instance.platform_name}",
+        target_display=f"{creator.brand_name} - {instance.platform_name}",
         changes={
             'platform': instance.platform_name,
             'account': instance.account_identifier,
         },
         notes='Credential permanently deleted'
     )
+    if cascade:
+        cascade.audit_logs.append(build_audit_log(**entry))
+    else:
+        create_audit_log(**entry)
+
+
+# === Denormalized Creator counters (Story 2.1) ===
+
+@receiver(pre_save, sender=Milestone)
+@receiver(pre_save, sender=CreatorCredential)
+def store_counter_original(sender, instance, **kwargs):
+    """Store the persisted row before update so counter deltas can be computed"""
+    instance._original = sender.objects.filter(pk=instance.pk).first() if instance.pk else None
+
+
+@receiver(post_save, sender=Milestone)
+@receiver(post_save, sender=CreatorCredential)
+def update_creator_counters_on_save(sender, instance, created, **kwargs):
+    """
+    Keep Creator counter columns in step: apply the difference between the
+    row's old and new contribution (moving it if the creator changed).
+    """
+    new = instance.counter_contribution()
+    original = None if created else getattr(instance, '_original', None)
+
+    if original is None:
+        Creator.adjust_counters(instance.creator_id, new)
+        return
+
+    old = original.counter_contribution()
+    if original.creator_id != instance.creator_id:
+        Creator.adjust_counters_many({
+            original.creator_id: {field: -value for field, value in old.items()},
+            instance.creator_id: new,
+        })
+    else:
+        Creator.adjust_counters(
+            instance.creator_id,
+            {field: new[field] - old[field] for field in new}
+        )
+
+
+@receiver(post_delete, sender=Milestone)
+@receiver(post_delete, sender=CreatorCredential)
+def update_creator_counters_on_delete(sender, instance, origin=None, **kwargs):
+    """Remove a deleted milestone/credential from its creator's counters"""
+    if CreatorCascade.of(origin, instance.creator_id):
+        # The creator is being deleted too
+        return
+    Creator.adjust_counters(
+        instance.creator_id,
+        {field: -value for field, value in instance.counter_contribution().items()}
+    )
+
+
+# === Dashboard response cache (Epic 0.3) ===
+
+@receiver(post_save, sender=Creator)
+@receiver(post_delete, sender=Creator)
+@receiver(post_save, sender=Milestone)
+@receiver(post_delete, sender=Milestone)
+@receiver(post_save, sender=CreatorCredential)
+@receiver(post_delete, sender=CreatorCredential)
+def invalidate_dashboard_cache(sender, **kwargs):
+    """Creators and their counters feed the cached dashboard responses"""
+    transaction.on_commit(lambda: invalidate_group('dashboard'))
+
+
+# === Delta sync tombstones (Epic 2) ===
+
+@receiver(post_delete, sender=Creator)
+@receiver(post_delete, sender=Milestone)
+@receiver(post_delete, sender=CreatorCredential)
+@receiver(post_delete, sender=AIDeliverable)
+def record_tombstone(sender, instance, origin=None, **kwargs):
+    """Record deletions (cascades included) for ?updated_since= clients"""
+    tombstone = Tombstone(model_name=sender._meta.model_name, object_id=instance.pk)
+    cascade = CreatorCascade.of(origin, instance.pk if sender is Creator else instance.creator_id)
+    if cascade:
+        cascade.tombstones.append(tombstone)
+    else:
+        tombstone.save(force_insert=True)
+
+
+# Registered after every other Creator post_delete handler, so it runs last
+@receiver(post_delete, sender=Creator)
+def finish_creator_cascade(sender, instance, origin=None, **kwargs):
+    """Bulk-insert the tombstones and audit entries of a deleted creator's rows"""
+    cascade = CreatorCascade.of(origin, instance.pk)
+    if cascade:
+        cascade.finish(instance)
+
+
+# === AI deliverable pipeline metrics (Epic 3) ===
+
+@receiver(post_init, sender=AIDeliverable)
+def store_deliverable_status(sender, instance, **kwargs):
+    """Remember the loaded status so transitions can be counted without a query"""
+    instance._original_status = instance.status
+
+
+@receiver(post_save, sender=AIDeliverable)
+def count_deliverable_transition(sender, instance, created, **kwargs):
+    """Story 3.3: Count PENDING -> GENERATING -> COMPLETED/FAILED transitions"""
+    original_status = None if created else instance._original_status
+    if original_status != instance.status:
+        DELIVERABLE_TRANSITIONS.labels(original_status or 'NONE', instance.status).inc()
+    instance._original_status = instance.status
@@ -0,0 +1,170 @@
+"""
+Slow query log for Studio CRM
+Surfaces slow SQL from live traffic, with query plans
+
+Every connection gets an execute wrapper that times each statement. One
+taking longer than SLOW_QUERY_THRESHOLD_MS is
+- logged on the `studio_crm.slow_queries` logger with the originating
+  viewset action / URL name
+- stored as a SlowQuery row (Admin > Slow Queries), together with its
+  `EXPLAIN` plan on PostgreSQL. The wrapper only queues the row: it is
+  written once the response has been sent (request_finished), or after
+  commit outside requests, never inside the request's transaction. The
+  table is trimmed to the newest SLOW_QUERY_BUFFER_SIZE rows at most once
+  per TRIM_INTERVAL seconds.
+
+Plans are taken with EXPLAIN (ANALYZE off), so the statement is not run a
+second time. Parameter values are never stored.
+"""
+
+import logging
+import time
+from collections import deque
+
+from asgiref.local import Local
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import connections, transaction
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .profiling import untracked_queries, view_label
+
+logger = logging.getLogger('studio_crm.slow_queries')
+
+# Set while a slow query is being explained/stored, so those statements are
+# not themselves timed
+_recording = Local()
+
+EXPLAINABLE_STATEMENTS = ('SELECT', 'WITH', 'UPDATE', 'DELETE', 'INSERT')
+
+# Slow queries waiting to be stored (this process); bounded so a flood of
+# slow statements cannot grow memory
+_pending = deque(maxlen=1000)
+
+# Seconds between trims of the SlowQuery table (per process)
+TRIM_INTERVAL = 60
+_trimmed_at = 0.0
+
+
+def explain(connection, sql, params):
+    """EXPLAIN plan of a statement, '' when unavailable"""
+    if connection.vendor != 'postgresql' or not sql.lstrip().upper().startswith(EXPLAINABLE_STATEMENTS):
+        return ''
+    try:
+        # Savepoint: a failed EXPLAIN must not abort the request's transaction
+        with untracked_queries(), transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (ANALYZE off, VERBOSE off) {sql}', params)
+            return '\n'.join(row[0] for row in cursor.fetchall())
+    except Exception as error:
+        # Never let plan capture break the request (e.g. an aborted
+        # transaction or a statement EXPLAIN does not accept)
+        return f'EXPLAIN failed: {error}'
+
+
+def record_slow_query(connection, sql, params, many, duration):
+    """Log a slow statement and queue it for storage (no queries here)"""
+    from .signals import get_current_request
+
+    request = get_current_request()
+    match = getattr(request, 'resolver_match', None)
+    view = view_label(match, request.method) if match is not None else ''
+    duration_ms = duration * 1000
+
+    logger.warning(
+        'slow query duration_ms=%.1f database=%s view=%s method=%s path=%s sql="%s"',
+        duration_ms,
+        connection.alias,
+        view or '-',
+        request.method if request else '-',
+        request.path if request else '-',
+        sql[:1000],
+    )
+
+    _pending.append({
+        'database': connection.alias,
+        'duration_ms': duration_ms,
+        'sql': sql,
+        # Kept in memory for EXPLAIN only, never stored
+        'params': None if many else params,
+        'view': view[:200],
+        'method': request.method if request else '',
+        'path': request.path[:500] if request else '',
+    })
+    if request is None:
+        # Management commands, scripts: no request_finished to wait for
+        transaction.on_commit(flush_slow_queries, using=connection.alias)
+
+
+@receiver(request_finished)
+def flush_slow_queries(**kwargs):
+    """
+    Store the queued slow queries, with their plans. Runs once the response
+    is sent, outside the request's transaction and query budget.
+    """
+    if not _pending:
+        return
+    from .models import SlowQuery
+
+    _recording.active = True
+    try:
+        rows = []
+        while True:
+            try:
+                entry = _pending.popleft()
+            except IndexError:
+                break
+            params = entry.pop('params')
+            plan = '' if params is None else explain(connections[entry['database']], entry['sql'], params)
+            rows.append(SlowQuery(plan=plan, **entry))
+        with untracked_queries():
+            SlowQuery.objects.using('default').bulk_create(rows)
+            trim_slow_queries()
+    except Exception:
+        logger.exception('could not store slow queries')
+    finally:
+        _recording.active = False
+
+
+def trim_slow_queries(force=False):
+    """
+    Ring buffer: drop everything older than the newest SLOW_QUERY_BUFFER_SIZE
+    rows. Runs at most once per TRIM_INTERVAL seconds per process.
+    """
+    global _trimmed_at
+    from .models import SlowQuery
+
+    now = time.monotonic()
+    if not force and now - _trimmed_at < TRIM_INTERVAL:
+        return
+    _trimmed_at = now
+    buffer_size = getattr(settings, 'SLOW_QUERY_BUFFER_SIZE', 500)
+    oldest_kept = (
+        SlowQuery.objects.using('default')
+        .order_by('-recorded_at')
+        .values_list('recorded_at', flat=True)[buffer_size - 1:buffer_size]
+        .first()
+    )
+    if oldest_kept is not None:
+        SlowQuery.objects.using('default').filter(recorded_at__lt=oldest_kept).delete()
+
+
+def log_slow_query(execute, sql, params, many, context):
+    """Connection execute wrapper recording statements over the threshold"""
+    threshold = getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', 0)
+    if not threshold or getattr(_recording, 'active', False):
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    result = execute(sql, params, many, context)
+    duration = time.perf_counter() - started
+    if duration * 1000 >= threshold:
+        record_slow_query(context['connection'], sql, params, many, duration)
+    return result
+
+
+@receiver(connection_created)
+def install_slow_query_log(sender, connection, **kwargs):
+    """Wrap every new database connection (any alias, any thread)"""
+    if log_slow_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(log_slow_query)
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the Studio CRM API tests
+"""
+
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+@pytest.fixture(autouse=True)
+def primary_reads(settings):
+    """Serve reads from 'default', so they see the test's uncommitted data"""
+    settings.DATABASE_REPLICAS = []
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username='studio-test', email='studio-test@example.com')
+
+
+@pytest.fixture
+def api_client(user):
+    """Client authenticated as `user` with a JWT, like the frontend"""
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+    return client
@@ -0,0 +1,129 @@
+"""
+Batch reads: POST creators/batch_get/ and POST batch/ (BatchViewSet)
+"""
+
+import uuid
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from studio_crm.models import Creator
+from studio_crm.signals import get_current_request, set_current_request
+from studio_crm.views import BatchViewSet, DashboardViewSet
+
+
+@pytest.fixture
+def creators(user):
+    return [
+        Creator.objects.create(
+            creator_name=f'Batch Creator {number}',
+            creator_email=f'batch-{number}@example.com',
+            brand_name=f'Batch Brand {number}',
+            brand_niche='Tech',
+            created_by=user,
+        )
+        for number in range(3)
+    ]
+
+
+@pytest.fixture
+def response_cache(settings):
+    """The dashboard response cache, empty"""
+    settings.RESPONSE_CACHE_TIMEOUT = 30
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def batch(client, *paths):
+    response = client.post('/api/crm/batch/', {'requests': [{'path': path} for path in paths]}, format='json')
+    assert response.status_code == 200, response.content
+    return response.json()['responses']
+
+
+def test_batch_get_order_duplicates_and_missing(api_client, creators):
+    first, second, _ = creators
+    unknown = str(uuid.uuid4())
+    response = api_client.post('/api/crm/creators/batch_get/', {
+        'ids': [str(second.pk), unknown, str(first.pk), str(second.pk)],
+    }, format='json')
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [row['id'] for row in body['results']] == [str(second.pk), str(first.pk)]
+    assert body['missing'] == [unknown]
+
+
+def test_batch_get_rejects_invalid_ids(api_client):
+    response = api_client.post('/api/crm/creators/batch_get/', {'ids': ['not-a-uuid']}, format='json')
+    assert response.status_code == 400
+
+
+def test_sub_requests_in_order(api_client, creators):
+    creator = creators[0]
+    responses = batch(api_client, f'creators/{creator.pk}/', '/api/crm/milestones/?creator_id=' + str(creator.pk))
+
+    assert [response['status'] for response in responses] == [200, 200]
+    assert responses[0]['path'] == f'creators/{creator.pk}/'
+    assert responses[0]['body']['id'] == str(creator.pk)
+    assert responses[1]['body']['results'] == []
+
+
+@pytest.mark.parametrize('path', [
+    '/admin/',
+    '/metrics',
+    '/api/crm/async/creators/',
+    'batch/',
+    '/api/crm/batch/',
+    'no-such-endpoint/',
+])
+def test_only_studio_crm_viewsets_are_served(api_client, path):
+    [response] = batch(api_client, path)
+    assert response == {'path': path, 'status': 404, 'body': {'detail': 'Not found.'}}
+
+
+def test_forbidden_sub_request_fails_alone(api_client, creators, settings):
+    settings.SAMPLING_PROFILER_ENABLED = True
+    responses = batch(api_client, 'creators/', 'profiler/', 'dashboard/status_summary/')
+
+    # The profiler is staff only; the caller is not staff
+    assert [response['status'] for response in responses] == [200, 403, 200]
+    assert responses[0]['body']['count'] == len(creators)
+
+
+def test_cached_dashboard_sub_request(api_client, creators, response_cache, monkeypatch):
+    served = []
+    original = DashboardViewSet.finalize_response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        served.append(type(response))
+        return original(self, request, response, *args, **kwargs)
+
+    monkeypatch.setattr(DashboardViewSet, 'finalize_response', finalize_response)
+    # Sub-responses are not rendered, so only a plain GET fills the cache
+    direct = api_client.get('/api/crm/dashboard/')
+    [response] = batch(api_client, 'dashboard/')
+
+    # The sub-request is a cache hit: a rendered HttpResponse
+    assert served[-1] is HttpResponse
+    assert response['status'] == 200
+    assert response['body'] == direct.json()
+    assert response['body']['total_creators'] == len(creators)
+
+
+def test_current_request_restored(user, creators):
+    request = APIRequestFactory().post('/api/crm/batch/', {
+        'requests': [{'path': 'creators/'}, {'path': 'dashboard/'}],
+    }, format='json')
+    force_authenticate(request, user=user)
+    outer = object()
+
+    set_current_request(outer)
+    try:
+        response = BatchViewSet.as_view({'post': 'create'})(request)
+        assert get_current_request() is outer
+    finally:
+        set_current_request(None)
+    assert [sub_response['status'] for sub_response in response.data['responses']] == [200, 200]
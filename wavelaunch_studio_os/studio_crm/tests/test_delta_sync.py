@@ -0,0 +1,130 @@
+"""
+Delta sync contract: ?updated_since= lists (DeltaSyncMixin), tombstones/
+(TombstoneViewSet) and their SyncCursorPagination pages
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from studio_crm.models import AIDeliverable, Creator, CreatorCredential, Milestone, Tombstone
+
+T0 = timezone.now().replace(microsecond=250000) - timedelta(days=1)
+
+
+def iso(moment):
+    return moment.isoformat()
+
+
+@pytest.fixture
+def creators(user):
+    """Creators updated at T0 + 0..3 minutes, brand names in reverse order"""
+    creators = []
+    for number in range(4):
+        creator = Creator.objects.create(
+            creator_name=f'Sync Creator {number}',
+            creator_email=f'sync-{number}@example.com',
+            brand_name=f'Sync Brand {9 - number}',
+            brand_niche='Tech',
+            created_by=user,
+        )
+        Creator.objects.filter(pk=creator.pk).update(updated_at=T0 + timedelta(minutes=number))
+        creators.append(creator)
+    return creators
+
+
+def sync(client, path, **params):
+    response = client.get(f'/api/crm/{path}', params)
+    assert response.status_code == 200, response.content
+    return response.json()
+
+
+def test_updated_since_is_inclusive(api_client, creators):
+    page = sync(api_client, 'creators/', updated_since=iso(T0 + timedelta(minutes=2)))
+    assert [row['id'] for row in page['results']] == [str(creator.pk) for creator in creators[2:]]
+
+    page = sync(api_client, 'creators/', updated_since=iso(T0 + timedelta(minutes=2, microseconds=1)))
+    assert [row['id'] for row in page['results']] == [str(creators[3].pk)]
+
+
+def test_unencoded_utc_offset(api_client, creators):
+    # A literal '+' in the query string decodes to a space
+    since = iso(T0 + timedelta(minutes=3))
+    assert since.endswith('+00:00')
+    response = api_client.get(f'/api/crm/creators/?updated_since={since}')
+    assert [row['id'] for row in response.json()['results']] == [str(creators[3].pk)]
+
+
+@pytest.mark.parametrize('ordering', ['brand_name', '-updated_at', '-created_at'])
+def test_ordering_is_forced(api_client, creators, ordering):
+    page = sync(api_client, 'creators/', updated_since=iso(T0), ordering=ordering)
+    assert [row['id'] for row in page['results']] == [str(creator.pk) for creator in creators]
+
+
+def test_ties_ordered_by_pk_across_pages(api_client, creators):
+    Creator.objects.update(updated_at=T0)
+    expected = sorted(str(creator.pk) for creator in creators)
+
+    received = []
+    page = sync(api_client, 'creators/', updated_since=iso(T0), page_size=3, ordering='-brand_name')
+    received += [row['id'] for row in page['results']]
+    response = api_client.get(page['next'])
+    received += [row['id'] for row in response.json()['results']]
+    assert received == expected
+
+
+@pytest.mark.parametrize('path, param', [
+    ('creators/', 'updated_since'),
+    ('milestones/', 'updated_since'),
+    ('credentials/', 'updated_since'),
+    ('deliverables/', 'updated_since'),
+    ('tombstones/', 'deleted_since'),
+])
+@pytest.mark.parametrize('value', ['yesterday', '2024-13-01T00:00:00Z', ''])
+def test_bad_timestamp(api_client, path, param, value):
+    response = api_client.get(f'/api/crm/{path}', {param: value})
+    assert response.status_code == 400
+    assert param in response.json()
+
+
+def test_deleted_since_past_retention(api_client, settings):
+    settings.TOMBSTONE_RETENTION_DAYS = 7
+    response = api_client.get('/api/crm/tombstones/', {'deleted_since': iso(timezone.now() - timedelta(days=8))})
+    assert response.status_code == 410
+
+    assert sync(api_client, 'tombstones/', deleted_since=iso(timezone.now() - timedelta(days=6)))['results'] == []
+
+
+@pytest.mark.parametrize('model, path, key', [
+    (Creator, 'creators/', 'creator'),
+    (Milestone, 'milestones/', 'milestone'),
+    (CreatorCredential, 'credentials/', 'credential'),
+    (AIDeliverable, 'deliverables/', 'deliverable'),
+])
+def test_delete_records_tombstone(api_client, user, model, path, key):
+    creator = Creator.objects.create(
+        creator_name='Deleted Creator',
+        creator_email='deleted@example.com',
+        brand_name='Deleted Brand',
+        brand_niche='Tech',
+        created_by=user,
+    )
+    ids = {
+        'creator': creator.pk,
+        'milestone': Milestone.objects.create(creator=creator, title='Kickoff', related_journey_stage='LAUNCH').pk,
+        'credential': CreatorCredential.objects.create(
+            creator=creator, platform_name='Stripe', account_identifier='deleted@example.com', password='secret',
+        ).pk,
+        'deliverable': AIDeliverable.objects.create(
+            creator=creator, deliverable_type='Launch Plan', prompt_used='Plan', context_data={},
+        ).pk,
+    }
+    object_id = ids[key]
+    since = timezone.now() - timedelta(seconds=1)
+
+    assert api_client.delete(f'/api/crm/{path}{object_id}/').status_code == 204
+
+    assert Tombstone.objects.filter(model_name=model._meta.model_name, object_id=object_id).exists()
+    page = sync(api_client, 'tombstones/', deleted_since=iso(since), model_name=model._meta.model_name)
+    assert [row['object_id'] for row in page['results']] == [str(object_id)]
@@ -0,0 +1,200 @@
+"""
+FastSerializer output is identical to the DRF ModelSerializer it is compiled from
+
+Every `fast_actions` endpoint is requested twice: as served (FastSerializer)
+and with FastListMixin patched to serialize model instances through the
+viewset's DRF serializer. The data covers null foreign keys (nested and
+primary key fields), dotted sources, display sources and datetimes with
+microseconds.
+"""
+
+import re
+from datetime import timedelta
+
+import pytest
+from django.urls import resolve
+from django.utils import timezone
+from rest_framework.response import Response
+
+from studio_crm.fast_serializers import FastSerializer
+from studio_crm.models import (
+    AIDeliverable,
+    AuditLog,
+    Creator,
+    CreatorCredential,
+    Milestone,
+    StatusTransition,
+    Tombstone,
+)
+from studio_crm.serializers import (
+    AIDeliverableSerializer,
+    AuditLogSerializer,
+    CreatorListSerializer,
+    CreatorCredentialSerializer,
+    CredentialMetadataSerializer,
+    MilestoneScheduleSerializer,
+    MilestoneSerializer,
+    StatusTransitionSerializer,
+    TombstoneSerializer,
+)
+from studio_crm.urls import router
+from studio_crm.views import FastListMixin
+
+# (method, path template, JSON body); formatted with the ids from `dataset`
+ENDPOINTS = [
+    ('get', 'creators/', None),
+    ('get', 'creators/?ordering=brand_name', None),
+    ('get', 'creators/urgent/', None),
+    ('get', 'creators/by_status/', None),
+    ('post', 'creators/batch_get/', {'ids': ['{creator}', '{orphan}']}),
+    ('get', 'milestones/', None),
+    ('get', 'milestones/by_creator/?creator_id={creator}', None),
+    ('get', 'milestones/overdue/', None),
+    ('get', 'milestones/upcoming/?days=60', None),
+    ('get', 'credentials/', None),
+    ('get', 'audit-logs/', None),
+    ('get', 'audit-logs/recent/', None),
+    ('get', 'audit-logs/by_creator/?creator_id={creator}', None),
+    ('get', 'deliverables/', None),
+    ('get', 'tombstones/?deleted_since={since}', None),
+    ('get', 'status-transitions/', None),
+]
+
+# Custom actions serving fast_serialize() without being in fast_actions
+CUSTOM_FAST_ACTIONS = {'batch_get'}
+
+
+def drf_serialize(self, queryset):
+    return self.get_serializer(queryset, many=True).data
+
+
+def drf_list_response(self, queryset):
+    page = self.paginate_queryset(queryset)
+    if page is not None:
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+    return Response(self.get_serializer(queryset, many=True).data)
+
+
+@pytest.fixture
+def dataset(user):
+    """Rows with and without their optional foreign keys"""
+    now = timezone.now()
+    creator = Creator.objects.create(
+        creator_name='Fast Creator',
+        creator_email='fast@example.com',
+        brand_name='Fast Brand',
+        brand_niche='Tech',
+        created_by=user,
+        last_updated_by=user,
+        journey_status='PAUSED',
+        last_status_change=now - timedelta(days=30, microseconds=123457),
+    )
+    # No created_by / last_updated_by; the audit entry has no user either
+    orphan = Creator.objects.create(
+        creator_name='Orphan Creator',
+        creator_email='orphan@example.com',
+        brand_name='Orphan Brand',
+        brand_niche='Finance',
+        journey_status='LIVE',
+    )
+    for owner in (creator, orphan):
+        Milestone.objects.create(
+            creator=owner,
+            title='Overdue',
+            related_journey_stage='LAUNCH',
+            target_date=(now - timedelta(days=3)).date(),
+        )
+        Milestone.objects.create(
+            creator=owner,
+            title='Upcoming',
+            related_journey_stage='LIVE',
+            target_date=(now + timedelta(days=10)).date(),
+        )
+        Milestone.objects.create(
+            creator=owner,
+            title='Done',
+            related_journey_stage='ONBOARDING',
+            is_completed=True,
+            completed_date=now.date(),
+        )
+        CreatorCredential.objects.create(
+            creator=owner,
+            created_by=user if owner is creator else None,
+            platform_name='Shopify Admin',
+            account_identifier=owner.creator_email,
+            password='secret',
+        )
+        AIDeliverable.objects.create(
+            creator=owner,
+            created_by=user if owner is creator else None,
+            deliverable_type='Launch Plan',
+            prompt_used='Generate a launch plan',
+            context_data={'brand_name': owner.brand_name, 'nested': {'list': [1, 2.5, None]}},
+            generated_content='Plan',
+        )
+    AuditLog.objects.create(
+        user=None,
+        user_email='system',
+        action_type='UPDATE',
+        target_model='Creator',
+        target_id=orphan.pk,
+        target_display=str(orphan),
+    )
+    StatusTransition.objects.create(creator=orphan, from_status='LAUNCH', to_status='LIVE', changed_by=None)
+    Creator.refresh_health_scores()
+    Tombstone.objects.create(model_name='milestone', object_id=orphan.pk)
+    return {
+        'creator': creator.pk,
+        'orphan': orphan.pk,
+        'since': (now - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+    }
+
+
+def request(client, method, path, body, ids):
+    url = '/api/crm/' + path.format(**ids)
+    if body is not None:
+        body = {key: [item.format(**ids) for item in value] for key, value in body.items()}
+    response = getattr(client, method)(url, body, format='json')
+    assert response.status_code == 200, response.content
+    return response.content
+
+
+@pytest.mark.parametrize('endpoint', ENDPOINTS, ids=lambda endpoint: endpoint[1])
+def test_endpoint_matches_drf_serializer(api_client, dataset, monkeypatch, endpoint):
+    fast = request(api_client, *endpoint, dataset)
+
+    monkeypatch.setattr(FastListMixin, 'fast_serialize', drf_serialize)
+    monkeypatch.setattr(FastListMixin, 'fast_list_response', drf_list_response)
+    assert request(api_client, *endpoint, dataset) == fast
+
+
+def test_every_fast_action_is_compared():
+    compared = set()
+    for method, path, _ in ENDPOINTS:
+        view = resolve('/api/crm/' + re.sub(r'{\w+}', '1', path.split('?')[0])).func
+        compared.add((view.cls, view.actions[method]))
+    for _, viewset, _ in router.registry:
+        for action in getattr(viewset, 'fast_actions', ()):
+            assert (viewset, action) in compared, f'{viewset.__name__}.{action}'
+        for action in CUSTOM_FAST_ACTIONS & {extra.__name__ for extra in viewset.get_extra_actions()}:
+            assert (viewset, action) in compared, f'{viewset.__name__}.{action}'
+
+
+@pytest.mark.parametrize('serializer_class', [
+    AIDeliverableSerializer,
+    AuditLogSerializer,
+    CreatorCredentialSerializer,
+    CreatorListSerializer,
+    CredentialMetadataSerializer,
+    MilestoneScheduleSerializer,
+    MilestoneSerializer,
+    StatusTransitionSerializer,
+    TombstoneSerializer,
+], ids=lambda serializer_class: serializer_class.__name__)
+def test_serialize_matches_drf(dataset, serializer_class):
+    queryset = serializer_class.Meta.model.objects.order_by('pk')
+    fast = FastSerializer.for_serializer(serializer_class).serialize(queryset)
+    drf = serializer_class(queryset, many=True).data
+
+    assert fast == drf
+    assert [list(row) for row in fast] == [list(row) for row in drf]
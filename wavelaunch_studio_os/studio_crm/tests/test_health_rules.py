@@ -0,0 +1,135 @@
+"""
+HealthRules.evaluate (Python, on save) agrees with Creator.health_score_expression()
+(SQL CASE, bulk rescoring and live scores) on the boundary values of every condition
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from studio_crm.health_rules import DEFAULT_HEALTH_RULES, HealthRules, active_health_rules
+from studio_crm.models import Creator, HealthScore, JourneyStatus
+
+NOW = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+ALL_STATUSES = JourneyStatus.values
+
+
+def idle(days, **extra):
+    """last_status_change `days` (may be fractional) before NOW"""
+    return {'last_status_change': NOW - timedelta(days=days, **extra)}
+
+
+def idle_boundaries(n):
+    # (now - last_status_change).days > n flips exactly at n + 1 whole days
+    return [
+        idle(n),
+        idle(n + 1, microseconds=-1),
+        idle(n + 1),
+        idle(n + 1, microseconds=1),
+        idle(n + 2),
+    ]
+
+
+FOLLOW_UPS = [
+    {'next_follow_up_date': None},
+    {'next_follow_up_date': NOW.date() - timedelta(days=1)},
+    {'next_follow_up_date': NOW.date()},
+    {'next_follow_up_date': NOW.date() + timedelta(days=1)},
+]
+
+# (rule set, creator attribute sets around the rule's boundaries)
+CASES = [
+    ([{'score': 'RED', 'idle_days_over': 0}], idle_boundaries(0)),
+    ([{'score': 'RED', 'idle_days_over': 14}], idle_boundaries(14)),
+    ([{'score': 'YELLOW', 'journey_status_in': ['PAUSED', 'LAUNCH']}],
+     [{'journey_status': status} for status in ALL_STATUSES]),
+    ([{'score': 'YELLOW', 'follow_up_overdue': True}], FOLLOW_UPS),
+    ([{'score': 'YELLOW', 'follow_up_overdue': False}], FOLLOW_UPS),
+    ([{'score': 'YELLOW', 'overdue_milestones_over': 0}],
+     [{'overdue_milestone_count': count} for count in (0, 1, 2)]),
+    ([{'score': 'YELLOW', 'overdue_milestones_over': 3}],
+     [{'overdue_milestone_count': count} for count in (2, 3, 4)]),
+    # All conditions together, and rule order (first match wins)
+    ([
+        {'score': 'RED', 'idle_days_over': 7, 'journey_status_in': ['ONBOARDING'],
+         'follow_up_overdue': True, 'overdue_milestones_over': 1},
+        {'score': 'YELLOW', 'idle_days_over': 7},
+    ], [
+        {**idle(days), 'journey_status': status, 'next_follow_up_date': follow_up, 'overdue_milestone_count': count}
+        for days in (7, 8)
+        for status in ('ONBOARDING', 'LIVE')
+        for follow_up in (None, NOW.date() - timedelta(days=1))
+        for count in (1, 2)
+    ]),
+    # The default rules at each of their thresholds, for every status
+    (DEFAULT_HEALTH_RULES, [
+        {**idle(days), 'journey_status': status}
+        for days in (0, 7, 8, 14, 15, 30, 31)
+        for status in ALL_STATUSES
+    ]),
+]
+
+
+@pytest.fixture
+def make_creator(user):
+    count = iter(range(10 ** 6))
+
+    def make(attributes):
+        number = next(count)
+        creator = Creator.objects.create(
+            creator_name=f'Health {number}',
+            creator_email=f'health-{number}@example.com',
+            brand_name=f'Health Brand {number}',
+            brand_niche='Tech',
+            created_by=user,
+        )
+        # Bypass save(), which rescores and may touch last_status_change
+        Creator.objects.filter(pk=creator.pk).update(**attributes)
+        return Creator.objects.get(pk=creator.pk)
+    return make
+
+
+@pytest.mark.parametrize('rules, attribute_sets', CASES, ids=[
+    'idle_days_over=0', 'idle_days_over=14', 'journey_status_in', 'follow_up_overdue=true',
+    'follow_up_overdue=false', 'overdue_milestones_over=0', 'overdue_milestones_over=3', 'combined', 'defaults',
+])
+def test_evaluate_matches_expression(settings, make_creator, rules, attribute_sets):
+    settings.HEALTH_RULES = rules
+    creators = [make_creator(attributes) for attributes in attribute_sets]
+
+    in_sql = dict(
+        Creator.objects.filter(pk__in=[creator.pk for creator in creators])
+        .annotate(expected=Creator.health_score_expression(NOW))
+        .values_list('pk', 'expected')
+    )
+    for creator, attributes in zip(creators, attribute_sets):
+        assert active_health_rules().evaluate(creator, NOW) == in_sql[creator.pk], attributes
+
+
+def test_boundaries_flip_the_score(make_creator):
+    """The boundary values above are where scores change"""
+    rules = HealthRules([{'score': 'RED', 'idle_days_over': 14}])
+    assert rules.evaluate(make_creator(idle(15, microseconds=-1)), NOW) == HealthScore.GREEN
+    assert rules.evaluate(make_creator(idle(15)), NOW) == HealthScore.RED
+
+    rules = HealthRules([{'score': 'YELLOW', 'follow_up_overdue': True}])
+    assert rules.evaluate(make_creator({'next_follow_up_date': NOW.date()}), NOW) == HealthScore.GREEN
+    overdue = make_creator({'next_follow_up_date': NOW.date() - timedelta(days=1)})
+    assert rules.evaluate(overdue, NOW) == HealthScore.YELLOW
+
+
+@pytest.mark.parametrize('spec', [
+    {'score': 'RED'},
+    {'score': 'BLUE', 'idle_days_over': 1},
+    {'score': 'RED', 'idle_days_over': -1},
+    {'score': 'RED', 'idle_days_over': True},
+    {'score': 'RED', 'journey_status_in': 'LIVE'},
+    {'score': 'RED', 'journey_status_in': ['UNKNOWN']},
+    {'score': 'RED', 'follow_up_overdue': 1},
+    {'score': 'RED', 'unknown_condition': 1},
+])
+def test_invalid_rules_rejected(spec):
+    with pytest.raises(ImproperlyConfigured):
+        HealthRules([spec])
@@ -0,0 +1,111 @@
+"""
+Page-number pagination with estimated counts (EstimatedCountPaginator)
+
+estimated_count() only estimates on PostgreSQL, so it is patched to report
+an approximate count below the real number of rows.
+"""
+
+import pytest
+from django.core.paginator import EmptyPage, PageNotAnInteger
+
+from studio_crm import pagination
+from studio_crm.models import Creator
+from studio_crm.pagination import EstimatedCountPagination, EstimatedCountPaginator
+
+
+@pytest.fixture
+def creators(user):
+    """Five creators"""
+    return [
+        Creator.objects.create(
+            creator_name=f'Page Creator {number}',
+            creator_email=f'page-{number}@example.com',
+            brand_name=f'Page Brand {number}',
+            brand_niche='Tech',
+            created_by=user,
+        )
+        for number in range(5)
+    ]
+
+
+@pytest.fixture
+def estimate(monkeypatch):
+    """Make estimated_count() return (n, True)"""
+    def patch(n):
+        monkeypatch.setattr(pagination, 'estimated_count', lambda queryset, threshold=None: (n, True))
+    return patch
+
+
+def paginator(per_page=2):
+    return EstimatedCountPaginator(Creator.objects.order_by('brand_name'), per_page)
+
+
+def test_exact_count_keeps_django_behaviour(creators):
+    exact = paginator()
+    assert (exact.count, exact.approximate, exact.num_pages) == (5, False, 3)
+    assert not exact.page(3).has_next()
+    with pytest.raises(EmptyPage):
+        exact.page(4)
+
+
+def test_pages_beyond_the_estimate(creators, estimate):
+    estimate(2)
+    estimated = paginator()
+    assert (estimated.count, estimated.approximate, estimated.num_pages) == (2, True, 1)
+
+    # Full pages past the estimated last page, then the short last page
+    assert [creator.brand_name for creator in estimated.page(2)] == ['Page Brand 2', 'Page Brand 3']
+    assert estimated.page(2).has_next()
+    assert [creator.brand_name for creator in estimated.page(3)] == ['Page Brand 4']
+    assert not estimated.page(3).has_next()
+
+    # Past the real rows: an empty page, not EmptyPage
+    page = estimated.page(10)
+    assert list(page) == []
+    assert not page.has_next()
+
+
+def test_full_page_has_next(creators, estimate):
+    # A full page may be followed by more rows, even if the estimate says not
+    estimate(4)
+    assert paginator(per_page=4).page(1).has_next()
+    estimate(100)
+    assert paginator(per_page=5).page(1).has_next()
+    assert not paginator(per_page=6).page(1).has_next()
+
+
+@pytest.mark.parametrize('number, error', [(0, EmptyPage), (-1, EmptyPage), ('last', PageNotAnInteger)])
+def test_invalid_page_numbers_still_raise(creators, estimate, number, error):
+    estimate(2)
+    with pytest.raises(error):
+        paginator().page(number)
+
+
+@pytest.mark.parametrize('approximate', [False, True])
+def test_count_approximate_in_response(api_client, creators, estimate, monkeypatch, approximate):
+    monkeypatch.setattr(EstimatedCountPagination, 'page_size', 2)
+    if approximate:
+        estimate(3)
+
+    body = api_client.get('/api/crm/creators/', {'ordering': 'brand_name'}).json()
+    assert body['count'] == (3 if approximate else 5)
+    assert body['count_approximate'] is approximate
+    assert body['next'] is not None
+    assert len(body['results']) == 2
+
+
+def test_page_past_estimate_served_empty(api_client, creators, estimate, monkeypatch):
+    monkeypatch.setattr(EstimatedCountPagination, 'page_size', 2)
+    estimate(1)
+
+    response = api_client.get('/api/crm/creators/', {'ordering': 'brand_name', 'page': 2})
+    assert response.status_code == 200
+    assert [row['brand_name'] for row in response.json()['results']] == ['Page Brand 2', 'Page Brand 3']
+    assert response.json()['next'] is not None
+
+    response = api_client.get('/api/crm/creators/', {'page': 4})
+    assert response.status_code == 200
+    assert response.json()['results'] == []
+    assert response.json()['next'] is None
+
+    assert api_client.get('/api/crm/creators/', {'page': 0}).status_code == 404
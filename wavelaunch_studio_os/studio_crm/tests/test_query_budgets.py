@@ -0,0 +1,311 @@
+"""
+Query budgets
+
+Exercises every viewset action at several data sizes and verifies that the
+number of SQL queries each request issues
+- stays within the action's declared budget (QueryBudgetMixin.query_budgets)
+- does not change with data size: neither with the number of creators (page
+  size) nor with the number of rows each creator owns (e.g. the rows a
+  creator delete cascades to)
+"""
+
+import re
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test.utils import override_settings
+from django.urls import resolve
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from studio_crm.models import AIDeliverable, AuditLog, Creator, CreatorCredential, CreatorStatsSnapshot, Milestone
+from studio_crm.profiling import count_queries
+from studio_crm.urls import router
+
+# (creators, milestones / credentials / deliverables per creator). Each
+# creator has overdue and upcoming milestones; Django deletes cascaded rows
+# in batches of 100, so the children per creator stay below that.
+SIZES = [(2, 2), (10, 5), (40, 12)]
+
+# (method, path template, JSON body). Paths are relative to /api/crm/ and
+# formatted with the ids of a sample creator and its related rows.
+ACTIONS = [
+    ('get', 'creators/', None),
+    ('get', 'creators/{creator}/', None),
+    ('post', 'creators/', {
+        'creator_name': 'Budget Check',
+        'creator_email': 'budget-check-new@example.com',
+        'brand_name': 'Budget Brand',
+        'brand_niche': 'Tech',
+    }),
+    ('put', 'creators/{creator}/', {
+        'creator_name': 'Budget Check',
+        'creator_email': 'budget-check-put@example.com',
+        'brand_name': 'Budget Brand',
+        'brand_niche': 'Tech',
+        'priority_level': 2,
+    }),
+    ('patch', 'creators/{creator}/', {'priority_level': 2}),
+    # Moves the creator to another CreatorStatsSnapshot bucket
+    ('patch', 'creators/{creator}/', {'journey_status': 'PAUSED', 'is_active': False}),
+    ('put', 'creators/{creator}/', {
+        'creator_name': 'Budget Check',
+        'creator_email': 'budget-check-put@example.com',
+        'brand_name': 'Budget Brand',
+        'brand_niche': 'Tech',
+        'journey_status': 'PAUSED',
+        'is_active': False,
+    }),
+    ('delete', 'creators/{creator}/', None),
+    ('post', 'creators/{creator}/update_journey_status/', {'journey_status': 'LAUNCH'}),
+    ('get', 'creators/{creator}/bundle/', None),
+    ('post', 'creators/batch_get/', {'ids': ['{creator}', '{creator}']}),
+    ('get', 'creators/urgent/', None),
+    ('get', 'creators/by_status/', None),
+    ('get', 'milestones/', None),
+    ('get', 'milestones/{milestone}/', None),
+    ('post', 'milestones/', {
+        'creator': '{creator}',
+        'title': 'Budget Milestone',
+        'related_journey_stage': 'LAUNCH',
+    }),
+    ('put', 'milestones/{milestone}/', {
+        'creator': '{creator}',
+        'title': 'Budget Milestone',
+        'related_journey_stage': 'LIVE',
+    }),
+    ('patch', 'milestones/{milestone}/', {'title': 'Renamed'}),
+    # Moves the milestone's counters to another creator
+    ('patch', 'milestones/{milestone}/', {'creator': '{other_creator}'}),
+    ('put', 'milestones/{milestone}/', {
+        'creator': '{other_creator}',
+        'title': 'Budget Milestone',
+        'related_journey_stage': 'LIVE',
+        'is_completed': True,
+    }),
+    ('delete', 'milestones/{milestone}/', None),
+    ('get', 'milestones/by_creator/?creator_id={creator}', None),
+    ('post', 'milestones/{milestone}/mark_complete/', None),
+    ('get', 'milestones/overdue/', None),
+    ('get', 'milestones/upcoming/?days=60', None),
+    ('get', 'credentials/', None),
+    ('get', 'credentials/{credential}/', None),
+    ('post', 'credentials/', {
+        'creator': '{creator}',
+        'platform_name': 'Stripe',
+        'account_identifier': 'budget@example.com',
+        'password': 'budget-secret',
+    }),
+    ('put', 'credentials/{credential}/', {
+        'creator': '{creator}',
+        'platform_name': 'Stripe',
+        'account_identifier': 'budget@example.com',
+    }),
+    ('patch', 'credentials/{credential}/', {'notes': 'rotated'}),
+    # Moves the credential's counters to another creator
+    ('patch', 'credentials/{credential}/', {'creator': '{other_creator}', 'is_active': False}),
+    ('put', 'credentials/{credential}/', {
+        'creator': '{other_creator}',
+        'platform_name': 'Stripe',
+        'account_identifier': 'budget@example.com',
+        'is_active': False,
+    }),
+    ('delete', 'credentials/{credential}/', None),
+    ('get', 'audit-logs/', None),
+    ('get', 'audit-logs/{audit_log}/', None),
+    ('get', 'audit-logs/recent/', None),
+    ('get', 'audit-logs/by_creator/?creator_id={creator}', None),
+    ('get', 'deliverables/', None),
+    ('get', 'deliverables/{deliverable}/', None),
+    # Deliverables are created by the generation workflow: the API exposes
+    # `creator` read-only, so create is not exercised here
+    ('put', 'deliverables/{deliverable}/', {
+        'deliverable_type': 'Launch Plan',
+        'prompt_used': 'Generate a launch plan',
+        'context_data': {},
+        'generated_content': 'Launch plan',
+        'status': 'COMPLETED',
+    }),
+    ('patch', 'deliverables/{deliverable}/', {'status': 'COMPLETED'}),
+    ('delete', 'deliverables/{deliverable}/', None),
+    ('get', 'tombstones/?deleted_since={since}', None),
+    ('get', 'status-transitions/', None),
+    ('get', 'status-transitions/{status_transition}/', None),
+    ('get', 'status-transitions/funnel/', None),
+    ('get', 'status-transitions/time_in_stage/?created_after={since}', None),
+    ('get', 'dashboard/', None),
+    ('get', 'dashboard/health_summary/', None),
+    ('get', 'dashboard/status_summary/', None),
+    ('get', 'dashboard/health_trend/?days=90', None),
+]
+
+STANDARD_ACTIONS = ['list', 'retrieve', 'create', 'update', 'partial_update', 'destroy']
+
+
+class Rollback(Exception):
+    """Raised to roll back the data created for a measurement"""
+
+
+def format_value(value, ids):
+    if isinstance(value, str):
+        return value.format(**ids)
+    if isinstance(value, list):
+        return [format_value(item, ids) for item in value]
+    return value
+
+
+def format_body(body, ids):
+    if body is None:
+        return None
+    return {key: format_value(value, ids) for key, value in body.items()}
+
+
+def action_id(action):
+    method, path, body = action
+    fields = ','.join(body) if method in ('put', 'patch') else ''
+    return f"{method.upper()} {path.split('?')[0]} {fields}".rstrip()
+
+
+def describe(method, path):
+    """(viewset, action) serving a request"""
+    view = resolve('/api/crm/' + re.sub(r'{\w+}', '1', path.split('?')[0])).func
+    return view.cls, view.actions[method]
+
+
+def create_creator(user, index, children, now):
+    """A creator with `children` milestones, credentials and deliverables"""
+    creator = Creator.objects.create(
+        creator_name=f'Budget Creator {index}',
+        creator_email=f'budget-creator-{index}@example.com',
+        brand_name=f'Budget Brand {index}',
+        brand_niche='Tech',
+        created_by=user,
+        last_updated_by=user,
+        journey_status=['ONBOARDING', 'BRAND_BUILDING', 'LIVE'][index % 3],
+        last_status_change=now - timedelta(days=index),
+    )
+    Milestone.objects.bulk_create(
+        Milestone(
+            creator=creator,
+            title=f'Milestone {number}',
+            related_journey_stage='LAUNCH',
+            # Half overdue, half upcoming
+            target_date=(now + timedelta(days=30 if number % 2 else -5)).date(),
+        )
+        for number in range(children)
+    )
+    CreatorCredential.objects.bulk_create(
+        CreatorCredential(
+            creator=creator,
+            created_by=user,
+            platform_name=f'Platform {number}',
+            account_identifier=creator.creator_email,
+            password='budget-secret',
+        )
+        for number in range(children)
+    )
+    AIDeliverable.objects.bulk_create(
+        AIDeliverable(
+            creator=creator,
+            created_by=user,
+            deliverable_type='Brand Guidelines',
+            prompt_used='Generate brand guidelines',
+            context_data={'brand_name': creator.brand_name},
+            generated_content='Guidelines',
+            status='COMPLETED',
+        )
+        for number in range(children)
+    )
+    return creator
+
+
+def create_data(user, creators, children):
+    """`creators` creators with `children` rows of each kind; ids for path templates"""
+    now = timezone.now()
+    creator = create_creator(user, 0, children, now)
+    other_creator = create_creator(user, 1, children, now)
+    for index in range(2, creators):
+        create_creator(user, index, children, now)
+
+    # Counters, health scores and stats as the daily jobs leave them
+    Creator.refresh_counters()
+    Creator.refresh_health_scores()
+    CreatorStatsSnapshot.rebuild()
+
+    return {
+        'creator': creator.pk,
+        'other_creator': other_creator.pk,
+        'milestone': creator.milestones.values_list('pk', flat=True).first(),
+        'credential': creator.credentials.values_list('pk', flat=True).first(),
+        'audit_log': AuditLog.objects.filter(target_id=creator.pk).values_list('pk', flat=True).first(),
+        'deliverable': creator.deliverables.values_list('pk', flat=True).first(),
+        'status_transition': creator.status_transitions.values_list('pk', flat=True).first(),
+        'since': (now - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+    }
+
+
+def measure(client, method, url, body):
+    """(status code, queries) of one request; writes are rolled back"""
+    try:
+        with transaction.atomic():
+            with count_queries() as queries:
+                response = getattr(client, method)(url, body, format='json')
+            raise Rollback()
+    except Rollback:
+        pass
+    return response.status_code, len(queries)
+
+
+@pytest.fixture(scope='module')
+def measurements(django_db_setup, django_db_blocker):
+    """{(index in ACTIONS, size): (status code, queries)} for every action at every size"""
+    results = {}
+    # Reads stay on 'default' so they see the uncommitted test data, and every
+    # request is served by its view, never the response cache
+    with django_db_blocker.unblock(), override_settings(
+        DATABASE_REPLICAS=[],
+        QUERY_BUDGET_MODE='off',
+        QUERY_PROFILING_SAMPLE_RATE=0,
+        RESPONSE_CACHE_TIMEOUT=0,
+    ):
+        for size in SIZES:
+            try:
+                with transaction.atomic():
+                    user = User.objects.create_user(username='query-budget', email='query-budget@example.com')
+                    client = APIClient()
+                    client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+                    ids = create_data(user, *size)
+                    for index, (method, path, body) in enumerate(ACTIONS):
+                        url = '/api/crm/' + path.format(**ids)
+                        results[index, size] = measure(client, method, url, format_body(body, ids))
+                    raise Rollback()
+            except Rollback:
+                pass
+    return results
+
+
+@pytest.mark.parametrize('size', SIZES, ids=lambda size: f'{size[0]}x{size[1]}')
+@pytest.mark.parametrize('action', ACTIONS, ids=action_id)
+def test_within_budget(measurements, action, size):
+    method, path, _ = action
+    viewset, name = describe(method, path)
+    status, queries = measurements[ACTIONS.index(action), size]
+    assert status < 400
+    assert queries <= viewset.query_budgets[name], f'{viewset.__name__}.{name}'
+
+
+@pytest.mark.parametrize('action', ACTIONS, ids=action_id)
+def test_independent_of_data_size(measurements, action):
+    counts = {size: measurements[ACTIONS.index(action), size][1] for size in SIZES}
+    assert len(set(counts.values())) == 1, counts
+
+
+def test_every_action_has_budget():
+    for _, viewset, _ in router.registry:
+        actions = [name for name in STANDARD_ACTIONS if hasattr(viewset, name)]
+        actions += [extra.__name__ for extra in viewset.get_extra_actions()]
+        for action in actions:
+            assert action in viewset.query_budgets, f'{viewset.__name__}.{action}: no query budget declared'
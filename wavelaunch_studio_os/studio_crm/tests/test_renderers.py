@@ -0,0 +1,109 @@
+"""
+ORJSONRenderer / ORJSONParser agree with DRF's JSONRenderer / JSONParser
+"""
+
+import io
+import json
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from studio_crm import renderers
+from studio_crm.renderers import ORJSONParser, ORJSONRenderer
+
+needs_orjson = pytest.mark.skipif(renderers.orjson is None, reason='orjson not installed')
+
+# Rendered to the same bytes by both renderers
+IDENTICAL = [
+    {'id': uuid.UUID('6f1c2b8e-3a57-4c1e-9a43-1d2e3f4a5b6c'), 'name': 'Brand', 'count': 3},
+    {'at': datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc)},
+    {'at': datetime(2024, 1, 2, 3, 4, 5)},
+    {'day': date(2024, 1, 31), 'time': time(9, 30, 15, 250000)},
+    {'amount': Decimal('1.50'), 'ratio': 0.1, 'negative': -0.0},
+    {'text': 'café \u2028 line \u2029 paragraph <b>'},
+    {'label': gettext_lazy('Active'), 'elapsed': timedelta(hours=1)},
+    {1: 'int key', 'nested': [None, True, False, {'deep': []}]},
+    [],
+]
+
+
+@needs_orjson
+@pytest.mark.parametrize('data', IDENTICAL)
+def test_same_bytes_as_json_renderer(data):
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@needs_orjson
+@pytest.mark.parametrize('value', [1e-05, 1e16, 1e22, 123456789.123, 2.5e-300])
+def test_floats_parse_to_the_same_number(value):
+    # Spelling may differ (orjson 0.00001, stdlib 1e-05), the value does not
+    assert json.loads(ORJSONRenderer().render({'v': value})) == json.loads(JSONRenderer().render({'v': value}))
+
+
+@needs_orjson
+def test_non_finite_floats_render_as_null():
+    with pytest.raises(ValueError):
+        JSONRenderer().render({'v': float('nan')})
+    assert ORJSONRenderer().render({'v': float('nan'), 'w': float('inf')}) == b'{"v":null,"w":null}'
+
+
+def test_none_renders_empty_body():
+    assert ORJSONRenderer().render(None) == b''
+
+
+def test_indent_falls_back_to_json_renderer():
+    data = {'a': [1, 2]}
+    media_type = 'application/json; indent=4'
+    assert ORJSONRenderer().render(data, media_type) == JSONRenderer().render(data, media_type)
+
+
+@needs_orjson
+def test_unsupported_payload_falls_back_to_json_renderer():
+    data = {'v': 2 ** 70}
+    assert ORJSONRenderer().render(data) == b'{"v":1180591620717411303424}'
+
+
+def parse(parser, body, encoding='utf-8'):
+    return parser.parse(io.BytesIO(body), 'application/json', {'encoding': encoding})
+
+
+@pytest.mark.parametrize('body', [
+    b'{"name": "caf\xc3\xa9", "ids": [1, 2.5, null, true], "nested": {"a": {}}}',
+    b'[]',
+    b'"\\u2028"',
+])
+def test_parser_matches_json_parser(body):
+    assert parse(ORJSONParser(), body) == parse(JSONParser(), body)
+
+
+@pytest.mark.parametrize('body', [b'{"a": ', b'{"a": NaN}', b'{"a": Infinity}', b'\xff'])
+def test_parser_rejects_what_json_parser_rejects(body):
+    with pytest.raises(ParseError):
+        parse(JSONParser(), body)
+    with pytest.raises(ParseError):
+        parse(ORJSONParser(), body)
+
+
+def test_parser_other_encodings():
+    body = '{"name": "café"}'.encode('latin-1')
+    assert parse(ORJSONParser(), body, 'latin-1') == {'name': 'café'}
+
+
+def test_api_round_trip(api_client):
+    response = api_client.post('/api/crm/creators/', {
+        'creator_name': 'Render Test',
+        'creator_email': 'render@example.com',
+        'brand_name': 'Café \u2028 Brand',
+        'brand_niche': 'Tech',
+    }, format='json')
+
+    assert response.status_code == 201
+    assert response['Content-Type'] == 'application/json'
+    assert b'\\u2028' in response.content
+    assert json.loads(response.content)['brand_name'] == 'Café \u2028 Brand'
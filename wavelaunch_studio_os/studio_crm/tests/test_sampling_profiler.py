@@ -0,0 +1,35 @@
+"""
+Sampling profiler sessions reach every worker through the cache
+"""
+
+import pytest
+
+
+@pytest.fixture
+def staff_client(user, api_client, settings):
+    user.is_staff = True
+    user.save()
+    settings.SAMPLING_PROFILER_ENABLED = True
+    return api_client
+
+
+def test_refused_with_per_process_cache(staff_client, settings):
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+    response = staff_client.post('/api/crm/profiler/start/', {'sample_rate': 0.5}, format='json')
+    assert response.status_code == 503
+    assert 'LocMemCache' in response.json()['detail']
+    assert staff_client.post('/api/crm/profiler/stop/').status_code == 503
+
+
+def test_session_in_shared_cache(staff_client, settings, tmp_path):
+    settings.CACHES = {'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': str(tmp_path),
+    }}
+
+    response = staff_client.post('/api/crm/profiler/start/', {'sample_rate': 0.5}, format='json')
+    assert response.status_code == 201
+    assert staff_client.get('/api/crm/profiler/').json()['session']['id'] == response.json()['id']
+    assert staff_client.post('/api/crm/profiler/stop/').json()['session']['id'] == response.json()['id']
+    assert staff_client.get('/api/crm/profiler/').json()['session'] is None
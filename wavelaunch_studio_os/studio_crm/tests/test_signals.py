@@ -0,0 +1,64 @@
+"""
+Deletion bookkeeping: counters, tombstones and audit entries
+"""
+
+from studio_crm.models import AuditLog, Creator, CreatorCredential, Milestone, Tombstone
+
+
+def make_creator(user, email):
+    creator = Creator.objects.create(
+        creator_name='Signal Creator',
+        creator_email=email,
+        brand_name='Signal Brand',
+        brand_niche='Tech',
+        created_by=user,
+    )
+    for number in range(3):
+        Milestone.objects.create(creator=creator, title=f'Milestone {number}', related_journey_stage='LAUNCH')
+        CreatorCredential.objects.create(
+            creator=creator,
+            created_by=user,
+            platform_name=f'Platform {number}',
+            account_identifier=email,
+            password='secret',
+        )
+    return creator
+
+
+def test_creator_delete_records_cascaded_rows(user):
+    creator = make_creator(user, 'cascade@example.com')
+    credential_ids = set(creator.credentials.values_list('pk', flat=True))
+    milestone_ids = set(creator.milestones.values_list('pk', flat=True))
+
+    Creator.objects.get(pk=creator.pk).delete()
+
+    tombstones = set(Tombstone.objects.values_list('model_name', 'object_id'))
+    assert ('creator', creator.pk) in tombstones
+    assert {('creatorcredential', pk) for pk in credential_ids} <= tombstones
+    assert {('milestone', pk) for pk in milestone_ids} <= tombstones
+    deleted = AuditLog.objects.filter(action_type='DELETE', target_model='CreatorCredential')
+    assert set(deleted.values_list('target_id', flat=True)) == credential_ids
+    assert set(deleted.values_list('target_display', flat=True)) == {
+        f'Signal Brand - Platform {number}' for number in range(3)
+    }
+
+
+def test_queryset_delete_of_several_creators(user):
+    first = make_creator(user, 'first@example.com')
+    second = make_creator(user, 'second@example.com')
+
+    Creator.objects.filter(pk__in=[first.pk, second.pk]).delete()
+
+    assert Tombstone.objects.filter(model_name='creatorcredential').count() == 6
+    assert AuditLog.objects.filter(action_type='DELETE', target_model='CreatorCredential').count() == 6
+
+
+def test_child_delete_updates_counters(user):
+    creator = make_creator(user, 'child@example.com')
+
+    creator.credentials.first().delete()
+    creator.milestones.first().delete()
+
+    creator.refresh_from_db()
+    assert (creator.milestone_count, creator.credential_count) == (2, 2)
+    assert Tombstone.objects.filter(model_name='creatorcredential').count() == 1
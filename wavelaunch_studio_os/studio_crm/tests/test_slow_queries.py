@@ -0,0 +1,70 @@
+"""
+Slow query log: nothing is written inside the request, the buffer is trimmed
+"""
+
+import time
+
+import pytest
+from django.db import connection
+
+from studio_crm import slow_queries
+from studio_crm.models import SlowQuery
+
+
+def slow_execute(sql, params, many, context):
+    time.sleep(0.005)
+
+
+@pytest.fixture(autouse=True)
+def empty_queue():
+    slow_queries._pending.clear()
+    yield
+    slow_queries._pending.clear()
+
+
+def test_wrapper_only_queues(db, settings, django_assert_num_queries):
+    settings.SLOW_QUERY_THRESHOLD_MS = 1
+
+    with django_assert_num_queries(0):
+        slow_queries.log_slow_query(slow_execute, 'SELECT 1', (), False, {'connection': connection})
+
+    assert len(slow_queries._pending) == 1
+    assert not SlowQuery.objects.exists()
+
+    slow_queries.flush_slow_queries()
+    stored = SlowQuery.objects.get()
+    assert (stored.sql, stored.database) == ('SELECT 1', 'default')
+    assert stored.duration_ms >= 1
+    assert not slow_queries._pending
+
+
+def test_fast_statements_are_not_queued(db, settings):
+    settings.SLOW_QUERY_THRESHOLD_MS = 1000
+
+    slow_queries.log_slow_query(slow_execute, 'SELECT 1', (), False, {'connection': connection})
+
+    assert not slow_queries._pending
+
+
+def test_trim_keeps_newest(db, settings):
+    settings.SLOW_QUERY_BUFFER_SIZE = 3
+    for number in range(5):
+        SlowQuery.objects.create(database='default', duration_ms=number, sql=f'SELECT {number}')
+
+    # Not due yet: trims run at most once per TRIM_INTERVAL
+    slow_queries._trimmed_at = time.monotonic()
+    slow_queries.trim_slow_queries()
+    assert SlowQuery.objects.count() == 5
+
+    slow_queries.trim_slow_queries(force=True)
+    assert sorted(SlowQuery.objects.values_list('duration_ms', flat=True)) == [2, 3, 4]
+
+
+def test_stored_after_the_response(api_client, settings):
+    settings.SLOW_QUERY_THRESHOLD_MS = 0.000001
+
+    response = api_client.get('/api/crm/creators/')
+
+    assert response.status_code == 200
+    assert not slow_queries._pending
+    assert SlowQuery.objects.filter(view__startswith='CreatorViewSet').exists()
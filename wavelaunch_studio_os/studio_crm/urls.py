@@ -3,15 +3,28 @@ Studio CRM URL Configuration
 Epic 2: Project Lifecycle Visibility & Tracking - REST API endpoints
 """
 
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from .async_views import (
+    AsyncCreatorListView,
+    AsyncCreatorDetailView,
+    AsyncDashboardView,
+    AsyncHealthSummaryView,
+    AsyncStatusSummaryView,
+    AsyncRecentAuditLogView,
+)
 from .views import (
     CreatorViewSet,
     CreatorCredentialViewSet,
     MilestoneViewSet,
     AuditLogViewSet,
     AIDeliverableViewSet,
+    TombstoneViewSet,
+    StatusTransitionViewSet,
+    BatchViewSet,
     DashboardViewSet,
+    ProfilerViewSet,
 )
 
 app_name = 'studio_crm'
@@ -25,9 +38,32 @@ router.register(r'credentials', CreatorCredentialViewSet, basename='credential')
 router.register(r'milestones', MilestoneViewSet, basename='milestone')
 router.register(r'audit-logs', AuditLogViewSet, basename='auditlog')
 router.register(r'deliverables', AIDeliverableViewSet, basename='deliverable')
+router.register(r'tombstones', TombstoneViewSet, basename='tombstone')
+router.register(r'status-transitions', StatusTransitionViewSet, basename='statustransition')
+router.register(r'batch', BatchViewSet, basename='batch')
 router.register(r'dashboard', DashboardViewSet, basename='dashboard')
+router.register(r'profiler', ProfilerViewSet, basename='profiler')
+
+# Async read endpoints (served natively under ASGI, see async_views.py)
+async_urlpatterns = [
+    path('creators/', AsyncCreatorListView.as_view(), name='async-creator-list'),
+    path('creators/<uuid:pk>/', AsyncCreatorDetailView.as_view(), name='async-creator-detail'),
+    path('dashboard/', AsyncDashboardView.as_view(), name='async-dashboard-list'),
+    path('dashboard/health_summary/', AsyncHealthSummaryView.as_view(), name='async-dashboard-health-summary'),
+    path('dashboard/status_summary/', AsyncStatusSummaryView.as_view(), name='async-dashboard-status-summary'),
+    path('audit-logs/recent/', AsyncRecentAuditLogView.as_view(), name='async-auditlog-recent'),
+]
 
 urlpatterns = [
+    path('async/', include(async_urlpatterns)),
+]
+
+# Serve the async views on the canonical URLs too (writes fall back to the
+# sync viewsets). Enable when running under an ASGI server.
+if settings.ASYNC_READ_ENDPOINTS:
+    urlpatterns += async_urlpatterns
+
+urlpatterns += [
     path('', include(router.urls)),
 ]
 
@@ -67,6 +103,11 @@ AUDIT LOGS (Epic 0.4):
   GET    /api/crm/audit-logs/recent/                - Recent logs
   GET    /api/crm/audit-logs/by_creator/           - Logs for creator
 
+STATUS HISTORY (Story 2.2):
+  GET    /api/crm/status-transitions/               - List journey status changes
+  GET    /api/crm/status-transitions/funnel/        - Stage funnel of a cohort
+  GET    /api/crm/status-transitions/time_in_stage/ - Days spent per stage
+
 DELIVERABLES (Epic 3):
   GET    /api/crm/deliverables/                     - List deliverables
   POST   /api/crm/deliverables/                     - Create deliverable
@@ -76,6 +117,20 @@ DASHBOARD (Epic 0.3):
   GET    /api/crm/dashboard/                        - Dashboard stats
   GET    /api/crm/dashboard/health_summary/         - Health score distribution
   GET    /api/crm/dashboard/status_summary/         - Status distribution
+  GET    /api/crm/dashboard/health_trend/           - Daily health/status counts (?days=&group_by=)
+
+PROFILER (staff only, SAMPLING_PROFILER_ENABLED):
+  GET    /api/crm/profiler/                         - Running session, recent captures
+  POST   /api/crm/profiler/start/                   - Start sampling requests
+  POST   /api/crm/profiler/stop/                    - Stop and write flamegraphs
+
+ASYNC READS (served under ASGI, same payloads as above):
+  GET    /api/crm/async/creators/                   - List creators
+  GET    /api/crm/async/creators/{id}/              - Get creator detail
+  GET    /api/crm/async/dashboard/                  - Dashboard stats
+  GET    /api/crm/async/dashboard/health_summary/   - Health score distribution
+  GET    /api/crm/async/dashboard/status_summary/   - Status distribution
+  GET    /api/crm/async/audit-logs/recent/          - Recent logs
 
 Query Parameters:
   ?journey_status=ONBOARDING              - Filter by status
@@ -5,13 +5,26 @@ Epic 2: Project Lifecycle Visibility & Tracking
 API endpoints for frontend integration.
 """
 
-from rest_framework import viewsets, status, filters
+import json
+import statistics
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from rest_framework import mixins, viewsets, status, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import APIException, NotFound, ValidationError
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.viewsets import ViewSetMixin
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Count
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Case, Count, Exists, F, Max, OuterRef, Q, Subquery, Sum, Value, When, Window
+from django.db.models.functions import Lead
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve, reverse
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from .models import (
     Creator,
@@ -19,23 +32,216 @@ from .models import (
     Milestone,
     AuditLog,
     AIDeliverable,
+    CreatorStatsSnapshot,
+    HealthRollup,
+    StatusTransition,
+    Tombstone,
     JourneyStatus,
     HealthScore
 )
+from .db_routers import allow_replica_reads
+from .fast_serializers import FastSerializer
+from .health_rules import health_score_is_live
+from .health_simulation import HealthSimulation
+from .pagination import CreatorCursorPagination, SyncCursorPagination, TombstoneCursorPagination
+from .profiling import count_queries, enforce_query_budget, profile_serialization, profile_serializer
+from .response_cache import cache_response
+from . import sampling_profiler
+from .signals import get_current_request, set_current_request
 from .serializers import (
     CreatorListSerializer,
     CreatorDetailSerializer,
     CreatorCreateUpdateSerializer,
+    CreatorCoreSerializer,
     CreatorCredentialSerializer,
+    CredentialMetadataSerializer,
     MilestoneSerializer,
+    MilestoneScheduleSerializer,
     AuditLogSerializer,
     AIDeliverableSerializer,
+    BatchSerializer,
+    CreatorBatchGetSerializer,
+    DeliverableSummarySerializer,
     JourneyStatusUpdateSerializer,
     DashboardStatsSerializer,
+    HealthSimulationSerializer,
+    ProfilerSessionSerializer,
+    StatusTransitionSerializer,
+    TombstoneSerializer,
 )
 
 
-class CreatorViewSet(viewsets.ModelViewSet):
+def since_param(request, name):
+    """Aware datetime from the ISO 8601 query parameter `name`, or None"""
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    # An unencoded '+' in the UTC offset arrives as a space
+    try:
+        since = parse_datetime(value.strip().replace(' ', '+'))
+    except ValueError:
+        # Well formed but out of range, e.g. month 13
+        since = None
+    if since is None:
+        raise ValidationError({name: 'Expected an ISO 8601 datetime, e.g. 2024-01-31T00:00:00Z.'})
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def live_health(creators):
+    """
+    Story 2.3: With HEALTH_SCORE_SOURCE = 'live', rescore fetched Creator
+    instances with the health rules (in Python, no queries) so they agree
+    with the scores list endpoints compute in SQL. Returns `creators`.
+    """
+    if health_score_is_live():
+        for creator in creators:
+            creator.health_score = creator.calculate_health_score()
+    return creators
+
+
+class SyncExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = 'Deletions this old are no longer recorded; run a full sync.'
+    default_code = 'sync_expired'
+
+
+class ProfilerUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Profiler sessions need a cache shared by all workers.'
+    default_code = 'profiler_unavailable'
+
+
+class ReadReplicaMixin:
+    """
+    Serve the reads of read-only actions from a replica database
+    (see db_routers.ReplicaRouter). `replica_actions` lists the actions to
+    route, or '__all__' for a read-only viewset.
+    """
+
+    replica_actions = ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.route_reads(request)
+
+    def route_reads(self, request):
+        if self.replica_actions == '__all__' or self.action in self.replica_actions:
+            allow_replica_reads(request)
+
+
+class QueryBudgetMixin:
+    """
+    Declarative per-action query budgets
+    `query_budgets` maps each action to the most SQL queries one request may
+    issue, authentication included. Budgets must not depend on page size or
+    data volume; studio_crm/tests/test_query_budgets.py verifies this for
+    every action. At runtime settings.QUERY_BUDGET_MODE ('off', 'warn', 'raise')
+    controls enforcement.
+    """
+
+    query_budgets = {}
+
+    def dispatch(self, request, *args, **kwargs):
+        mode = getattr(settings, 'QUERY_BUDGET_MODE', 'off')
+        if mode == 'off':
+            return super().dispatch(request, *args, **kwargs)
+
+        with count_queries() as queries:
+            response = super().dispatch(request, *args, **kwargs)
+
+        enforce_query_budget(
+            f'{type(self).__name__}.{self.action} ({request.method} {request.path})',
+            len(queries),
+            self.query_budgets.get(self.action),
+            mode,
+        )
+        return response
+
+
+class SerializationProfilingMixin:
+    """
+    Count building the response data (serializer.data, read inside DRF's
+    list/retrieve/create/update) as serialization time of the request
+    profile, on top of rendering it
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        return profile_serializer(super().get_serializer(*args, **kwargs))
+
+
+class DeltaSyncMixin:
+    """
+    Incremental sync for the list action: ?updated_since=<ISO 8601> returns
+    only rows whose updated_at is at or after that time, oldest change first,
+    in SyncCursorPagination pages (follow `next`). Deletions are listed by
+    /api/crm/tombstones/.
+
+    A client keeps the largest updated_at it has received and passes it as
+    updated_since next time. Rows changed at exactly that instant are sent
+    again, so clients upsert by id. `sync_serializer_class`, if set,
+    replaces the list serializer for sync pages.
+    """
+
+    sync_serializer_class = None
+    updated_since = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.action == 'list':
+            self.updated_since = since_param(request, 'updated_since')
+            if self.updated_since is not None:
+                self._paginator = SyncCursorPagination()
+
+    def get_serializer_class(self):
+        if self.updated_since is not None and self.sync_serializer_class is not None:
+            return self.sync_serializer_class
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.updated_since is not None:
+            queryset = queryset.filter(updated_at__gte=self.updated_since)
+        return queryset
+
+
+class FastListMixin:
+    """
+    Serve read-only list actions through a compiled FastSerializer
+    (`.values()` rows instead of model instances, identical JSON).
+    `fast_actions` lists the actions to serve this way; custom actions call
+    fast_serialize() themselves.
+    """
+
+    fast_actions = ()
+
+    def get_fast_serializer(self):
+        return FastSerializer.for_serializer(self.get_serializer_class())
+
+    def fast_serialize(self, queryset):
+        with profile_serialization():
+            return self.get_fast_serializer().serialize(queryset)
+
+    def list(self, request, *args, **kwargs):
+        if self.action not in self.fast_actions:
+            return super().list(request, *args, **kwargs)
+        return self.fast_list_response(self.filter_queryset(self.get_queryset()))
+
+    def fast_list_response(self, queryset):
+        """`queryset` serialized like list(), paginated when pagination is on"""
+        fast_serializer = self.get_fast_serializer()
+        queryset = fast_serializer.values(queryset)
+
+        page = self.paginate_queryset(queryset)
+        with profile_serialization():
+            data = fast_serializer.serialize_rows(page if page is not None else queryset)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+
+class CreatorViewSet(QueryBudgetMixin, ReadReplicaMixin, SerializationProfilingMixin, DeltaSyncMixin, FastListMixin, viewsets.ModelViewSet):
     """
     ViewSet for Creator CRUD operations
 
@@ -53,7 +259,7 @@ class CreatorViewSet(viewsets.ModelViewSet):
     queryset = Creator.objects.all().select_related(
         'created_by',
         'last_updated_by'
-    ).prefetch_related('milestones', 'credentials')
+    )
 
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -82,12 +288,52 @@ class CreatorViewSet(viewsets.ModelViewSet):
     ]
     ordering = ['-last_status_change']  # Most recent first
 
+    replica_actions = ['list', 'urgent', 'by_status']
+    fast_actions = ['list', 'urgent', 'by_status']
+
+    # Writes include the audit log entry and a single-UPDATE
+    # CreatorStatsSnapshot upkeep (every bucket row exists). Update budgets
+    # are the worst case: a status or is_active change that moves the
+    # creator to another bucket and records a StatusTransition. Deletes
+    # record the tombstones and audit entries of cascaded rows in bulk
+    # (signals.CreatorCascade), so their cost does not depend on what the
+    # creator owns, up to Django's own cascade batches of 100 rows
+    query_budgets = {
+        'list': 3,
+        'retrieve': 4,
+        'create': 7,
+        'update': 8,
+        'partial_update': 7,
+        'destroy': 16,
+        'update_journey_status': 9,
+        'urgent': 2,
+        'by_status': 7,
+        'bundle': 6,
+        'batch_get': 2,
+    }
+
+    # Story 1.2: entries included in a profile bundle
+    bundle_audit_log_limit = 20
+    bundle_deliverable_limit = 5
+
+    @property
+    def paginator(self):
+        """
+        Story 1.1: ?pagination=cursor switches the list to keyset pages
+        (CreatorCursorPagination) for infinite scroll; page numbers otherwise
+        """
+        if not hasattr(self, '_paginator') and self.request.query_params.get('pagination') == 'cursor':
+            self._paginator = CreatorCursorPagination()
+        return super().paginator
+
     def get_serializer_class(self):
         """Use different serializers for list vs detail views"""
-        if self.action == 'list':
+        if self.action in ['list', 'urgent', 'by_status', 'batch_get']:
             return CreatorListSerializer
         elif self.action in ['create', 'update', 'partial_update']:
             return CreatorCreateUpdateSerializer
+        elif self.action == 'bundle':
+            return CreatorCoreSerializer
         return CreatorDetailSerializer
 
     def get_queryset(self):
@@ -97,6 +343,16 @@ class CreatorViewSet(viewsets.ModelViewSet):
         """
         queryset = super().get_queryset()
 
+        # List serializers read the denormalized counters; only the detail
+        # serializer nests milestones and credentials
+        if self.get_serializer_class() is CreatorDetailSerializer:
+            queryset = queryset.prefetch_related('milestones', 'credentials')
+
+        # Live health: list rows carry the score computed at query time, so
+        # filtering, ordering and pagination all use it
+        if health_score_is_live() and self.get_serializer_class() is CreatorListSerializer:
+            queryset = Creator.live_health_rows(queryset)
+
         # Filter for urgent projects (Red or Yellow health)
         if self.request.query_params.get('urgent_only') == 'true':
             queryset = queryset.filter(
@@ -109,6 +365,9 @@ class CreatorViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def get_object(self):
+        return live_health([super().get_object()])[0]
+
     @action(detail=True, methods=['post'])
     def update_journey_status(self, request, pk=None):
         """
@@ -116,6 +375,9 @@ class CreatorViewSet(viewsets.ModelViewSet):
         POST /api/crm/creators/{id}/update_journey_status/
 
         Body: {"journey_status": "BRAND_BUILDING", "notes": "optional"}
+
+        With ?bundle=true the response is the refreshed profile bundle (see
+        bundle()) instead of the creator detail
         """
         creator = self.get_object()
         serializer = JourneyStatusUpdateSerializer(
@@ -127,14 +389,75 @@ class CreatorViewSet(viewsets.ModelViewSet):
         if serializer.is_valid():
             serializer.save()
 
+            if request.query_params.get('bundle') == 'true':
+                return Response(self.bundle_data(creator), status=status.HTTP_200_OK)
+
             # Return updated creator
-            return Response(
-                CreatorDetailSerializer(creator).data,
-                status=status.HTTP_200_OK
-            )
+            with profile_serialization():
+                data = CreatorDetailSerializer(creator).data
+            return Response(data, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=True, methods=['get'])
+    def bundle(self, request, pk=None):
+        """
+        Story 1.2: View Creator Profile in one round trip
+        GET /api/crm/creators/{id}/bundle/
+
+        Returns: {
+            "creator": {...},               # profile fields
+            "milestones": [...],            # all, timeline order
+            "credentials": [...],           # metadata only, nothing decrypted
+            "recent_audit_logs": [...],     # latest bundle_audit_log_limit
+            "latest_deliverables": [...],   # latest bundle_deliverable_limit
+        }
+        """
+        return Response(self.bundle_data(self.get_object()))
+
+    def bundle_data(self, creator):
+        """
+        The profile bundle of `creator`: one query per section, whatever the
+        amount of data
+        """
+        def serialize(serializer_class, queryset):
+            return FastSerializer.for_serializer(serializer_class).serialize(queryset)
+
+        audit_logs = AuditLog.objects.filter(
+            target_model='Creator',
+            target_id=creator.pk,
+        ).select_related('user')[:self.bundle_audit_log_limit]
+        deliverables = creator.deliverables.all()[:self.bundle_deliverable_limit]
+
+        with profile_serialization():
+            return {
+                'creator': CreatorCoreSerializer(creator).data,
+                'milestones': serialize(MilestoneSerializer, creator.milestones.all()),
+                'credentials': serialize(CredentialMetadataSerializer, creator.credentials.all()),
+                'recent_audit_logs': serialize(AuditLogSerializer, audit_logs),
+                'latest_deliverables': serialize(DeliverableSummarySerializer, deliverables),
+            }
+
+    @action(detail=False, methods=['post'])
+    def batch_get(self, request):
+        """
+        Story 1.1: Many creators by id, in one query
+        POST /api/crm/creators/batch_get/
+
+        Body: {"ids": ["<uuid>", ...]}  (at most CreatorBatchGetSerializer.MAX_IDS)
+        Returns: {"results": [...], "missing": ["<uuid>", ...]}, results in
+        the order of `ids`, each creator once
+        """
+        serializer = CreatorBatchGetSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(str(pk) for pk in serializer.validated_data['ids']))
+
+        creators = {row['id']: row for row in self.fast_serialize(self.get_queryset().filter(pk__in=ids))}
+        return Response({
+            'results': [creators[pk] for pk in ids if pk in creators],
+            'missing': [pk for pk in ids if pk not in creators],
+        })
+
     @action(detail=False, methods=['get'])
     def urgent(self, request):
         """
@@ -148,8 +471,7 @@ class CreatorViewSet(viewsets.ModelViewSet):
             is_active=True
         ).order_by('health_score', 'last_status_change')
 
-        serializer = CreatorListSerializer(urgent_creators, many=True)
-        return Response(serializer.data)
+        return Response(self.fast_serialize(urgent_creators))
 
     @action(detail=False, methods=['get'])
     def by_status(self, request):
@@ -171,15 +493,12 @@ class CreatorViewSet(viewsets.ModelViewSet):
                 journey_status=status_key,
                 is_active=True
             )
-            creators_by_status[status_key] = CreatorListSerializer(
-                creators,
-                many=True
-            ).data
+            creators_by_status[status_key] = self.fast_serialize(creators)
 
         return Response(creators_by_status)
 
 
-class MilestoneViewSet(viewsets.ModelViewSet):
+class MilestoneViewSet(QueryBudgetMixin, ReadReplicaMixin, SerializationProfilingMixin, DeltaSyncMixin, FastListMixin, viewsets.ModelViewSet):
     """
     ViewSet for Milestone CRUD operations
     Story 2.1: View Project Timeline/Roadmap
@@ -199,6 +518,34 @@ class MilestoneViewSet(viewsets.ModelViewSet):
     ordering_fields = ['target_date', 'completed_date', 'created_at']
     ordering = ['target_date']
 
+    replica_actions = ['list', 'by_creator', 'overdue', 'upcoming']
+    fast_actions = ['list', 'by_creator', 'overdue', 'upcoming']
+    # Updates are budgeted for a move to another creator, which validates
+    # the new creator and moves the counters of both in one UPDATE
+    query_budgets = {
+        'list': 3,
+        'retrieve': 2,
+        'create': 5,
+        'update': 6,
+        'partial_update': 6,
+        'destroy': 5,
+        'by_creator': 2,
+        'mark_complete': 5,
+        # ?creator= costs one more query (the filter validates the creator)
+        'overdue': 4,
+        'upcoming': 4,
+    }
+
+    # Story 2.1: Weekly review window for upcoming milestones (days)
+    UPCOMING_DEFAULT_DAYS = 14
+    UPCOMING_MAX_DAYS = 90
+
+    def get_serializer_class(self):
+        """Overdue / upcoming reviews also show whose milestone it is"""
+        if self.action in ['overdue', 'upcoming']:
+            return MilestoneScheduleSerializer
+        return super().get_serializer_class()
+
     @action(detail=False, methods=['get'])
     def by_creator(self, request):
         """
@@ -214,9 +561,39 @@ class MilestoneViewSet(viewsets.ModelViewSet):
             )
 
         milestones = self.get_queryset().filter(creator_id=creator_id)
-        serializer = self.get_serializer(milestones, many=True)
+        return Response(self.fast_serialize(milestones))
 
-        return Response(serializer.data)
+    @action(detail=False, methods=['get'])
+    def overdue(self, request):
+        """
+        Open milestones past their target date, across all creators
+        GET /api/crm/milestones/overdue/
+        GET /api/crm/milestones/overdue/?creator={uuid}
+
+        Story 2.1: Weekly studio review (served from the open-milestone index)
+        """
+        return self.fast_list_response(self.filter_queryset(Milestone.overdue()))
+
+    @action(detail=False, methods=['get'])
+    def upcoming(self, request):
+        """
+        Open milestones due in the next `days` days (default 14, max 90)
+        GET /api/crm/milestones/upcoming/?days=7
+        GET /api/crm/milestones/upcoming/?creator={uuid}
+
+        Story 2.1: Weekly studio review (served from the open-milestone index)
+        """
+        try:
+            days = int(request.query_params.get('days', self.UPCOMING_DEFAULT_DAYS))
+        except ValueError:
+            days = -1
+        if not 0 <= days <= self.UPCOMING_MAX_DAYS:
+            return Response(
+                {'error': f'days must be a number from 0 to {self.UPCOMING_MAX_DAYS}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return self.fast_list_response(self.filter_queryset(Milestone.upcoming(days)))
 
     @action(detail=True, methods=['post'])
     def mark_complete(self, request, pk=None):
@@ -233,7 +610,7 @@ class MilestoneViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class CreatorCredentialViewSet(viewsets.ModelViewSet):
+class CreatorCredentialViewSet(QueryBudgetMixin, ReadReplicaMixin, SerializationProfilingMixin, DeltaSyncMixin, FastListMixin, viewsets.ModelViewSet):
     """
     ViewSet for CreatorCredential operations
     Story 1.4: Securely store login links
@@ -252,6 +629,21 @@ class CreatorCredentialViewSet(viewsets.ModelViewSet):
         'is_active': ['exact'],
     }
 
+    replica_actions = ['list']
+    # Also skips decrypting the write-only secrets of every listed credential
+    fast_actions = ['list']
+    # Sync pages carry metadata only; nothing encrypted is read
+    sync_serializer_class = CredentialMetadataSerializer
+    # Updates are budgeted for a move to another creator (see MilestoneViewSet)
+    query_budgets = {
+        'list': 3,
+        'retrieve': 2,
+        'create': 7,
+        'update': 8,
+        'partial_update': 8,
+        'destroy': 6,
+    }
+
     def get_queryset(self):
         """Filter credentials by creator if specified"""
         queryset = super().get_queryset()
@@ -263,7 +655,7 @@ class CreatorCredentialViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+class AuditLogViewSet(QueryBudgetMixin, ReadReplicaMixin, SerializationProfilingMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Read-only ViewSet for AuditLog
     Epic 0.4: System Audit Log
@@ -285,6 +677,15 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     ordering_fields = ['timestamp']
     ordering = ['-timestamp']  # Most recent first
 
+    replica_actions = '__all__'
+    fast_actions = ['list', 'recent', 'by_creator']
+    query_budgets = {
+        'list': 3,
+        'retrieve': 2,
+        'recent': 2,
+        'by_creator': 2,
+    }
+
     @action(detail=False, methods=['get'])
     def recent(self, request):
         """
@@ -292,8 +693,7 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
         GET /api/crm/audit-logs/recent/
         """
         recent_logs = self.get_queryset()[:50]
-        serializer = self.get_serializer(recent_logs, many=True)
-        return Response(serializer.data)
+        return Response(self.fast_serialize(recent_logs))
 
     @action(detail=False, methods=['get'])
     def by_creator(self, request):
@@ -314,17 +714,16 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
             target_id=creator_id
         )
 
-        serializer = self.get_serializer(logs, many=True)
-        return Response(serializer.data)
+        return Response(self.fast_serialize(logs))
 
 
-class AIDeliverableViewSet(viewsets.ModelViewSet):
+class AIDeliverableViewSet(QueryBudgetMixin, ReadReplicaMixin, SerializationProfilingMixin, DeltaSyncMixin, FastListMixin, viewsets.ModelViewSet):
     """
     ViewSet for AIDeliverable operations
     Epic 3: Automated Deliverable Generation
     """
 
-    queryset = AIDeliverable.objects.all().select_related('creator', 'created_by')
+    queryset = AIDeliverable.objects.all().select_related('creator__created_by', 'created_by')
     serializer_class = AIDeliverableSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -338,15 +737,284 @@ class AIDeliverableViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at']
     ordering = ['-created_at']
 
+    replica_actions = ['list']
+    fast_actions = ['list']
+    query_budgets = {
+        'list': 3,
+        'retrieve': 2,
+        'create': 3,
+        'update': 3,
+        'partial_update': 3,
+        'destroy': 4,
+    }
+
+
+class TombstoneViewSet(QueryBudgetMixin, ReadReplicaMixin, SerializationProfilingMixin, FastListMixin, mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Deletions for delta sync clients (see DeltaSyncMixin)
+    Epic 2: API layer - incremental sync
+
+    GET /api/crm/tombstones/?deleted_since=<ISO 8601>
+    GET /api/crm/tombstones/?deleted_since=<ISO 8601>&model_name=milestone
+
+    Oldest first, in SyncCursorPagination pages. Answers 410 when
+    deleted_since is older than TOMBSTONE_RETENTION_DAYS: deletions that
+    old may have been pruned, so the client must run a full sync.
+    """
+
+    queryset = Tombstone.objects.all()
+    serializer_class = TombstoneSerializer
+    pagination_class = TombstoneCursorPagination
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+
+    filterset_fields = {
+        'model_name': ['exact', 'in'],
+    }
+
+    replica_actions = ['list']
+    fast_actions = ['list']
+    query_budgets = {
+        'list': 2,
+    }
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        deleted_since = since_param(self.request, 'deleted_since')
+        if deleted_since is not None:
+            if deleted_since < Tombstone.horizon():
+                raise SyncExpired()
+            queryset = queryset.filter(deleted_at__gte=deleted_since)
+        return queryset
+
+
+class StatusTransitionViewSet(QueryBudgetMixin, ReadReplicaMixin, SerializationProfilingMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only ViewSet for journey status history
+    Story 2.2: Journey status tracking - cohort reviews
+
+    funnel and time_in_stage analyse a cohort of creators, selected with
+    ?created_after= / ?created_before= (ISO 8601, on Creator.created_at),
+    ?brand_niche= and ?is_active=
+    """
+
+    queryset = StatusTransition.objects.all()
+    serializer_class = StatusTransitionSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+
+    filterset_fields = {
+        'creator': ['exact'],
+        'from_status': ['exact'],
+        'to_status': ['exact', 'in'],
+        'transitioned_at': ['gte', 'lt'],
+    }
+
+    ordering_fields = ['transitioned_at']
+    ordering = ['transitioned_at']
+
+    # Stages in the order a creator normally moves through them
+    funnel_stages = [
+        JourneyStatus.ONBOARDING,
+        JourneyStatus.BRAND_BUILDING,
+        JourneyStatus.LAUNCH,
+        JourneyStatus.LIVE,
+    ]
+
+    replica_actions = '__all__'
+    fast_actions = ['list']
+    query_budgets = {
+        # ?creator= costs one more query (the filter validates the creator)
+        'list': 4,
+        'retrieve': 2,
+        'funnel': 2,
+        'time_in_stage': 2,
+    }
+
+    def cohort(self):
+        """Creators selected by the cohort query parameters"""
+        creators = Creator.objects.all()
+        created_after = since_param(self.request, 'created_after')
+        if created_after is not None:
+            creators = creators.filter(created_at__gte=created_after)
+        created_before = since_param(self.request, 'created_before')
+        if created_before is not None:
+            creators = creators.filter(created_at__lt=created_before)
+        if self.request.query_params.get('brand_niche'):
+            creators = creators.filter(brand_niche=self.request.query_params['brand_niche'])
+        if self.request.query_params.get('is_active') in ('true', 'false'):
+            creators = creators.filter(is_active=self.request.query_params['is_active'] == 'true')
+        return creators
+
+    @action(detail=False, methods=['get'])
+    def funnel(self, request):
+        """
+        Stage funnel of a cohort
+        GET /api/crm/status-transitions/funnel/
+
+        A creator has reached a stage if it ever entered that stage or a
+        later one in funnel_stages. Returns: {
+            "cohort_size": n,
+            "untracked": n,   # creators with no recorded history
+            "stages": [{"stage", "reached", "conversion"}, ...],
+        }
+        `conversion` is the share of the previous stage that got this far.
+        """
+        stage_rank = Case(
+            *[When(to_status=stage, then=Value(rank)) for rank, stage in enumerate(self.funnel_stages)],
+            default=None,
+        )
+        furthest = (
+            StatusTransition.objects.filter(creator=OuterRef('pk'))
+            .order_by()
+            .values('creator')
+            .annotate(furthest=Max(stage_rank))
+            .values('furthest')
+        )
+        # One grouped query: number of creators by furthest stage reached
+        rows = (
+            self.cohort()
+            .annotate(
+                furthest=Subquery(furthest),
+                tracked=Exists(StatusTransition.objects.filter(creator=OuterRef('pk'))),
+            )
+            .values('furthest', 'tracked')
+            .annotate(creators=Count('pk'))
+            .order_by()
+        )
+        furthest_counts = [0] * len(self.funnel_stages)
+        cohort_size = untracked = 0
+        for row in rows:
+            cohort_size += row['creators']
+            if not row['tracked']:
+                untracked += row['creators']
+            elif row['furthest'] is not None:
+                furthest_counts[row['furthest']] += row['creators']
+
+        stages = []
+        previous = None
+        for rank, stage in enumerate(self.funnel_stages):
+            reached = sum(furthest_counts[rank:])
+            stages.append({
+                'stage': stage,
+                'reached': reached,
+                'conversion': round(reached / previous, 4) if previous else None,
+            })
+            previous = reached
+        return Response({'cohort_size': cohort_size, 'untracked': untracked, 'stages': stages})
+
+    @action(detail=False, methods=['get'])
+    def time_in_stage(self, request):
+        """
+        Days spent in each journey status by a cohort
+        GET /api/crm/status-transitions/time_in_stage/
+
+        Each stay runs from a transition to the creator's next one (SQL
+        LEAD() window over the creator's history). Returns per status:
+        completed stays (count, mean, median and 90th percentile days) and
+        creators currently in it (count, median days so far).
+        """
+        now = timezone.now()
+        stays = (
+            StatusTransition.objects.filter(creator__in=self.cohort())
+            .annotate(left_at=Window(
+                Lead('transitioned_at'),
+                partition_by=[F('creator_id')],
+                order_by=[F('transitioned_at').asc(), F('pk').asc()],
+            ))
+            .values_list('to_status', 'transitioned_at', 'left_at')
+        )
+        completed = {stage: [] for stage in JourneyStatus.values}
+        current = {stage: [] for stage in JourneyStatus.values}
+        for stage, entered_at, left_at in stays.iterator(chunk_size=2000):
+            if left_at is None:
+                current[stage].append((now - entered_at).total_seconds() / 86400)
+            else:
+                completed[stage].append((left_at - entered_at).total_seconds() / 86400)
+
+        def days(value):
+            return round(value, 2) if value is not None else None
+
+        return Response([
+            {
+                'stage': stage,
+                'completed': len(completed[stage]),
+                'mean_days': days(statistics.fmean(completed[stage])) if completed[stage] else None,
+                'median_days': days(statistics.median(completed[stage])) if completed[stage] else None,
+                'p90_days': days(
+                    statistics.quantiles(completed[stage], n=10, method='inclusive')[-1]
+                    if len(completed[stage]) > 1 else (completed[stage] or [None])[0]
+                ),
+                'current': len(current[stage]),
+                'current_median_days': days(statistics.median(current[stage])) if current[stage] else None,
+            }
+            for stage in JourneyStatus.values
+        ])
+
+
+def health_summary(counts):
+    """Story 2.3: Health score distribution from dashboard counters"""
+    return {
+        'red': counts['red_health_count'],
+        'yellow': counts['yellow_health_count'],
+        'green': counts['green_health_count'],
+    }
+
 
-class DashboardViewSet(viewsets.ViewSet):
+def status_summary(counts):
+    """Story 2.2: Journey status distribution from dashboard counters"""
+    return {
+        status_key: counts[f'{status_key.lower()}_count']
+        for status_key in JourneyStatus.values
+    }
+
+
+def dashboard_creator_lists():
+    """
+    Story 2.4: Creator lists shown on the dashboard
+    Returns (recent updates, urgent projects) querysets.
+    """
+    creators = Creator.objects.select_related('created_by')
+
+    # Recent updates (last 5 updated)
+    recent_updates = creators.order_by('-updated_at')[:5]
+
+    # Urgent projects (Red or Yellow health, active only). Live health
+    # selects them by the score computed in SQL; pass the fetched instances
+    # through live_health() so they show the same score
+    health_score = 'health_score'
+    if health_score_is_live():
+        creators = creators.alias(live_health_score=Creator.health_score_expression())
+        health_score = 'live_health_score'
+    urgent_projects = creators.filter(
+        **{f'{health_score}__in': [HealthScore.RED, HealthScore.YELLOW]},
+        is_active=True
+    ).order_by(health_score, 'last_status_change')[:10]
+
+    return recent_updates, urgent_projects
+
+
+class DashboardViewSet(QueryBudgetMixin, ReadReplicaMixin, viewsets.ViewSet):
     """
     ViewSet for Dashboard statistics
     Epic 0.3: View Dashboard with key metrics
     """
 
     permission_classes = [IsAuthenticated]
+    replica_actions = '__all__'
+    query_budgets = {
+        'list': 4,
+        'health_summary': 2,
+        'status_summary': 2,
+        'health_simulation': 2,
+        'health_trend': 2,
+    }
 
+    # Story 2.3: Health trend window (days)
+    TREND_DEFAULT_DAYS = 30
+    TREND_MAX_DAYS = 365
+
+    @cache_response('dashboard')
     def list(self, request):
         """
         GET /api/crm/dashboard/
@@ -359,108 +1027,270 @@ class DashboardViewSet(viewsets.ViewSet):
         - Urgent projects (Red/Yellow health)
         """
 
-        # Total counts
-        all_creators = Creator.objects.all()
-        total_creators = all_creators.count()
-        active_creators = all_creators.filter(is_active=True).count()
-
-        # Journey status counts
-        onboarding_count = all_creators.filter(
-            journey_status=JourneyStatus.ONBOARDING
-        ).count()
-        brand_building_count = all_creators.filter(
-            journey_status=JourneyStatus.BRAND_BUILDING
-        ).count()
-        launch_count = all_creators.filter(
-            journey_status=JourneyStatus.LAUNCH
-        ).count()
-        live_count = all_creators.filter(
-            journey_status=JourneyStatus.LIVE
-        ).count()
-        paused_count = all_creators.filter(
-            journey_status=JourneyStatus.PAUSED
-        ).count()
-        closed_count = all_creators.filter(
-            journey_status=JourneyStatus.CLOSED
-        ).count()
-
-        # Health score counts (Story 2.3, 2.4)
-        red_health_count = all_creators.filter(
-            health_score=HealthScore.RED
-        ).count()
-        yellow_health_count = all_creators.filter(
-            health_score=HealthScore.YELLOW
-        ).count()
-        green_health_count = all_creators.filter(
-            health_score=HealthScore.GREEN
-        ).count()
-
-        # Recent updates (last 5 updated)
-        recent_updates = all_creators.order_by('-updated_at')[:5]
-
-        # Urgent projects (Red or Yellow health, active only)
-        urgent_projects = all_creators.filter(
-            health_score__in=[HealthScore.RED, HealthScore.YELLOW],
-            is_active=True
-        ).order_by('health_score', 'last_status_change')[:10]
+        # Total, journey status and health score counts (Story 2.3, 2.4),
+        # read from the materialized CreatorStatsSnapshot (grouped from
+        # Creator when health is computed live)
+        counts = CreatorStatsSnapshot.dashboard_counts()
+
+        recent_updates, urgent_projects = dashboard_creator_lists()
 
         # Serialize data
         stats = {
-            'total_creators': total_creators,
-            'active_creators': active_creators,
-            'onboarding_count': onboarding_count,
-            'brand_building_count': brand_building_count,
-            'launch_count': launch_count,
-            'live_count': live_count,
-            'paused_count': paused_count,
-            'closed_count': closed_count,
-            'red_health_count': red_health_count,
-            'yellow_health_count': yellow_health_count,
-            'green_health_count': green_health_count,
-            'recent_updates': CreatorListSerializer(recent_updates, many=True).data,
-            'urgent_projects': CreatorListSerializer(urgent_projects, many=True).data,
+            **counts,
+            'recent_updates': live_health(list(recent_updates)),
+            'urgent_projects': live_health(list(urgent_projects)),
         }
 
-        serializer = DashboardStatsSerializer(stats)
-        return Response(serializer.data)
+        with profile_serialization():
+            data = DashboardStatsSerializer(stats).data
+        return Response(data)
 
     @action(detail=False, methods=['get'])
+    @cache_response('dashboard')
     def health_summary(self, request):
         """
         GET /api/crm/dashboard/health_summary/
 
         Returns health score distribution
         """
-        return Response({
-            'red': Creator.objects.filter(health_score=HealthScore.RED).count(),
-            'yellow': Creator.objects.filter(health_score=HealthScore.YELLOW).count(),
-            'green': Creator.objects.filter(health_score=HealthScore.GREEN).count(),
-        })
+        return Response(health_summary(CreatorStatsSnapshot.dashboard_counts()))
 
     @action(detail=False, methods=['get'])
+    @cache_response('dashboard')
     def status_summary(self, request):
         """
         GET /api/crm/dashboard/status_summary/
 
         Returns journey status distribution
         """
+        return Response(status_summary(CreatorStatsSnapshot.dashboard_counts()))
+
+    @action(detail=False, methods=['get'])
+    @cache_response('dashboard')
+    def health_trend(self, request):
+        """
+        Story 2.3: Daily creator counts for the health trend chart
+        GET /api/crm/dashboard/health_trend/?days=90&group_by=status&active_only=true
+
+        days: 1 to 365 (default 30); group_by: health (default) or status.
+        Reads only the HealthRollup rows written by `manage.py
+        snapshot_health_history`; days not recorded are missing.
+        Returns: {
+            "series": ["GREEN", "YELLOW", "RED"],
+            "points": [{"date": "2024-01-31", "GREEN": n, "YELLOW": n, "RED": n,
+                        "entered": {"GREEN": n, ...}}]
+        }
+        where "entered" counts creators whose health changed that day into the
+        series (null when the day before was not recorded).
+        """
+        try:
+            days = int(request.query_params.get('days', self.TREND_DEFAULT_DAYS))
+        except ValueError:
+            days = 0
+        if not 1 <= days <= self.TREND_MAX_DAYS:
+            return Response(
+                {'error': f'days must be a number from 1 to {self.TREND_MAX_DAYS}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        group_by = request.query_params.get('group_by', 'health')
+        if group_by not in ('health', 'status'):
+            return Response(
+                {'error': 'group_by must be health or status'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        key, series = (
+            ('health_score', HealthScore.values) if group_by == 'health'
+            else ('journey_status', JourneyStatus.values)
+        )
+        rollups = HealthRollup.objects.filter(
+            date__gt=timezone.now().date() - timedelta(days=days)
+        )
+        if request.query_params.get('active_only') == 'true':
+            rollups = rollups.filter(is_active=True)
+        rows = (
+            rollups.order_by('date')
+            .values_list('date', key)
+            .annotate(count=Sum('creator_count'), entered=Sum('entered_count'))
+        )
+
+        points = {}
+        for day, name, count, entered in rows:
+            point = points.setdefault(day, {
+                'date': day,
+                **{name: 0 for name in series},
+                'entered': {name: (0 if entered is not None else None) for name in series},
+            })
+            point[name] = count
+            point['entered'][name] = entered
+        return Response({'series': series, 'points': list(points.values())})
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAdminUser])
+    def health_simulation(self, request):
+        """
+        Story 2.3: What-if for health rule changes (staff only)
+        POST /api/crm/dashboard/health_simulation/
+
+        Body: {"grid": {"0.idle_days_over": [10, 14, 21]}, "rules": [...], "examples": 3}
+
+        Scores every creator under the base rules and each grid combination.
+        Returns: {
+            "baseline": {"GREEN": n, "YELLOW": n, "RED": n},
+            "results": [{"parameters", "distribution", "change", "changed",
+                         "transitions": [{"from", "to", "count", "examples"}]}],
+            ...
+        }
+        """
+        serializer = HealthSimulationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(HealthSimulation.load().run(**serializer.validated_data))
+
+
+class ProfilerViewSet(QueryBudgetMixin, viewsets.ViewSet):
+    """
+    Sampling profiler capture sessions (see sampling_profiler.py)
+    Staff only; needs SAMPLING_PROFILER_ENABLED and a shared cache
+    """
+
+    permission_classes = [IsAdminUser]
+    query_budgets = {
+        'list': 1,
+        'start': 1,
+        'stop': 1,
+    }
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if not getattr(settings, 'SAMPLING_PROFILER_ENABLED', False):
+            raise NotFound('Sampling profiler is disabled (SAMPLING_PROFILER_ENABLED).')
+
+    def list(self, request):
+        """
+        GET /api/crm/profiler/
+
+        Returns the running session and the files of recent sessions
+        """
         return Response({
-            'ONBOARDING': Creator.objects.filter(
-                journey_status=JourneyStatus.ONBOARDING
-            ).count(),
-            'BRAND_BUILDING': Creator.objects.filter(
-                journey_status=JourneyStatus.BRAND_BUILDING
-            ).count(),
-            'LAUNCH': Creator.objects.filter(
-                journey_status=JourneyStatus.LAUNCH
-            ).count(),
-            'LIVE': Creator.objects.filter(
-                journey_status=JourneyStatus.LIVE
-            ).count(),
-            'PAUSED': Creator.objects.filter(
-                journey_status=JourneyStatus.PAUSED
-            ).count(),
-            'CLOSED': Creator.objects.filter(
-                journey_status=JourneyStatus.CLOSED
-            ).count(),
+            'session': sampling_profiler.get_session(),
+            'captures': sampling_profiler.list_captures(),
         })
+
+    @action(detail=False, methods=['post'])
+    def start(self, request):
+        """
+        POST /api/crm/profiler/start/
+
+        Body: {"sample_rate": 0.1, "url_names": ["creator-by-status"],
+               "duration": 300, "interval_ms": 10}
+        """
+        serializer = ProfilerSessionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            session = sampling_profiler.start_session(**serializer.validated_data)
+        except ImproperlyConfigured as exc:
+            raise ProfilerUnavailable(str(exc))
+        return Response(session, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['post'])
+    def stop(self, request):
+        """
+        POST /api/crm/profiler/stop/
+
+        Workers write their profiles on their next request
+        """
+        try:
+            return Response({'session': sampling_profiler.stop_session()})
+        except ImproperlyConfigured as exc:
+            raise ProfilerUnavailable(str(exc))
+
+
+class BatchViewSet(QueryBudgetMixin, viewsets.ViewSet):
+    """
+    Several read-only API calls in one HTTP request
+    Epic 2: API layer - fewer round trips for remote staff and scripts
+
+    POST /api/crm/batch/
+    Body: {"requests": [{"path": "creators/urgent/"},
+                        {"path": "milestones/upcoming/?days=7"}]}
+    Returns: {"responses": [{"path": ..., "status": 200, "body": ...}, ...]},
+    in request order
+
+    Paths are relative to /api/crm/ (or absolute) and may carry a query
+    string; only GETs of the studio_crm viewsets are served. Sub-requests run
+    one after another in this request, with the caller's authentication
+    (checked once, for the batch) and the same database connection. Each
+    keeps its own permissions, replica routing and query budget, and a
+    failing sub-request only reports its own status.
+    """
+
+    permission_classes = [IsAuthenticated]
+    # Whatever the sub-requests issue, plus authentication
+    query_budgets = {
+        'create': None,
+    }
+
+    def create(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        outer = get_current_request()
+        try:
+            responses = [
+                self.dispatch_sub_request(request, sub_request['path'])
+                for sub_request in serializer.validated_data['requests']
+            ]
+        finally:
+            set_current_request(outer)
+        return Response({'responses': responses})
+
+    def dispatch_sub_request(self, request, path):
+        """{"path", "status", "body"} of one GET sub-request"""
+        url = urlsplit(path)
+        api_root = reverse('studio_crm:api-root')
+        full_path = url.path if url.path.startswith('/') else api_root + url.path
+
+        try:
+            match = resolve(full_path)
+        except Resolver404:
+            match = None
+        view_class = getattr(match and match.func, 'cls', None)
+        if (
+            match is None
+            or 'studio_crm' not in match.namespaces
+            or not (isinstance(view_class, type) and issubclass(view_class, ViewSetMixin))
+            or issubclass(view_class, BatchViewSet)
+        ):
+            return {'path': path, 'status': status.HTTP_404_NOT_FOUND, 'body': {'detail': 'Not found.'}}
+
+        sub_request = self.build_sub_request(request, full_path, url.query)
+        # Audit logging and replica routing read the current request
+        set_current_request(sub_request)
+        response = match.func(sub_request, *match.args, **match.kwargs)
+
+        if isinstance(response, Response):
+            body = response.data
+        else:
+            # Served from the response cache: already rendered JSON
+            body = json.loads(response.content) if response.content else None
+        return {'path': path, 'status': response.status_code, 'body': body}
+
+    def build_sub_request(self, request, path, query_string):
+        """A GET of `path` by the batch's (already authenticated) caller"""
+        http_request = request._request
+        sub_request = HttpRequest()
+        sub_request.method = 'GET'
+        sub_request.path = sub_request.path_info = path
+        sub_request.GET = QueryDict(query_string)
+        sub_request.META = {
+            **http_request.META,
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': path,
+            'QUERY_STRING': query_string,
+            'HTTP_ACCEPT': 'application/json',
+            'CONTENT_LENGTH': '0',
+        }
+        sub_request.user = request.user
+        # DRF reuses these instead of authenticating again
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+        return sub_request
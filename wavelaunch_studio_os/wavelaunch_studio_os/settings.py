@@ -5,6 +5,7 @@ Security-first configuration for single-tenant, internal-only application.
 Epic 0: System Foundation & Access
 """
 
+import json
 import os
 from pathlib import Path
 
@@ -51,7 +52,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'studio_crm.sampling_profiler.SamplingProfilerMiddleware',  # Flamegraph capture (opt-in)
+    'studio_crm.metrics.MetricsMiddleware',  # Prometheus request metrics (/metrics)
     'django.middleware.security.SecurityMiddleware',
+    'studio_crm.compression.CompressionMiddleware',  # gzip / brotli responses
+    'studio_crm.profiling.QueryProfilingMiddleware',  # Query count / SQL time per request
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -82,20 +87,152 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'wavelaunch_studio_os.wsgi.application'
+ASGI_APPLICATION = 'wavelaunch_studio_os.asgi.application'
+
+# Serve the async read endpoints (studio_crm/async_views.py) on the canonical
+# API URLs as well as under /api/crm/async/. Only worth enabling under ASGI.
+ASYNC_READ_ENDPOINTS = get_env('ASYNC_READ_ENDPOINTS', default='False', cast=bool)
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
-DATABASES = {
-    'default': {
+#
+# Connections are persistent (kept CONN_MAX_AGE seconds, 0 = close after each
+# request) and health-checked before reuse, so small API calls don't pay the
+# Postgres connection setup cost.
+#
+# Set DATABASE_POOLER=True when connecting through an external pooler such as
+# PgBouncer in transaction mode: server-side cursors are disabled and no
+# per-session settings are sent, so any server connection can serve any
+# transaction. The role's timezone must then be UTC on the server
+# (ALTER ROLE ... SET timezone TO 'UTC'), as in the README setup.
+DATABASE_POOLER = get_env('DATABASE_POOLER', default='False', cast=bool)
+
+
+def database_config(prefix='DATABASE', read_only=False):
+    """
+    Build a DATABASES entry from {prefix}_NAME/_USER/_PASSWORD/_HOST/_PORT,
+    falling back to the primary DATABASE_* values for anything unset.
+    """
+    def env(name, default=''):
+        return get_env(f'{prefix}_{name}', default=get_env(f'DATABASE_{name}', default=default))
+
+    options = {
+        'connect_timeout': int(env('CONNECT_TIMEOUT', default='5')),
+    }
+    if read_only and not DATABASE_POOLER:
+        # Startup parameters are rejected by transaction-mode poolers
+        options['options'] = '-c default_transaction_read_only=on'
+
+    return {
         'ENGINE': 'django.db.backends.postgresql',
-        'NAME': get_env('DATABASE_NAME', default='wavelaunch_studio_os'),
-        'USER': get_env('DATABASE_USER', default='postgres'),
-        'PASSWORD': get_env('DATABASE_PASSWORD', default=''),
-        'HOST': get_env('DATABASE_HOST', default='localhost'),
-        'PORT': get_env('DATABASE_PORT', default='5432'),
+        'NAME': env('NAME', default='wavelaunch_studio_os'),
+        'USER': env('USER', default='postgres'),
+        'PASSWORD': env('PASSWORD'),
+        'HOST': env('HOST', default='localhost'),
+        'PORT': env('PORT', default='5432'),
+        'CONN_MAX_AGE': int(env('CONN_MAX_AGE', default='60')),
+        'CONN_HEALTH_CHECKS': get_env('DATABASE_CONN_HEALTH_CHECKS', default='True', cast=bool),
+        'DISABLE_SERVER_SIDE_CURSORS': DATABASE_POOLER,
+        'OPTIONS': options,
     }
+
+
+DATABASES = {
+    'default': database_config(),
+    # Read-only alias for reporting queries. Defaults to the primary server;
+    # point DATABASE_READONLY_* at a replica (or a read-only pool) to offload it.
+    'readonly': {
+        **database_config('DATABASE_READONLY', read_only=True),
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+
+# Shared cache: read-your-writes pins (db_routers.py), profiler sessions,
+# the response cache. The default LocMemCache is per process, which is only
+# correct with a single worker; with several, use a shared backend, e.g.
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache and
+# CACHE_LOCATION=redis://localhost:6379/1 (needs the `redis` package).
+CACHES = {
+    'default': {
+        'BACKEND': get_env('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': get_env('CACHE_LOCATION', default=''),
+    },
 }
 
+# Read replicas (studio_crm/db_routers.py): reads of read-only endpoints go to
+# a replica that is within REPLICA_MAX_LAG_SECONDS of the primary; a user who
+# writes is pinned to the primary for REPLICA_STICKY_SECONDS. Replicas on
+# another server need a shared CACHES backend (checked at startup).
+DATABASE_ROUTERS = ['studio_crm.db_routers.ReplicaRouter']
+DATABASE_REPLICAS = [
+    alias for alias in get_env('DATABASE_REPLICAS', default='readonly').split(',') if alias
+]
+REPLICA_MAX_LAG_SECONDS = get_env('REPLICA_MAX_LAG_SECONDS', default='5', cast=float)
+REPLICA_LAG_CHECK_INTERVAL = get_env('REPLICA_LAG_CHECK_INTERVAL', default='5', cast=float)
+REPLICA_STICKY_SECONDS = get_env('REPLICA_STICKY_SECONDS', default='10', cast=int)
+
+# Request profiling (studio_crm/profiling.py): query count, SQL time, N+1
+# suspects and serialization time per request, logged on studio_crm.profiling.
+# Profile every request in development, a sample in production.
+QUERY_PROFILING_SAMPLE_RATE = get_env(
+    'QUERY_PROFILING_SAMPLE_RATE', default='1.0' if DEBUG else '0.01', cast=float
+)
+QUERY_PROFILING_SERVER_TIMING = get_env('QUERY_PROFILING_SERVER_TIMING', default=str(DEBUG), cast=bool)
+QUERY_PROFILING_DUPLICATE_THRESHOLD = get_env('QUERY_PROFILING_DUPLICATE_THRESHOLD', default='3', cast=int)
+
+# Slow query log (studio_crm/slow_queries.py): statements slower than this
+# are logged on studio_crm.slow_queries and kept, with their EXPLAIN plan on
+# PostgreSQL, in Admin > Slow Queries (stored after the response is sent;
+# trimmed to the newest SLOW_QUERY_BUFFER_SIZE every minute).
+# 0 disables.
+SLOW_QUERY_THRESHOLD_MS = get_env('SLOW_QUERY_THRESHOLD_MS', default='200', cast=float)
+SLOW_QUERY_BUFFER_SIZE = get_env('SLOW_QUERY_BUFFER_SIZE', default='500', cast=int)
+
+# Per-action query budgets (QueryBudgetMixin in studio_crm/views.py):
+# 'off', 'warn' (log on studio_crm.profiling) or 'raise'. Always checked by
+# studio_crm/tests/test_query_budgets.py.
+QUERY_BUDGET_MODE = get_env('QUERY_BUDGET_MODE', default='warn' if DEBUG else 'off')
+
+# Prometheus metrics (studio_crm/metrics.py) at /metrics: scrapers send
+# "Authorization: Bearer <METRICS_TOKEN>"; staff users can also view them.
+# Under gunicorn also set PROMETHEUS_MULTIPROC_DIR (read by prometheus_client).
+METRICS_TOKEN = get_env('METRICS_TOKEN', default='')
+
+# Sampling profiler (studio_crm/sampling_profiler.py): staff start/stop
+# capture sessions at /api/crm/profiler/; collapsed-stack and speedscope files
+# are written per viewset action to SAMPLING_PROFILER_OUTPUT_DIR. Sessions
+# live in the cache, so they need a shared CACHE_BACKEND.
+SAMPLING_PROFILER_ENABLED = get_env('SAMPLING_PROFILER_ENABLED', default='False', cast=bool)
+SAMPLING_PROFILER_OUTPUT_DIR = Path(get_env('SAMPLING_PROFILER_OUTPUT_DIR', default=str(BASE_DIR / 'profiles')))
+SAMPLING_PROFILER_FLUSH_INTERVAL = get_env('SAMPLING_PROFILER_FLUSH_INTERVAL', default='30', cast=int)
+
+# Response compression (studio_crm/compression.py): gzip, plus brotli when the
+# `brotli` package is installed. Smaller responses are sent uncompressed.
+COMPRESSION_MIN_SIZE = get_env('COMPRESSION_MIN_SIZE', default='1024', cast=int)
+COMPRESSION_BROTLI_QUALITY = get_env('COMPRESSION_BROTLI_QUALITY', default='4', cast=int)
+
+# Response cache (studio_crm/response_cache.py): dashboard responses, stored
+# rendered and pre-compressed. Seconds; 0 disables. Writes invalidate it.
+RESPONSE_CACHE_TIMEOUT = get_env('RESPONSE_CACHE_TIMEOUT', default='30', cast=int)
+
+# Delta sync (?updated_since=): deletion tombstones are kept this many days
+# (pruned by `manage.py prune_tombstones`); clients that last synced earlier
+# get 410 from /api/crm/tombstones/ and must run a full sync.
+TOMBSTONE_RETENTION_DAYS = get_env('TOMBSTONE_RETENTION_DAYS', default='90', cast=int)
+
+# Story 2.3: Creator health rules as a JSON list (see studio_crm/health_rules.py);
+# unset keeps the built-in defaults. HEALTH_SCORE_SOURCE 'stored' reads the
+# health_score column (rewritten on save and by `manage.py
+# refresh_overdue_milestones`); 'live' computes it in SQL at query time, so a
+# rule change applies without rewriting any rows.
+HEALTH_RULES = get_env('HEALTH_RULES', default=None, cast=json.loads)
+HEALTH_SCORE_SOURCE = get_env('HEALTH_SCORE_SOURCE', default='stored')
+
+# Story 2.3: Days of per-creator health history (HealthHistory) kept by
+# `manage.py snapshot_health_history`; the daily rollups behind the trend
+# chart (HealthRollup) are kept indefinitely.
+HEALTH_HISTORY_RETENTION_DAYS = get_env('HEALTH_HISTORY_RETENTION_DAYS', default='400', cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -135,10 +272,31 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # orjson-backed JSON (studio_crm/renderers.py); same values as DRF's
+    # JSONRenderer, falls back to it when orjson is not installed
+    'DEFAULT_RENDERER_CLASSES': [
+        'studio_crm.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'studio_crm.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # Page numbers with estimated counts on large tables (count_approximate)
+    'DEFAULT_PAGINATION_CLASS': 'studio_crm.pagination.EstimatedCountPagination',
     'PAGE_SIZE': 50,
 }
 
+# Counts of large querysets (studio_crm/pagination.py, admin changelists):
+# above this many rows the count is PostgreSQL's planner estimate instead of
+# an exact COUNT(*) (0 always counts exactly).
+ESTIMATED_COUNT_THRESHOLD = get_env('ESTIMATED_COUNT_THRESHOLD', default='10000', cast=int)
+
+# Seconds the admin caches the values offered by list filters over
+# free-text columns (e.g. brand niche, audit action type)
+ADMIN_FACET_CACHE_TIMEOUT = get_env('ADMIN_FACET_CACHE_TIMEOUT', default='600', cast=int)
+
 # Field Encryption (Story 1.4 - Secure credential storage)
 FIELD_ENCRYPTION_KEY = get_env('FIELD_ENCRYPTION_KEY', default='')
 
@@ -6,9 +6,12 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from studio_crm.metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/crm/', include('studio_crm.urls')),
+    path('metrics', metrics_view, name='metrics'),  # Prometheus scrape endpoint
 ]
 
 # Serve media files in development